@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Compile UI Script for WIZARD-2.1
+
+This script compiles the Qt Designer .ui file into a Python module with pyuic6
+so the main window does not have to parse the XML at every startup.
+Re-run it whenever ui/main_window.ui is changed.
+"""
+
+import io
+import sys
+from pathlib import Path
+
+from PyQt6.uic import compileUi
+
+
+def compile_ui() -> int:
+    """
+    Compile ui/main_window.ui into src/views/ui_main_window.py.
+
+    Returns:
+        int: Exit code
+    """
+    # Get the project root directory
+    project_root = Path(__file__).parent.parent
+
+    ui_file = project_root / "ui" / "main_window.ui"
+    output_file = project_root / "src" / "views" / "ui_main_window.py"
+
+    if not ui_file.exists():
+        print(f"❌ UI file not found: {ui_file}")
+        return 1
+
+    # Name the source relative to the project root in the generated header
+    ui_source = io.StringIO(ui_file.read_text(encoding="utf-8"))
+    ui_source.name = ui_file.relative_to(project_root).as_posix()
+
+    with open(output_file, "w", encoding="utf-8") as py_file:
+        compileUi(ui_source, py_file)
+
+    print(f"✅ Compiled {ui_file.name} -> {output_file.relative_to(project_root)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(compile_ui())
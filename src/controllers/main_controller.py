@@ -103,6 +103,9 @@ class MainController(QObject):
         self.tob_data_model: Optional[TOBDataModel] = None
         self.project_model = ProjectModel(name="Untitled Project")
 
+        # Reused payload for X-axis unit changes; receivers copy it via dict.update
+        self._x_axis_settings: Dict[str, Any] = {}
+
         # Initialize auto-save
         self._setup_auto_save()
 
@@ -594,6 +597,19 @@ class MainController(QObject):
                 e, self.main_window, "Axis Settings Update Error"
             )
 
+    def apply_x_axis_change(self, axis_type: str) -> None:
+        """
+        Apply a new X-axis time unit and refresh the plot once.
+
+        The view refreshes its axis limit fields afterwards through
+        AxisUIService.handle_x_axis_unit_changed.
+
+        Args:
+            axis_type: Time unit ("Seconds", "Minutes", "Hours")
+        """
+        self._x_axis_settings["x_axis_type"] = axis_type
+        self.update_axis_settings(self._x_axis_settings)
+
     def set_primary_sensor(self, sensor_name: str):
         """
         Set the primary sensor for the main plot.
@@ -1094,10 +1110,8 @@ class MainController(QObject):
                 for tob_file in tob_files[3:]:
                     # Calculate memory usage of this file
                     file_memory = 0.0
-                    if tob_file.tob_data and tob_file.tob_data.data is not None:
-                        file_memory = tob_file.tob_data.data.memory_usage(
-                            deep=True
-                        ).sum() / (1024 * 1024)
+                    if tob_file.tob_data:
+                        file_memory = tob_file.tob_data.get_memory_mb()
 
                     # Remove the file
                     if self.project_model.remove_tob_file(tob_file.file_name):
@@ -1591,12 +1605,9 @@ class MainController(QObject):
             total_tob_memory = 0.0
 
             for tob_file in self.project_model.tob_files:
-                if tob_file.tob_data and tob_file.tob_data.data is not None:
-                    # Calculate memory usage of this TOB file
-                    file_memory = tob_file.tob_data.data.memory_usage(
-                        deep=True
-                    ).sum() / (1024 * 1024)
-                    total_tob_memory += file_memory
+                if tob_file.tob_data:
+                    # Memory usage of this TOB file (measured once per file)
+                    total_tob_memory += tob_file.tob_data.get_memory_mb()
 
             # Update memory monitor
             self.memory_monitor.update_tob_memory_usage(total_tob_memory)
@@ -1856,9 +1867,7 @@ class MainController(QObject):
             )
 
             # Check memory usage before loading
-            memory_mb = tob_file.tob_data.data.memory_usage(deep=True).sum() / (
-                1024 * 1024
-            )
+            memory_mb = tob_file.tob_data.get_memory_mb()
             if memory_mb > 500:  # Warn if over 500MB
                 self.logger.warning(f"Auto-loading large dataset: {memory_mb:.1f}MB")
                 # Continue with loading for auto-plotting
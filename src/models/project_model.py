@@ -8,7 +8,7 @@ from contextlib import contextmanager
 from datetime import datetime
 from typing import Any, ClassVar, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class RollbackTransaction:
@@ -221,6 +221,10 @@ class TOBFileData(BaseModel):
     )
     raw_data: Optional[str] = Field(None, description="Raw TOB file content")
 
+    # Memory footprint of `data` in MB and the DataFrame it was measured on
+    _memory_mb: Optional[float] = PrivateAttr(default=None)
+    _memory_mb_data: Optional[Any] = PrivateAttr(default=None)
+
     class Config:
         """Pydantic configuration."""
 
@@ -229,6 +233,24 @@ class TOBFileData(BaseModel):
             # Custom encoder for any non-serializable objects
         }
 
+    def get_memory_mb(self) -> float:
+        """
+        Get the memory used by the TOB data in MB.
+
+        The deep memory scan is done once per DataFrame and reused afterwards.
+
+        Returns:
+            Memory usage in MB, 0.0 if no data is loaded
+        """
+        if self.data is None:
+            return 0.0
+        if self._memory_mb is None or self._memory_mb_data is not self.data:
+            self._memory_mb = float(self.data.memory_usage(deep=True).sum()) / (
+                1024 * 1024
+            )
+            self._memory_mb_data = self.data
+        return self._memory_mb
+
 
 class TOBFileInfo(BaseModel):
     """Complete information about a TOB file in the project."""
@@ -8,10 +8,20 @@ value updates, and limit validation.
 import logging
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
+from ..utils.helpers import TIME_UNIT_SECONDS, set_limit_text
+
 if TYPE_CHECKING:
     from ..views.main_window import MainWindow
 
 
+def _safe_float(text: str) -> Optional[float]:
+    """Parse a limit field's text, returning None if it is not a number."""
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
 class AxisUIService:
     """
     Service for managing axis UI controls and their interactions.
@@ -63,32 +73,18 @@ class AxisUIService:
             if time_range and "min" in time_range and "max" in time_range:
                 # Get current time unit
                 time_unit = "Seconds"
-                if hasattr(main_window, "x_axis_combo") and main_window.x_axis_combo:
-                    current_text = main_window.x_axis_combo.currentText()
-                    if current_text:
-                        time_unit = current_text
+                x_axis_combo = getattr(main_window, "x_axis_combo", None)
+                if x_axis_combo:
+                    time_unit = x_axis_combo.currentText() or time_unit
 
                 # Convert time values
-                min_value = float(time_range["min"])
-                max_value = float(time_range["max"])
-
-                if time_unit == "Minutes":
-                    min_value = min_value / 60.0
-                    max_value = max_value / 60.0
-                elif time_unit == "Hours":
-                    min_value = min_value / 3600.0
-                    max_value = max_value / 3600.0
+                factor = TIME_UNIT_SECONDS.get(time_unit, 1.0)
+                min_value = float(time_range["min"]) / factor
+                max_value = float(time_range["max"]) / factor
 
                 # Update X-axis values (always show, enable/disable based on auto mode)
-                if hasattr(main_window, "x_min_value") and main_window.x_min_value:
-                    main_window.x_min_value.blockSignals(True)
-                    main_window.x_min_value.setText(f"{min_value:.2f}")
-                    main_window.x_min_value.blockSignals(False)
-
-                if hasattr(main_window, "x_max_value") and main_window.x_max_value:
-                    main_window.x_max_value.blockSignals(True)
-                    main_window.x_max_value.setText(f"{max_value:.2f}")
-                    main_window.x_max_value.blockSignals(False)
+                set_limit_text(getattr(main_window, "x_min_value", None), min_value)
+                set_limit_text(getattr(main_window, "x_max_value", None), max_value)
 
                 self.logger.debug(
                     "X-axis values updated: min=%.2f, max=%.2f (%s)",
@@ -161,6 +157,33 @@ class AxisUIService:
         except Exception as e:
             self.logger.error("Failed to handle axis auto mode change: %s", e)
 
+    def handle_x_axis_unit_changed(
+        self, main_window: "MainWindow", is_auto: bool
+    ) -> None:
+        """
+        Refresh axis control values after the X-axis time unit changed.
+
+        Args:
+            main_window: Main window instance
+            is_auto: True if the X axis is in auto mode
+        """
+        try:
+            if is_auto:
+                # Auto mode shows the full data range in the new time unit
+                time_range = main_window.controller.get_time_range()
+                if time_range:
+                    self.update_axis_values(main_window, time_range)
+                    return
+            else:
+                # Plot limits are already in the new display unit
+                self._update_manual_values_from_plot(main_window, "x")
+
+            self._update_y_axes_from_plot(main_window)
+            self._update_control_states(main_window)
+
+        except Exception as e:
+            self.logger.error("Failed to handle X-axis unit change: %s", e)
+
     def handle_axis_limits_changed(
         self, main_window: "MainWindow", axis: str, min_text: str, max_text: str
     ) -> None:
@@ -174,98 +197,74 @@ class AxisUIService:
             max_text: Maximum value as string
         """
         try:
+            if axis not in ("x", "y1", "y2"):
+                return
+
             # Only process if auto mode is disabled for this axis
-            if axis == "x":
-                if (
-                    hasattr(main_window, "x_auto_checkbox")
-                    and main_window.x_auto_checkbox
-                    and main_window.x_auto_checkbox.isChecked()
-                ):
-                    return
-            elif axis == "y1":
-                if (
-                    hasattr(main_window, "y1_auto_checkbox")
-                    and main_window.y1_auto_checkbox
-                    and main_window.y1_auto_checkbox.isChecked()
-                ):
-                    return
-            elif axis == "y2":
-                if (
-                    hasattr(main_window, "y2_auto_checkbox")
-                    and main_window.y2_auto_checkbox
-                    and main_window.y2_auto_checkbox.isChecked()
-                ):
-                    return
+            auto_checkbox = getattr(main_window, f"{axis}_auto_checkbox", None)
+            if auto_checkbox and auto_checkbox.isChecked():
+                return
 
             if not min_text or not max_text:
                 return
 
-            # Validate and convert values
-            try:
-                min_value = float(min_text)
-                max_value = float(max_text)
-
-                # Basic validation
-                if min_value >= max_value:
-                    self.logger.warning(
-                        "Invalid %s range: min (%.2f) must be less than max (%.2f)",
-                        axis,
-                        min_value,
-                        max_value,
-                    )
-                    return
-
-                # Handle different axes
-                if axis == "x":
-                    time_unit = "Seconds"
-                    if (
-                        hasattr(main_window, "x_axis_combo")
-                        and main_window.x_axis_combo
-                    ):
-                        current_text = main_window.x_axis_combo.currentText()
-                        if current_text:
-                            time_unit = current_text
-
-                    # The plot data is already converted to the display unit by format_time_axis
-                    # So we send the values directly in the display unit
-
-                    # Send to controller - values are already in the correct unit for the plot
-                    if hasattr(main_window, "controller") and main_window.controller:
-                        main_window.controller.update_x_axis_limits(
-                            min_value, max_value
-                        )
-                        self.logger.debug(
-                            "X-axis limits updated: min=%.2f, max=%.2f (%s)",
-                            min_value,
-                            max_value,
-                            time_unit,
-                        )
-
-                elif axis in ["y1", "y2"]:
-                    # For Y-axes, send values directly to controller (no unit conversion needed)
-                    if hasattr(main_window, "controller") and main_window.controller:
-                        if axis == "y1":
-                            main_window.controller.update_y1_axis_limits(
-                                min_value, max_value
-                            )
-                        elif axis == "y2":
-                            main_window.controller.update_y2_axis_limits(
-                                min_value, max_value
-                            )
-                        self.logger.debug(
-                            "%s-axis limits updated: min=%.2f, max=%.2f",
-                            axis.upper(),
-                            min_value,
-                            max_value,
-                        )
+            controller = getattr(main_window, "controller", None)
 
-            except ValueError:
+            # Validate and convert values
+            min_value = _safe_float(min_text)
+            max_value = _safe_float(max_text)
+            if min_value is None or max_value is None:
                 self.logger.warning(
                     "Invalid %s limit values: min='%s', max='%s'",
                     axis,
                     min_text,
                     max_text,
                 )
+                return
+
+            # Basic validation
+            if min_value >= max_value:
+                self.logger.warning(
+                    "Invalid %s range: min (%.2f) must be less than max (%.2f)",
+                    axis,
+                    min_value,
+                    max_value,
+                )
+                return
+
+            # Handle different axes
+            if axis == "x":
+                time_unit = "Seconds"
+                x_axis_combo = getattr(main_window, "x_axis_combo", None)
+                if x_axis_combo:
+                    time_unit = x_axis_combo.currentText() or time_unit
+
+                # The plot data is already converted to the display unit by format_time_axis
+                # So we send the values directly in the display unit
+
+                # Send to controller - values are already in the correct unit for the plot
+                if controller:
+                    controller.update_x_axis_limits(min_value, max_value)
+                    self.logger.debug(
+                        "X-axis limits updated: min=%.2f, max=%.2f (%s)",
+                        min_value,
+                        max_value,
+                        time_unit,
+                    )
+
+            elif axis in ["y1", "y2"]:
+                # For Y-axes, send values directly to controller (no unit conversion needed)
+                if controller:
+                    if axis == "y1":
+                        controller.update_y1_axis_limits(min_value, max_value)
+                    elif axis == "y2":
+                        controller.update_y2_axis_limits(min_value, max_value)
+                    self.logger.debug(
+                        "%s-axis limits updated: min=%.2f, max=%.2f",
+                        axis.upper(),
+                        min_value,
+                        max_value,
+                    )
 
         except Exception as e:
             self.logger.error("Failed to handle %s axis limits change: %s", axis, e)
@@ -284,15 +283,8 @@ class AxisUIService:
             ylim1 = main_window.plot_widget.ax1.get_ylim()
             y1_min, y1_max = ylim1
 
-            if hasattr(main_window, "y1_min_value") and main_window.y1_min_value:
-                main_window.y1_min_value.blockSignals(True)
-                main_window.y1_min_value.setText(f"{y1_min:.2f}")
-                main_window.y1_min_value.blockSignals(False)
-
-            if hasattr(main_window, "y1_max_value") and main_window.y1_max_value:
-                main_window.y1_max_value.blockSignals(True)
-                main_window.y1_max_value.setText(f"{y1_max:.2f}")
-                main_window.y1_max_value.blockSignals(False)
+            set_limit_text(getattr(main_window, "y1_min_value", None), y1_min)
+            set_limit_text(getattr(main_window, "y1_max_value", None), y1_max)
 
             self.logger.debug(
                 "Y1-axis values updated from plot: min=%.2f, max=%.2f", y1_min, y1_max
@@ -303,15 +295,8 @@ class AxisUIService:
                 ylim2 = main_window.plot_widget.ax2.get_ylim()
                 y2_min, y2_max = ylim2
 
-                if hasattr(main_window, "y2_min_value") and main_window.y2_min_value:
-                    main_window.y2_min_value.blockSignals(True)
-                    main_window.y2_min_value.setText(f"{y2_min:.2f}")
-                    main_window.y2_min_value.blockSignals(False)
-
-                if hasattr(main_window, "y2_max_value") and main_window.y2_max_value:
-                    main_window.y2_max_value.blockSignals(True)
-                    main_window.y2_max_value.setText(f"{y2_max:.2f}")
-                    main_window.y2_max_value.blockSignals(False)
+                set_limit_text(getattr(main_window, "y2_min_value", None), y2_min)
+                set_limit_text(getattr(main_window, "y2_max_value", None), y2_max)
 
                 self.logger.debug(
                     "Y2-axis values updated from plot: min=%.2f, max=%.2f",
@@ -330,26 +315,12 @@ class AxisUIService:
             main_window: Main window instance
         """
         try:
-            # X-axis controls
-            if hasattr(main_window, "x_auto_checkbox") and main_window.x_auto_checkbox:
-                x_auto = main_window.x_auto_checkbox.isChecked()
-                self._set_axis_controls_enabled(main_window, "x", not x_auto)
-
-            # Y1-axis controls
-            if (
-                hasattr(main_window, "y1_auto_checkbox")
-                and main_window.y1_auto_checkbox
-            ):
-                y1_auto = main_window.y1_auto_checkbox.isChecked()
-                self._set_axis_controls_enabled(main_window, "y1", not y1_auto)
-
-            # Y2-axis controls
-            if (
-                hasattr(main_window, "y2_auto_checkbox")
-                and main_window.y2_auto_checkbox
-            ):
-                y2_auto = main_window.y2_auto_checkbox.isChecked()
-                self._set_axis_controls_enabled(main_window, "y2", not y2_auto)
+            for axis in ("x", "y1", "y2"):
+                auto_checkbox = getattr(main_window, f"{axis}_auto_checkbox", None)
+                if auto_checkbox:
+                    self._set_axis_controls_enabled(
+                        main_window, axis, not auto_checkbox.isChecked()
+                    )
 
         except Exception as e:
             self.logger.error("Failed to update control states: %s", e)
@@ -366,21 +337,12 @@ class AxisUIService:
             enabled: True to enable controls, False to disable
         """
         try:
-            if axis == "x":
-                if hasattr(main_window, "x_min_value") and main_window.x_min_value:
-                    main_window.x_min_value.setEnabled(enabled)
-                if hasattr(main_window, "x_max_value") and main_window.x_max_value:
-                    main_window.x_max_value.setEnabled(enabled)
-            elif axis == "y1":
-                if hasattr(main_window, "y1_min_value") and main_window.y1_min_value:
-                    main_window.y1_min_value.setEnabled(enabled)
-                if hasattr(main_window, "y1_max_value") and main_window.y1_max_value:
-                    main_window.y1_max_value.setEnabled(enabled)
-            elif axis == "y2":
-                if hasattr(main_window, "y2_min_value") and main_window.y2_min_value:
-                    main_window.y2_min_value.setEnabled(enabled)
-                if hasattr(main_window, "y2_max_value") and main_window.y2_max_value:
-                    main_window.y2_max_value.setEnabled(enabled)
+            if axis not in ("x", "y1", "y2"):
+                return
+            for limit_name in (f"{axis}_min_value", f"{axis}_max_value"):
+                limit_edit = getattr(main_window, limit_name, None)
+                if limit_edit:
+                    limit_edit.setEnabled(enabled)
 
         except Exception as e:
             self.logger.error("Failed to set axis controls enabled state: %s", e)
@@ -405,15 +367,8 @@ class AxisUIService:
 
                     # The plot internal values are ALREADY in the display unit (converted by format_time_axis)
                     # So we can use them directly as display values
-                    if hasattr(main_window, "x_min_value") and main_window.x_min_value:
-                        main_window.x_min_value.blockSignals(True)
-                        main_window.x_min_value.setText(f"{x_min:.2f}")
-                        main_window.x_min_value.blockSignals(False)
-
-                    if hasattr(main_window, "x_max_value") and main_window.x_max_value:
-                        main_window.x_max_value.blockSignals(True)
-                        main_window.x_max_value.setText(f"{x_max:.2f}")
-                        main_window.x_max_value.blockSignals(False)
+                    set_limit_text(getattr(main_window, "x_min_value", None), x_min)
+                    set_limit_text(getattr(main_window, "x_max_value", None), x_max)
 
                     self.logger.debug(
                         "Updated X-axis manual values from plot: min=%.2f, max=%.2f",
@@ -426,21 +381,8 @@ class AxisUIService:
                     ylim1 = main_window.plot_widget.ax1.get_ylim()
                     y1_min, y1_max = ylim1
 
-                    if (
-                        hasattr(main_window, "y1_min_value")
-                        and main_window.y1_min_value
-                    ):
-                        main_window.y1_min_value.blockSignals(True)
-                        main_window.y1_min_value.setText(f"{y1_min:.2f}")
-                        main_window.y1_min_value.blockSignals(False)
-
-                    if (
-                        hasattr(main_window, "y1_max_value")
-                        and main_window.y1_max_value
-                    ):
-                        main_window.y1_max_value.blockSignals(True)
-                        main_window.y1_max_value.setText(f"{y1_max:.2f}")
-                        main_window.y1_max_value.blockSignals(False)
+                    set_limit_text(getattr(main_window, "y1_min_value", None), y1_min)
+                    set_limit_text(getattr(main_window, "y1_max_value", None), y1_max)
 
                     self.logger.debug(
                         "Updated Y1-axis manual values from plot: min=%.2f, max=%.2f",
@@ -457,21 +399,12 @@ class AxisUIService:
                         ylim2 = main_window.plot_widget.ax2.get_ylim()
                         y2_min, y2_max = ylim2
 
-                        if (
-                            hasattr(main_window, "y2_min_value")
-                            and main_window.y2_min_value
-                        ):
-                            main_window.y2_min_value.blockSignals(True)
-                            main_window.y2_min_value.setText(f"{y2_min:.2f}")
-                            main_window.y2_min_value.blockSignals(False)
-
-                        if (
-                            hasattr(main_window, "y2_max_value")
-                            and main_window.y2_max_value
-                        ):
-                            main_window.y2_max_value.blockSignals(True)
-                            main_window.y2_max_value.setText(f"{y2_max:.2f}")
-                            main_window.y2_max_value.blockSignals(False)
+                        set_limit_text(
+                            getattr(main_window, "y2_min_value", None), y2_min
+                        )
+                        set_limit_text(
+                            getattr(main_window, "y2_max_value", None), y2_max
+                        )
 
                         self.logger.debug(
                             "Updated Y2-axis manual values from plot: min=%.2f, max=%.2f",
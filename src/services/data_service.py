@@ -12,6 +12,7 @@ import pandas as pd
 from PyQt6.QtWidgets import QLineEdit
 
 from ..models.tob_data_model import TOBDataModel
+from ..utils.helpers import METRIC_WIDGETS, set_text_if_changed
 from .analytics_service import AnalyticsService
 
 
@@ -118,6 +119,20 @@ class DataService:
             self.logger.error("Error getting sensor ranges: %s", e)
             return {}
 
+    def calculate_metrics(self, data_model: TOBDataModel) -> Dict[str, Any]:
+        """
+        Calculate the data metrics shown for a TOB file.
+
+        Safe to call off the GUI thread: no widgets are touched.
+
+        Args:
+            data_model: TOBDataModel instance
+
+        Returns:
+            Dictionary containing calculated metrics
+        """
+        return self._calculate_metrics(data_model)
+
     def _calculate_metrics(self, data_model: TOBDataModel) -> Dict[str, Any]:
         """
         Calculate data metrics using the analytics service.
@@ -192,28 +207,10 @@ class DataService:
             metrics: Dictionary containing metric values
         """
         try:
-            if "mean_hp_power" in metrics and "mean_hp_power_value" in metrics_widgets:
-                if metrics_widgets["mean_hp_power_value"]:
-                    metrics_widgets["mean_hp_power_value"].setText(
-                        str(metrics["mean_hp_power"])
-                    )
-
-            if "max_v_accu" in metrics and "max_v_accu_value" in metrics_widgets:
-                if metrics_widgets["max_v_accu_value"]:
-                    metrics_widgets["max_v_accu_value"].setText(
-                        str(metrics["max_v_accu"])
-                    )
-
-            if "tilt_status" in metrics and "tilt_status_value" in metrics_widgets:
-                if metrics_widgets["tilt_status_value"]:
-                    metrics_widgets["tilt_status_value"].setText(
-                        str(metrics["tilt_status"])
-                    )
-
-            if "mean_press" in metrics and "mean_press_value" in metrics_widgets:
-                if metrics_widgets["mean_press_value"]:
-                    metrics_widgets["mean_press_value"].setText(
-                        str(metrics["mean_press"])
+            for metric_key, widget_name in METRIC_WIDGETS:
+                if metric_key in metrics and metrics_widgets.get(widget_name):
+                    set_text_if_changed(
+                        metrics_widgets[widget_name], str(metrics[metric_key])
                     )
 
             self.logger.debug("Data metrics updated successfully")
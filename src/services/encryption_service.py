@@ -5,7 +5,6 @@ Service for project encryption and decryption operations.
 """
 
 import base64
-import json
 import logging
 import os
 from pathlib import Path
@@ -78,11 +77,8 @@ class EncryptionService:
             fernet = Fernet(key)
             decrypted_bytes = fernet.decrypt(encrypted_data)
 
-            # Convert back to JSON and create ProjectModel
-            project_json = decrypted_bytes.decode("utf-8")
-            project_data = json.loads(project_json)
-
-            project = ProjectModel(**project_data)
+            # Validate the JSON bytes directly, without an intermediate dict
+            project = ProjectModel.model_validate_json(decrypted_bytes)
 
             self.logger.info("Successfully decrypted project: %s", project.name)
             return project
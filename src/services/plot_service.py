@@ -6,17 +6,23 @@ including NTC and PT100 sensors, with interactive controls and professional styl
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
-from matplotlib.figure import Figure
 from PyQt6.QtWidgets import QWidget
 
 from ..models.tob_data_model import TOBDataModel
+from ..utils.helpers import TIME_UNIT_SECONDS
+
+# Tick label suffix per time unit; unknown units are shown in seconds
+_TIME_UNIT_LABELS = {"Seconds": "s", "Minutes": "min", "Hours": "h"}
+
+# matplotlib is only imported once the first PlotWidget is built, so the
+# welcome screen can come up without paying for it.
+if TYPE_CHECKING:
+    from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+    from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 
 
 class PlotService:
@@ -72,7 +78,9 @@ class PlotService:
             self.logger.error("Failed to create plot widget: %s", e)
             raise
 
-    def create_navigation_toolbar(self, canvas: FigureCanvas, parent: QWidget) -> NavigationToolbar:
+    def create_navigation_toolbar(
+        self, canvas: "FigureCanvas", parent: QWidget
+    ) -> "NavigationToolbar":
         """
         Create a navigation toolbar for the plot.
 
@@ -84,6 +92,8 @@ class PlotService:
             NavigationToolbar: Configured navigation toolbar
         """
         try:
+            from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
+
             self.logger.info("Creating navigation toolbar")
             toolbar = NavigationToolbar(canvas, parent)
 
@@ -183,15 +193,11 @@ class PlotService:
                 return np.array([]), []
 
             # Convert time data based on unit
-            if time_unit == "Minutes":
-                time_values = time_data.values / 60.0
-                unit_label = "min"
-            elif time_unit == "Hours":
-                time_values = time_data.values / 3600.0
-                unit_label = "h"
+            if time_unit in TIME_UNIT_SECONDS and time_unit != "Seconds":
+                time_values = time_data.values / TIME_UNIT_SECONDS[time_unit]
             else:  # Seconds (default)
                 time_values = time_data.values
-                unit_label = "s"
+            unit_label = _TIME_UNIT_LABELS.get(time_unit, "s")
 
             # Create time labels (every 10th point for readability)
             step = max(1, len(time_values) // 10)
@@ -292,7 +298,7 @@ class PlotWidget(QWidget):
         self.plot_service = plot_service
         self.logger = logging.getLogger(__name__)
 
-        self.logger.info("Initializing PlotWidget...")
+        self.logger.debug("Initializing PlotWidget...")
 
         # Data storage
         self.tob_data_model: Optional[TOBDataModel] = None
@@ -315,16 +321,16 @@ class PlotWidget(QWidget):
         self.active_ntc_sensors = None  # None = all NTCs active, or list of active NTCs
 
         # Navigation toolbar
-        self.navigation_toolbar: Optional[NavigationToolbar] = None
+        self.navigation_toolbar: Optional["NavigationToolbar"] = None
 
         # Matplotlib setup
-        self.logger.info("Setting up matplotlib...")
+        self.logger.debug("Setting up matplotlib...")
         self._setup_matplotlib()
-        self.logger.info("Creating plot canvas...")
+        self.logger.debug("Creating plot canvas...")
         self._create_plot_canvas()
-        self.logger.info("Creating navigation toolbar...")
+        self.logger.debug("Creating navigation toolbar...")
         self._create_navigation_toolbar()
-        self.logger.info("Setting up plot layout...")
+        self.logger.debug("Setting up plot layout...")
         self._setup_plot_layout()
 
         self.logger.info("PlotWidget initialized successfully")
@@ -332,6 +338,8 @@ class PlotWidget(QWidget):
     def _setup_matplotlib(self):
         """Configure matplotlib for professional plotting."""
         try:
+            import matplotlib.pyplot as plt
+
             # Set matplotlib style
             plt.style.use("default")
 
@@ -365,6 +373,9 @@ class PlotWidget(QWidget):
     def _create_plot_canvas(self):
         """Create the matplotlib canvas with support for dual plots."""
         try:
+            from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+            from matplotlib.figure import Figure
+
             # Create figure with subplots
             self.figure = Figure(figsize=(12, 8), dpi=100)
             self.figure.patch.set_facecolor("white")
@@ -672,6 +683,10 @@ class PlotWidget(QWidget):
             self.logger.error("Failed to add legend: %s", e)
             raise
 
+    def clear_plot(self):
+        """Clear the plotted data and show the placeholder."""
+        self._clear_plot()
+
     def _clear_plot(self):
         """Clear the plot and show placeholder."""
         try:
@@ -740,7 +755,7 @@ class PlotWidget(QWidget):
         except Exception as e:
             self.logger.error("Failed to set navigation toolbar visibility: %s", e)
 
-    def get_navigation_toolbar(self) -> Optional[NavigationToolbar]:
+    def get_navigation_toolbar(self) -> Optional["NavigationToolbar"]:
         """
         Get the navigation toolbar instance.
 
@@ -6,7 +6,7 @@ Cross-platform UI styling, font management, and widget operations.
 
 import logging
 import platform
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QColor, QFont, QPainter, QPalette, QPen, QPixmap
@@ -19,6 +19,38 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from ..utils.helpers import METRIC_WIDGETS
+
+# Y1 and Y2 axis options (all available sensors and calculated values)
+_SENSOR_OPTIONS = (
+    # Temperature sensors
+    "NTCs",  # All NTC temperature sensors (NTC01-NTC22)
+    "Temp",  # PT100 data is in 'Temp' column
+    # Other sensors
+    "Press",  # Pressure sensor
+    "Vheat",  # Heating voltage
+    "Iheat",  # Heating current
+    "TiltX",  # Tilt sensor X-axis
+    "TiltY",  # Tilt sensor Y-axis
+    "ACCz",  # Acceleration Z-axis
+    "Vbatt",  # Battery voltage
+    "Vaccu",  # Accumulator voltage
+    # Calculated values
+    "HP-Power",  # Calculated heating power (Vheat * Iheat)
+)
+
+# Y2 offers the same options as Y1 plus "None" (no secondary axis)
+_Y2_OPTIONS = ("None",) + _SENSOR_OPTIONS
+
+# X axis options (time-based)
+_TIME_OPTIONS = ("Seconds", "Minutes", "Hours")
+
+# Dynamic property marking widgets whose text must stay black, the property
+# marking ancestors that already carry the rule, and the rule selecting them
+_BLACK_TEXT_PROPERTY = "wizardBlackText"
+_BLACK_TEXT_RULE_PROPERTY = "wizardBlackTextRule"
+_BLACK_TEXT_RULE = f"*[{_BLACK_TEXT_PROPERTY}=\"true\"] {{ color: black; }}"
+
 
 class UIService:
     """
@@ -31,6 +63,8 @@ class UIService:
         # Cache for cross-platform compatibility checks
         self._compatibility_checked = False
         self._platform_quirks = self._detect_platform_quirks()
+        # Platform font, built on first use
+        self._platform_font: Optional[QFont] = None
 
     def _detect_platform_quirks(self) -> Dict[str, bool]:
         """
@@ -41,7 +75,6 @@ class UIService:
         """
         quirks = {
             "palette_override_needed": False,
-            "stylesheet_priority": False,
             "combobox_view_palette_bug": False,
             "itemdata_foreground_bug": False,
         }
@@ -49,7 +82,6 @@ class UIService:
         # Windows sometimes needs stronger palette overrides
         if self.current_platform == "Windows":
             quirks["palette_override_needed"] = True
-            quirks["stylesheet_priority"] = True
 
         # Some Linux distributions have issues with combobox view palettes
         elif self.current_platform == "Linux":
@@ -60,7 +92,7 @@ class UIService:
             pass  # No known quirks
 
         self.logger.debug(
-            f"Detected platform quirks for {self.current_platform}: {quirks}"
+            "Detected platform quirks for %s: %s", self.current_platform, quirks
         )
         return quirks
 
@@ -79,11 +111,14 @@ class UIService:
             # Get platform-appropriate font
             font = self._get_platform_font()
 
+            # One tree walk shared by the font and text color passes
+            children = widget.findChildren(QWidget)
+
             # Apply font to widget and all children
-            self._apply_font_recursively(widget, font)
+            self._apply_font_recursively(widget, font, children)
 
             # Set explicit text colors for visibility
-            self._set_text_colors_recursively(widget)
+            self._set_text_colors_recursively(widget, children)
 
             self.logger.info(
                 "Fonts and text colors applied successfully: %s on %s",
@@ -107,6 +142,9 @@ class UIService:
         Returns:
             QFont configured for the current platform
         """
+        if self._platform_font is not None:
+            return QFont(self._platform_font)
+
         font = QFont()
 
         # Use fonts that actually work (based on testing)
@@ -128,28 +166,36 @@ class UIService:
         font.setWeight(QFont.Weight.Normal)
         font.setStyleHint(QFont.StyleHint.SansSerif)
 
-        return font
+        self._platform_font = font
+        return QFont(font)
 
-    def _apply_font_recursively(self, widget: QWidget, font: QFont) -> None:
+    def _apply_font_recursively(
+        self, widget: QWidget, font: QFont, children: Optional[List[QWidget]] = None
+    ) -> None:
         """
         Apply font to widget and all its children recursively.
 
         Args:
             widget: The widget to apply font to
             font: The font to apply
+            children: Descendants of the widget if already collected
         """
         try:
             # Apply font to current widget
             widget.setFont(font)
 
             # Apply font to all child widgets
-            for child in widget.findChildren(QWidget):
+            if children is None:
+                children = widget.findChildren(QWidget)
+            for child in children:
                 child.setFont(font)
 
         except Exception as e:
             self.logger.debug("Could not apply font to widget: %s", e)
 
-    def _set_text_colors_recursively(self, widget: QWidget) -> None:
+    def _set_text_colors_recursively(
+        self, widget: QWidget, children: Optional[List[QWidget]] = None
+    ) -> None:
         """
         Set explicit text colors for all text-based widgets to ensure visibility.
         This fixes the issue where Qt automatically chooses white text on colored backgrounds.
@@ -157,6 +203,7 @@ class UIService:
 
         Args:
             widget: The widget to set text colors for
+            children: Descendants of the widget if already collected
         """
         import os
 
@@ -170,36 +217,55 @@ class UIService:
             text_color = QColor(0, 0, 0)  # RGB black instead of Qt.GlobalColor.black
             gray_color = QColor(128, 128, 128)  # Explicit gray for placeholders
 
+            # Partition the text widgets from a single tree walk
+            labels, checkboxes, buttons, line_edits, combo_boxes = [], [], [], [], []
+            partitions = (
+                (QLabel, labels),
+                (QCheckBox, checkboxes),
+                (QPushButton, buttons),
+                (QLineEdit, line_edits),
+                (QComboBox, combo_boxes),
+            )
+            if children is None:
+                children = widget.findChildren(
+                    (QLabel, QCheckBox, QPushButton, QLineEdit, QComboBox)
+                )
+            for child in children:
+                for widget_type, bucket in partitions:
+                    if isinstance(child, widget_type):
+                        bucket.append(child)
+                        break
+
             # Handle QLabel widgets
-            for label in widget.findChildren(QLabel):
+            for label in labels:
                 palette = label.palette()
                 palette.setColor(QPalette.ColorRole.WindowText, text_color)
                 palette.setColor(QPalette.ColorRole.Text, text_color)
                 label.setPalette(palette)
 
             # Handle QCheckBox widgets
-            for checkbox in widget.findChildren(QCheckBox):
+            for checkbox in checkboxes:
                 palette = checkbox.palette()
                 palette.setColor(QPalette.ColorRole.WindowText, text_color)
                 palette.setColor(QPalette.ColorRole.Text, text_color)
                 checkbox.setPalette(palette)
 
             # Handle QPushButton widgets
-            for button in widget.findChildren(QPushButton):
+            for button in buttons:
                 palette = button.palette()
                 palette.setColor(QPalette.ColorRole.ButtonText, text_color)
                 palette.setColor(QPalette.ColorRole.WindowText, text_color)
                 button.setPalette(palette)
 
             # Handle QLineEdit widgets
-            for line_edit in widget.findChildren(QLineEdit):
+            for line_edit in line_edits:
                 palette = line_edit.palette()
                 palette.setColor(QPalette.ColorRole.Text, text_color)
                 palette.setColor(QPalette.ColorRole.PlaceholderText, gray_color)
                 line_edit.setPalette(palette)
 
             # Handle QComboBox widgets - more specific color roles and stylesheet fallback
-            for combo_box in widget.findChildren(QComboBox):
+            for combo_box in combo_boxes:
                 palette = combo_box.palette()
                 # Set text color for the selected item in the combo box field
                 palette.setColor(QPalette.ColorRole.Text, text_color)
@@ -217,17 +283,6 @@ class UIService:
                     )
                     combo_box.view().setPalette(view_palette)
 
-                # Apply platform-specific fixes
-                if self._platform_quirks["stylesheet_priority"]:
-                    # On Windows, apply stylesheet first for higher priority
-                    current_style = combo_box.styleSheet()
-                    text_color_css = "color: black;"
-                    if text_color_css not in current_style:
-                        if current_style:
-                            combo_box.setStyleSheet(current_style + text_color_css)
-                        else:
-                            combo_box.setStyleSheet(text_color_css)
-
                 # Force color for all items in the combobox (unless known bug)
                 if not self._platform_quirks["itemdata_foreground_bug"]:
                     for i in range(combo_box.count()):
@@ -236,15 +291,12 @@ class UIService:
                             i, text_color, Qt.ItemDataRole.ForegroundRole
                         )
 
-                # Apply stylesheet as fallback (unless already applied for Windows)
-                if not self._platform_quirks["stylesheet_priority"]:
-                    current_style = combo_box.styleSheet()
-                    text_color_css = "color: black;"
-                    if text_color_css not in current_style:
-                        if current_style:
-                            combo_box.setStyleSheet(current_style + text_color_css)
-                        else:
-                            combo_box.setStyleSheet(text_color_css)
+            # Stylesheet fallback: tag each combobox with the dynamic property,
+            # then install the selecting rule once so Qt re-polishes the tree once
+            if combo_boxes:
+                for combo_box in combo_boxes:
+                    combo_box.setProperty(_BLACK_TEXT_PROPERTY, True)
+                self._install_black_text_rule(widget)
 
             self.logger.debug("Text colors set to black for all text widgets")
 
@@ -288,54 +340,60 @@ class UIService:
                 for i in range(combo_box.count()):
                     combo_box.setItemData(i, text_color, Qt.ItemDataRole.ForegroundRole)
 
-            # Stylesheet fallback with platform-specific priority
-            current_style = combo_box.styleSheet()
-            text_color_css = "color: black;"
-            if text_color_css not in current_style:
-                if current_style:
-                    combo_box.setStyleSheet(current_style + text_color_css)
-                else:
-                    combo_box.setStyleSheet(text_color_css)
+            # Stylesheet fallback via the dynamic property and the shared rule
+            if combo_box.property(_BLACK_TEXT_PROPERTY) is not True:
+                combo_box.setProperty(_BLACK_TEXT_PROPERTY, True)
+                # Property selectors are only re-evaluated on polish
+                combo_box.style().unpolish(combo_box)
+                combo_box.style().polish(combo_box)
+            self._install_black_text_rule(combo_box.window())
 
         except Exception as e:
             self.logger.debug("Could not fix combobox colors: %s", e)
 
+    def _install_black_text_rule(self, widget: QWidget) -> None:
+        """
+        Install the rule making text of all widgets tagged with the black text
+        property black, once per ancestor widget.
+
+        Args:
+            widget: Ancestor widget to install the rule on
+        """
+        if widget.property(_BLACK_TEXT_RULE_PROPERTY):
+            return
+        widget.setProperty(_BLACK_TEXT_RULE_PROPERTY, True)
+        current_style = widget.styleSheet()
+        if current_style and "{" not in current_style:
+            # Bare declarations cannot be mixed with rules; scope them the way
+            # Qt does implicitly
+            current_style = f"* {{ {current_style} }}"
+        widget.setStyleSheet(current_style + _BLACK_TEXT_RULE)
+
     def fix_ui_visibility(self, widget: QWidget) -> None:
         """
         Fix UI visibility issues by ensuring all text widgets are visible and properly styled.
         This addresses the problem where widgets exist but are not visible to the user.
 
+        This is a debugging aid for layouts that hide text widgets; it only runs
+        when the WIZARD_DEBUG_UI environment variable is set, since the .ui file
+        already leaves all text widgets visible.
+
         Args:
             widget: The main widget to fix visibility for
         """
-        try:
-            # Fix QLabel widgets - only ensure visibility
-            labels = widget.findChildren(QLabel)
-            for label in labels:
-                label.setVisible(True)
-
-            # Fix QCheckBox widgets - only ensure visibility
-            checkboxes = widget.findChildren(QCheckBox)
-            for checkbox in checkboxes:
-                checkbox.setVisible(True)
+        import os
 
-            # Fix QPushButton widgets - only ensure visibility
-            buttons = widget.findChildren(QPushButton)
-            for button in buttons:
-                button.setVisible(True)
+        if not os.environ.get("WIZARD_DEBUG_UI"):
+            return
 
-            # Fix QLineEdit widgets - only ensure visibility
-            line_edits = widget.findChildren(QLineEdit)
-            for line_edit in line_edits:
-                line_edit.setVisible(True)
+        try:
+            # Labels, checkboxes, buttons and line edits from a single tree walk -
+            # only ensure visibility
+            text_widgets = widget.findChildren((QLabel, QCheckBox, QPushButton, QLineEdit))
+            for text_widget in text_widgets:
+                text_widget.setVisible(True)
 
-            self.logger.info(
-                "UI visibility fixed: %d labels, %d checkboxes, %d buttons, %d line edits",
-                len(labels),
-                len(checkboxes),
-                len(buttons),
-                len(line_edits),
-            )
+            self.logger.info("UI visibility fixed: %d text widgets", len(text_widgets))
 
         except Exception as e:
             self.logger.error("Failed to fix UI visibility: %s", e)
@@ -348,60 +406,31 @@ class UIService:
             axis_combos: Dictionary containing axis combo boxes
         """
         try:
-            # Y1 and Y2 axis options (all available sensors and calculated values)
-            sensor_options = [
-                # Temperature sensors
-                "NTCs",  # All NTC temperature sensors (NTC01-NTC22)
-                "Temp",  # PT100 data is in 'Temp' column
-                # Other sensors
-                "Press",  # Pressure sensor
-                "Vheat",  # Heating voltage
-                "Iheat",  # Heating current
-                "TiltX",  # Tilt sensor X-axis
-                "TiltY",  # Tilt sensor Y-axis
-                "ACCz",  # Acceleration Z-axis
-                "Vbatt",  # Battery voltage
-                "Vaccu",  # Accumulator voltage
-                # Calculated values
-                "HP-Power",  # Calculated heating power (Vheat * Iheat)
-            ]
-
-            # Setup Y1 axis combo
-            if (
-                "y1_axis_combo" in axis_combos
-                and axis_combos["y1_axis_combo"] is not None
-            ):
-                axis_combos["y1_axis_combo"].clear()
-                axis_combos["y1_axis_combo"].addItems(sensor_options)
-                axis_combos["y1_axis_combo"].setCurrentText("NTC01")
-                # Ensure text colors are set for this combobox
-                self._fix_combobox_colors(axis_combos["y1_axis_combo"])
-
-            # Setup Y2 axis combo (same options as Y1 plus "None")
-            if (
-                "y2_axis_combo" in axis_combos
-                and axis_combos["y2_axis_combo"] is not None
-            ):
-                axis_combos["y2_axis_combo"].clear()
-                y2_options = ["None"] + sensor_options
-                axis_combos["y2_axis_combo"].addItems(y2_options)
-                axis_combos["y2_axis_combo"].setCurrentText(
-                    "None"
-                )  # Default to no Y2 axis
-                # Ensure text colors are set for this combobox
-                self._fix_combobox_colors(axis_combos["y2_axis_combo"])
+            # Y1 and Y2 share the sensor options (Y2 defaults to no axis), X is
+            # time-based
+            combo_setups = (
+                ("y1_axis_combo", _SENSOR_OPTIONS, "NTC01"),
+                ("y2_axis_combo", _Y2_OPTIONS, "None"),
+                ("x_axis_combo", _TIME_OPTIONS, "Seconds"),
+            )
+            for combo_name, options, default in combo_setups:
+                combo_box = axis_combos.get(combo_name)
+                if combo_box is None:
+                    continue
+
+                # Block signals so filling the combobox does not emit once per
+                # inserted item, then announce the final selection once
+                combo_box.blockSignals(True)
+                try:
+                    combo_box.clear()
+                    combo_box.addItems(options)
+                    combo_box.setCurrentText(default)
+                finally:
+                    combo_box.blockSignals(False)
+                combo_box.currentTextChanged.emit(combo_box.currentText())
 
-            # X axis options (time-based)
-            time_options = ["Seconds", "Minutes", "Hours"]
-            if (
-                "x_axis_combo" in axis_combos
-                and axis_combos["x_axis_combo"] is not None
-            ):
-                axis_combos["x_axis_combo"].clear()
-                axis_combos["x_axis_combo"].addItems(time_options)
-                axis_combos["x_axis_combo"].setCurrentText("Seconds")
                 # Ensure text colors are set for this combobox
-                self._fix_combobox_colors(axis_combos["x_axis_combo"])
+                self._fix_combobox_colors(combo_box)
 
             self.logger.debug("Axis controls setup completed")
 
@@ -417,14 +446,7 @@ class UIService:
         """
         try:
             # Reset data metrics widgets
-            metrics_widgets = [
-                "mean_hp_power_value",
-                "max_v_accu_value",
-                "tilt_status_value",
-                "mean_press_value",
-            ]
-
-            for widget_name in metrics_widgets:
+            for _, widget_name in METRIC_WIDGETS:
                 if widget_name in widgets and widgets[widget_name]:
                     widgets[widget_name].setText("-")
 
@@ -547,7 +569,7 @@ class UIService:
         label.setPixmap(pixmap)
         label.setScaledContents(True)  # Scale pixmap to label size
 
-        self.logger.debug(f"Updated pixmap for label with style: {style_info}")
+        self.logger.debug("Updated pixmap for label with style: %s", style_info)
 
     def setup_label_indicator(
         self, label: QLabel, style_info: Dict[str, Any]
@@ -580,5 +602,5 @@ class UIService:
 
         label.resizeEvent = styled_resize_event
 
-        self.logger.debug(f"Set up label indicator with initial style: {style_info}")
+        self.logger.debug("Set up label indicator with initial style: %s", style_info)
         return label
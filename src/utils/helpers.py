@@ -10,6 +10,27 @@ import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+# Seconds per time unit offered by the X-axis selector
+TIME_UNIT_SECONDS: Dict[str, float] = {"Seconds": 1.0, "Minutes": 60.0, "Hours": 3600.0}
+
+# Human-readable text per TOB file status
+TOB_STATUS_TEXTS = {
+    "loaded": "Loaded",
+    "uploading": "Uploading...",
+    "uploaded": "Uploaded",
+    "processing": "Processing...",
+    "processed": "Processed",
+    "error": "Error",
+}
+
+# (metric key, widget name) pairs of the data metrics panel
+METRIC_WIDGETS = (
+    ("mean_hp_power", "mean_hp_power_value"),
+    ("max_v_accu", "max_v_accu_value"),
+    ("tilt_status", "tilt_status_value"),
+    ("mean_press", "mean_press_value"),
+)
+
 
 def get_project_root() -> Path:
     """
@@ -287,6 +308,46 @@ def format_duration(seconds: float) -> str:
         return f"{hours:.1f} hours"
 
 
+def set_text_if_changed(widget: Any, text: str) -> bool:
+    """
+    Set a widget's text unless it already shows that text.
+
+    Skipping identical text avoids a repaint and textChanged emissions.
+
+    Args:
+        widget: Widget with text()/setText(), or None
+        text: Text to show
+
+    Returns:
+        True if the text was set
+    """
+    if widget is None or widget.text() == text:
+        return False
+    widget.setText(text)
+    return True
+
+
+def set_limit_text(line_edit: Any, value: float) -> None:
+    """
+    Show an axis limit in a line edit without emitting its signals.
+
+    The previous signal-blocking state is restored even if setting the text
+    fails.
+
+    Args:
+        line_edit: Limit line edit, or None
+        value: Limit to show
+    """
+    if not line_edit:
+        return
+    text = f"{value:.2f}"
+    was_blocked = line_edit.blockSignals(True)
+    try:
+        set_text_if_changed(line_edit, text)
+    finally:
+        line_edit.blockSignals(was_blocked)
+
+
 def truncate_string(text: str, max_length: int, suffix: str = "...") -> str:
     """
     Truncate string to maximum length.
@@ -27,6 +27,8 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
 )
 
+from ...utils.helpers import TOB_STATUS_TEXTS
+
 
 class ProcessingListDialog(QDialog):
     """
@@ -498,15 +500,7 @@ TOB File Details: {file_name}
         Returns:
             Human-readable status text
         """
-        status_texts = {
-            "loaded": "Loaded",
-            "uploading": "Uploading...",
-            "uploaded": "Uploaded",
-            "processing": "Processing...",
-            "processed": "Processed",
-            "error": "Error",
-        }
-        return status_texts.get(status, status)
+        return TOB_STATUS_TEXTS.get(status, status)
 
     def _get_status_description(self, status: str) -> str:
         """
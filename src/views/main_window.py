@@ -5,30 +5,90 @@ This module contains the main window class that serves as the primary interface
 for the temperature data analysis application.
 """
 
+import functools
 import logging
 import re
+import traceback
+import weakref
+from collections import deque
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from PyQt6 import uic
-from PyQt6.QtCore import pyqtSignal
-from PyQt6.QtGui import QAction
+from PyQt6.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, pyqtSignal
 from PyQt6.QtWidgets import (
-    QCheckBox,
-    QComboBox,
-    QDoubleSpinBox,
     QFileDialog,
-    QFrame,
     QLabel,
-    QLineEdit,
     QMainWindow,
     QMessageBox,
-    QPushButton,
-    QWidget,
+    QVBoxLayout,
 )
 
 # Services are injected by controller - no direct imports needed
 from ..utils.error_handler import ErrorHandler
+from ..utils.helpers import (
+    METRIC_WIDGETS,
+    TIME_UNIT_SECONDS,
+    TOB_STATUS_TEXTS,
+    set_limit_text,
+    set_text_if_changed,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from PyQt6.QtWidgets import QLineEdit
+
+try:
+    # Generated by scripts/compile_ui.py from ui/main_window.ui
+    from .ui_main_window import Ui_MainWindow
+except ImportError:  # pragma: no cover - fall back to loading the .ui file
+    Ui_MainWindow = None
+
+# Designer source, resolved once at import
+_UI_FILE = str(Path(__file__).resolve().parent.parent.parent / "ui" / "main_window.ui")
+
+# Brackets and quotes stripped from the TOB "Comments" header
+_BRACKET_QUOTE_RE = re.compile(r"[\[\]'\"]")
+# Sensor string in a comment: T, digits, SD (e.g. "T0123SD")
+_SENSOR_RE = re.compile(r"T(\d+)SD")
+
+
+@functools.lru_cache(maxsize=4)
+def _load_form(ui_path: str):
+    """Compile a .ui file into its (form class, base class) pair once per path."""
+    return uic.loadUiType(ui_path)
+
+
+def _noop_log(*args, **kwargs) -> None:
+    """Stand-in for logger.debug when DEBUG logging is disabled."""
+
+
+class _MetricsSignals(QObject):
+    """Signals of a _MetricsWorker (QRunnable cannot declare signals)."""
+
+    metrics_ready = pyqtSignal(int, str, object)  # request id, file name, metrics
+
+
+class _MetricsWorker(QRunnable):
+    """Calculate TOB data metrics on a QThreadPool thread."""
+
+    def __init__(self, request_id: int, data_service, tob_data_model):
+        super().__init__()
+        self.signals = _MetricsSignals()
+        self._request_id = request_id
+        self._file_name = tob_data_model.file_name or ""
+        self._data_service = data_service
+        self._tob_data_model = tob_data_model
+
+    def run(self):
+        """Calculate the metrics and hand them back to the GUI thread."""
+        try:
+            metrics = self._data_service.calculate_metrics(self._tob_data_model)
+        except Exception as e:
+            logging.getLogger(__name__).error("Error calculating metrics: %s", e)
+            metrics = {}
+        self.signals.metrics_ready.emit(self._request_id, self._file_name, metrics)
 
 
 class MainWindow(QMainWindow):
@@ -57,6 +117,43 @@ class MainWindow(QMainWindow):
     quality_control_requested = pyqtSignal()  # Emitted when quality control button is clicked
     status_request_requested = pyqtSignal(str)  # Emitted when request status button is clicked (file_name)
 
+    # (widget attribute, signal, slot) connected by _connect_signals
+    _SIGNAL_BINDINGS = (
+        ("welcome_open_tob_button", "clicked", "_on_open_tob_file"),
+        ("welcome_open_project_button", "clicked", "_on_open_project"),
+        ("open_action", "triggered", "_on_open_tob_file"),
+        ("info_action", "triggered", "_on_show_header_info"),
+        ("exit_action", "triggered", "close"),
+        ("actionCreate_Project_File", "triggered", "_on_create_project"),
+        ("actionOpen_Project_File", "triggered", "_on_open_project"),
+        ("actionEdit_Project_Settings", "triggered", "_on_edit_project_settings"),
+        ("actionShow_Processing_List", "triggered", "_on_show_processing_list"),
+    )
+
+    # (sensor, checkbox object name) for NTC01 to NTC22, in display order
+    _NTC_CHECKBOX_NAMES = tuple(
+        (f"NTC{i:02d}", f"ntc_{i:02d}_checkbox") for i in range(1, 23)
+    )
+
+    # Legend placeholder label names per sensor, as named in the .ui file
+    _STYLE_LABEL_NAMES = {
+        "Temp": "pt100_style_label",
+        **{f"NTC{i:02d}": f"ntc{i:02d}_style_label" for i in range(1, 23)},
+    }
+
+    # Headers edited in the project container that hold numbers
+    _NUMERIC_HEADERS = frozenset({"Subconn_Length"})
+
+    # Status bar message per TOB file status, formatted with the file name
+    _STATUS_TEMPLATES = {
+        "loaded": "'{0}' loaded successfully",
+        "uploading": "Uploading '{0}'...",
+        "uploaded": "'{0}' uploaded to server",
+        "processing": "Processing '{0}' on server...",
+        "processed": "'{0}' processing completed",
+        "error": "Error with '{0}'",
+    }
+
     def __init__(self, controller=None):
         """
         Initialize the main window.
@@ -67,29 +164,90 @@ class MainWindow(QMainWindow):
         super().__init__()
 
         self.logger = logging.getLogger(__name__)
+        self.refresh_debug_logging()
         self.controller = controller
         self.error_handler = ErrorHandler()
 
+        # Widgets that exist only once the UI is loaded or the first file is
+        # plotted, so handlers can test them against None
+        self.welcome_container = None
+        self.plot_widget = None
+        self.tob_file_status_label = None
+        # Axis limit line edits per axis, filled once the UI is loaded
+        self._axis_limit_edits = {}
+        # Legend style indicators, built by _setup_style_indicators
+        self.style_indicators = {}
+        self._active_indicators = []
+
         # Services are injected by controller
         self.ui_state_manager = None
         self.ui_service = None
         self.axis_ui_service = None
         self.data_service = None
         self.plot_service = None
+        self.plot_style_service = None
 
         # UI state
         self.current_file_path: Optional[str] = None
         self.current_project_path: Optional[str] = None
         self.is_data_loaded = False
 
+        # Plot panel connections queued until the window is first shown
+        self._pending_connects: deque = deque()
+        self._deferring_connects = False
+        self._style_indicators_pending = False
+        self._post_paint_pending = False
+        # (file name, data model id) the plot info labels were last filled from
+        self._last_header_update = None
+        # (headers id, comment, subcon length) the project container shows
+        self._last_container_key = None
+        # (min, max) per column of the DataFrame the axis limits were last
+        # read from, held by weak reference so a closed file can be freed
+        self._column_limits: Dict[str, Optional[Tuple[float, float]]] = {}
+        self._column_limits_data = None
+
+        # TOBDataModel per plotted file name, kept only while something (the
+        # plot widget or controller) still references it
+        self._tob_model_cache: "weakref.WeakValueDictionary[str, Any]" = (
+            weakref.WeakValueDictionary()
+        )
+
+        # Processing list dialogs currently shown, refreshed on header edits
+        self._open_processing_dialogs: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+        # File dialog built on first use and reused for every open/save prompt
+        self._file_dialog = None
+
+        # Status bar message waiting for the next event-loop pass, so a burst
+        # of updates repaints the status bar once (at most ~60 Hz)
+        self._pending_status: Optional[Tuple[str, int]] = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(16)
+        self._status_timer.timeout.connect(self._flush_status)
+
+        # X axis unit waiting to be applied; rapid changes are applied once
+        self._pending_x_axis_type: Optional[str] = None
+        self._x_axis_change_scheduled = False
+
+        # Latest background metrics request; results of older ones are dropped
+        self._metrics_request_id = 0
+        self._metrics_worker = None
+
+        # Signal groups already connected, so repeated setup calls do not stack
+        # duplicate connections ("main", "axis", "controller")
+        self._signals_wired: set = set()
+        # Controller whose GUI operation signals are connected to this window
+        self._wired_controller = None
+
         # Setup UI components (services will be injected later if controller is provided)
         if controller:
             self.set_controller(controller)
         else:
             # Load UI without services
             self._setup_ui()
-            self._connect_signals()
             self._setup_menu_bar()
+            self._connect_signals()
             self._setup_status_bar()
 
     def set_services(self, services: Dict[str, Any]) -> None:
@@ -109,10 +267,10 @@ class MainWindow(QMainWindow):
         self.logger.info("Services injected successfully")
 
         # Setup UI components if not already done
-        if not hasattr(self, "welcome_container") or self.welcome_container is None:
+        if self.welcome_container is None:
             self._setup_ui()
-            self._connect_signals()
             self._setup_menu_bar()
+            self._connect_signals()
             self._setup_status_bar()
 
         # Setup UI state manager with container references
@@ -121,11 +279,7 @@ class MainWindow(QMainWindow):
             self.ui_state_manager.set_containers(
                 self.welcome_container, self.plot_container
             )
-            self.logger.info(
-                "UI state manager containers set - welcome: %s, plot: %s",
-                self.welcome_container is not None,
-                self.plot_container is not None,
-            )
+            self.logger.debug("UI state manager containers set")
         elif self.welcome_container and self.plot_container:
             # Containers are available but ui_state_manager not yet injected
             self.logger.debug("UI containers available, waiting for ui_state_manager injection")
@@ -142,6 +296,20 @@ class MainWindow(QMainWindow):
 
         self.logger.info("Main window initialized successfully")
 
+    def refresh_debug_logging(self) -> None:
+        """
+        Re-resolve the debug logger used by high-frequency signal handlers.
+
+        Axis and checkbox slots can fire many times per second, so they log via
+        ``self._dbg`` which is a no-op unless DEBUG is enabled. Call this after
+        changing the log level at runtime.
+        """
+        self._dbg = (
+            self.logger.debug
+            if self.logger.isEnabledFor(logging.DEBUG)
+            else _noop_log
+        )
+
     def _are_services_available(self) -> bool:
         """
         Check if all required services are available.
@@ -149,24 +317,29 @@ class MainWindow(QMainWindow):
         Returns:
             True if all services are injected, False otherwise
         """
-        required_services = [
+        return None not in (
             self.ui_state_manager,
             self.ui_service,
             self.axis_ui_service,
             self.data_service,
             self.plot_service,
             self.plot_style_service,
-        ]
-        return all(service is not None for service in required_services)
+        )
 
     def _setup_ui(self):
         """
         Set up the user interface components using the Qt Designer .ui file.
         """
         try:
-            # Load the UI file
-            ui_file_path = Path(__file__).parent.parent.parent / "ui" / "main_window.ui"
-            uic.loadUi(str(ui_file_path), self)
+            if Ui_MainWindow is not None:
+                # Pre-compiled UI module - no XML parsing at startup
+                form_class = Ui_MainWindow
+            else:
+                # Compile the UI file (cached for further windows)
+                form_class, _ = _load_form(_UI_FILE)
+
+            self._ui = form_class()
+            self._ui.setupUi(self)
 
             # Store references to important widgets
             self._store_widget_references()
@@ -189,78 +362,97 @@ class MainWindow(QMainWindow):
         """
         Store references to important UI widgets for easy access.
         """
+        # Index every named child once instead of walking the tree per lookup
+        # (one objectName() call per child; unnamed children share "" and are dropped)
+        self._widgets_by_name = {
+            child.objectName(): child for child in self.findChildren(QObject)
+        }
+        self._widgets_by_name.pop("", None)
+        widget = self._widgets_by_name.get
+
         # Welcome screen widgets
-        self.welcome_container = self.findChild(QWidget, "welcome_container")
-        self.welcome_open_tob_button = self.findChild(
-            QPushButton, "welcome_open_tob_button"
-        )
-        self.welcome_open_project_button = self.findChild(
-            QPushButton, "welcome_open_project_button"
-        )
+        self.welcome_container = widget("welcome_container")
+        self.welcome_open_tob_button = widget("welcome_open_tob_button")
+        self.welcome_open_project_button = widget("welcome_open_project_button")
 
         # Plot area widgets
-        self.plot_container = self.findChild(QFrame, "plot_container")
-        self.plot_canvas_container = self.findChild(QWidget, "plot_canvas_container")
-        self.plot_info_container = self.findChild(QFrame, "plot_info_container")
-
-        # Debug logging for plot containers
-        self.logger.info("Plot container found: %s", self.plot_container is not None)
-        self.logger.info(
-            "Plot canvas container found: %s", self.plot_canvas_container is not None
-        )
-        self.logger.info(
-            "Plot info container found: %s", self.plot_info_container is not None
-        )
+        self.plot_container = widget("plot_container")
+        self.plot_canvas_container = widget("plot_canvas_container")
+        self.plot_info_container = widget("plot_info_container")
 
         # Bottom container widgets
-        self.bottom_container = self.findChild(QFrame, "bottom_container")
-        self.data_metrics_frame = self.findChild(QFrame, "data_metrics_frame")
-        self.secondary_plot_control_frame = self.findChild(QFrame, "secondary_plot_control_frame")
-        self.project_control_frame = self.findChild(QFrame, "project_control_frame")
+        self.bottom_container = widget("bottom_container")
+        self.data_metrics_frame = widget("data_metrics_frame")
+        self.secondary_plot_control_frame = widget("secondary_plot_control_frame")
+        self.project_control_frame = widget("project_control_frame")
 
-        # Debug logging for bottom containers
-        self.logger.info("Bottom container found: %s", self.bottom_container is not None)
-        self.logger.info("Data metrics frame found: %s", self.data_metrics_frame is not None)
-        self.logger.info("Secondary plot control frame found: %s", self.secondary_plot_control_frame is not None)
-        self.logger.info("Project control frame found: %s", self.project_control_frame is not None)
+        # Debug logging for plot and bottom containers
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Plot containers found - plot: %s, canvas: %s, info: %s",
+                self.plot_container is not None,
+                self.plot_canvas_container is not None,
+                self.plot_info_container is not None,
+            )
+            self.logger.debug(
+                "Bottom containers found - bottom: %s, metrics: %s, "
+                "secondary plot control: %s, project control: %s",
+                self.bottom_container is not None,
+                self.data_metrics_frame is not None,
+                self.secondary_plot_control_frame is not None,
+                self.project_control_frame is not None,
+            )
 
         # Initialize plot widget (lazy initialization)
         self.plot_widget = None
 
         # Project info labels
-        self.cruise_info_label = self.findChild(QLabel, "cruise_info_label")
-        self.location_info_label = self.findChild(QLabel, "location_info_label")
+        self.cruise_info_label = widget("cruise_info_label")
+        self.location_info_label = widget("location_info_label")
 
         # NTC sensor checkboxes
-        self.ntc_checkboxes = {}
-        for i in range(1, 23):  # NTC01 to NTC22
-            checkbox_name = f"ntc_{i:02d}_checkbox"
-            checkbox = self.findChild(QCheckBox, checkbox_name)
-            if checkbox:
-                self.ntc_checkboxes[f"NTC{i:02d}"] = checkbox
+        self.ntc_checkboxes = {
+            sensor_name: self._widgets_by_name[checkbox_name]
+            for sensor_name, checkbox_name in self._NTC_CHECKBOX_NAMES
+            if checkbox_name in self._widgets_by_name
+        }
 
         # PT100 checkbox (stored as "Temp" in data)
-        self.ntc_pt100_checkbox = self.findChild(QCheckBox, "ntc_pt100_checkbox")
+        self.ntc_pt100_checkbox = widget("ntc_pt100_checkbox")
         if self.ntc_pt100_checkbox:
             self.ntc_checkboxes["Temp"] = self.ntc_pt100_checkbox
 
-        # plot_style_service is now injected by controller
+        # Sensors selected automatically when a TOB file is plotted
+        self._ntc_selectable = frozenset(
+            name
+            for name in self.ntc_checkboxes
+            if name.startswith("NTC") or name == "Temp"
+        )
 
-        # Create style indicators for NTC checkboxes (delayed setup)
-        from PyQt6.QtCore import QTimer
+        # plot_style_service is now injected by controller
 
-        QTimer.singleShot(100, self._setup_style_indicators)  # Delay by 100ms
+        # Create style indicators for NTC checkboxes once the window is shown
+        self._style_indicators_pending = True
 
         # Data metrics widgets
-        self.mean_hp_power_value = self.findChild(QLineEdit, "mean_hp_power_value")
-        self.max_v_accu_value = self.findChild(QLineEdit, "max_v_accu_value")
-        self.tilt_status_value = self.findChild(QLineEdit, "tilt_status_value")
-        self.mean_press_value = self.findChild(QLineEdit, "mean_press_value")
+        self.mean_hp_power_value = widget("mean_hp_power_value")
+        self.max_v_accu_value = widget("max_v_accu_value")
+        self.tilt_status_value = widget("tilt_status_value")
+        self.mean_press_value = widget("mean_press_value")
+        self._metrics_widgets = {
+            widget_name: getattr(self, widget_name) for _, widget_name in METRIC_WIDGETS
+        }
+        # (widget, metric key) pairs written by update_data_metrics
+        self._metric_targets = tuple(
+            (self._metrics_widgets[widget_name], key)
+            for key, widget_name in METRIC_WIDGETS
+            if self._metrics_widgets[widget_name]
+        )
 
         # Axis control widgets
-        self.y1_axis_combo = self.findChild(QComboBox, "y1_axis_combo")
-        self.y2_axis_combo = self.findChild(QComboBox, "y2_axis_combo")
-        self.x_axis_combo = self.findChild(QComboBox, "x_axis_combo")
+        self.y1_axis_combo = widget("y1_axis_combo")
+        self.y2_axis_combo = widget("y2_axis_combo")
+        self.x_axis_combo = widget("x_axis_combo")
 
         # Create axis_combos dictionary for service usage
         self.axis_combos = {
@@ -269,37 +461,40 @@ class MainWindow(QMainWindow):
             "x_axis_combo": self.x_axis_combo,
         }
 
-        self.y1_min_value = self.findChild(QLineEdit, "y1_min_value")
-        self.y1_max_value = self.findChild(QLineEdit, "y1_max_value")
-        self.y2_min_value = self.findChild(QLineEdit, "y2_min_value")
-        self.y2_max_value = self.findChild(QLineEdit, "y2_max_value")
-        self.x_min_value = self.findChild(QLineEdit, "x_min_value")
-        self.x_max_value = self.findChild(QLineEdit, "x_max_value")
+        self.y1_min_value = widget("y1_min_value")
+        self.y1_max_value = widget("y1_max_value")
+        self.y2_min_value = widget("y2_min_value")
+        self.y2_max_value = widget("y2_max_value")
+        self.x_min_value = widget("x_min_value")
+        self.x_max_value = widget("x_max_value")
+        # Manual limit edits per axis, enabled while auto mode is off
+        self._axis_limit_edits = {
+            "y1": (self.y1_min_value, self.y1_max_value),
+            "y2": (self.y2_min_value, self.y2_max_value),
+            "x": (self.x_min_value, self.x_max_value),
+        }
 
-        self.y1_auto_checkbox = self.findChild(QCheckBox, "y1_auto_checkbox")
-        self.y2_auto_checkbox = self.findChild(QCheckBox, "y2_auto_checkbox")
-        self.x_auto_checkbox = self.findChild(QCheckBox, "x_auto_checkbox")
+        self.y1_auto_checkbox = widget("y1_auto_checkbox")
+        self.y2_auto_checkbox = widget("y2_auto_checkbox")
+        self.x_auto_checkbox = widget("x_auto_checkbox")
 
         # Project control widgets
-        self.location_subcon_spin = self.findChild(
-            QDoubleSpinBox, "location_subcon_spin"
-        )
-        self.location_comment_value = self.findChild(
-            QLineEdit, "location_comment_value"
-        )
-        self.location_sensorstring_value = self.findChild(
-            QLineEdit, "location_sensorstring_value"
-        )
+        self.location_subcon_spin = widget("location_subcon_spin")
+        self.location_comment_value = widget("location_comment_value")
+        self.location_sensorstring_value = widget("location_sensorstring_value")
+        self._project_widgets = {
+            "cruise_info_label": self.cruise_info_label,
+            "location_info_label": self.location_info_label,
+            "location_comment_value": self.location_comment_value,
+            "location_sensorstring_value": self.location_sensorstring_value,
+            "location_subcon_spin": self.location_subcon_spin,
+        }
 
         # Action buttons
-        self.quality_control_button = self.findChild(
-            QPushButton, "quality_control_button"
-        )
-        self.send_data_button = self.findChild(QPushButton, "send_data_button")
-        self.request_status_button = self.findChild(
-            QPushButton, "request_status_button"
-        )
-        self.status_lineEdit = self.findChild(QLineEdit, "status_lineEdit")
+        self.quality_control_button = widget("quality_control_button")
+        self.send_data_button = widget("send_data_button")
+        self.request_status_button = widget("request_status_button")
+        self.status_lineEdit = widget("status_lineEdit")
 
         self.logger.debug("Widget references stored successfully")
 
@@ -307,9 +502,8 @@ class MainWindow(QMainWindow):
         """
         Initialize the UI to its default state.
         """
-        # Setup fonts and fix visibility using services
+        # Setup fonts using services
         self.ui_service.setup_fonts(self)
-        self.ui_service.fix_ui_visibility(self)
 
         # Show welcome screen initially (reset to initial state)
         self.ui_state_manager.reset_to_initial_state()
@@ -317,8 +511,10 @@ class MainWindow(QMainWindow):
         # Initialize project container editability (disabled by default)
         self.update_project_container_editability()
 
-        # Initialize axis controls
-        self._initialize_axis_controls()
+        # Visibility fixes and axis controls are not needed for the welcome
+        # screen; run them on the first event loop pass
+        self._post_paint_pending = True
+        QTimer.singleShot(0, self._post_paint_init)
 
         # Initialize plot widget (now that services are available)
         # Note: Plot widget is now initialized lazily when first needed
@@ -330,16 +526,26 @@ class MainWindow(QMainWindow):
 
         self.logger.debug("UI state initialized")
 
+    def _post_paint_init(self):
+        """
+        Finish UI initialization that can wait until after the first paint.
+        """
+        if not self._post_paint_pending:
+            return
+        self._post_paint_pending = False
+
+        self.ui_service.fix_ui_visibility(self)
+        self._initialize_axis_controls()
+
+        # Hidden fallback indicators must not be made visible by the pass above
+        self._ensure_style_indicators()
+
     def _ensure_plot_widget(self):
         """
         Ensure plot widget is initialized and available.
         """
-        if not hasattr(self, "plot_widget") or self.plot_widget is None:
-            if (
-                hasattr(self, "plot_service")
-                and self.plot_service
-                and self.plot_canvas_container
-            ):
+        if self.plot_widget is None:
+            if self.plot_service and self.plot_canvas_container:
                 self.logger.info("Creating plot widget on demand...")
                 self._initialize_plot_widget()
             else:
@@ -354,38 +560,19 @@ class MainWindow(QMainWindow):
         Initialize the plot widget for data visualization.
         """
         try:
-            self.logger.info("Initializing plot widget...")
-
             if self.plot_canvas_container:
-                self.logger.info("Plot canvas container found, creating plot widget")
-
                 # Create plot widget
                 self.plot_widget = self.plot_service.create_plot_widget(
                     self.plot_canvas_container
                 )
-                self.logger.info("Plot widget created successfully")
-
-                # Add plot widget to the container layout
-                from PyQt6.QtWidgets import QVBoxLayout
-
-                # Check if container already has a layout
-                existing_layout = self.plot_canvas_container.layout()
-                if existing_layout:
-                    # Clear existing layout properly
-                    while existing_layout.count():
-                        child = existing_layout.takeAt(0)
-                        if child.widget():
-                            child.widget().setParent(None)
-                    # Remove the layout from the widget
-                    self.plot_canvas_container.setLayout(None)
-                    # Don't delete the layout immediately to avoid issues
-                    existing_layout.setParent(None)
-
-                # Create new layout
-                layout = QVBoxLayout()
-                layout.addWidget(self.plot_widget)
+
+                # Add plot widget to the container layout, reusing it if the
+                # .ui file provides one (the plot widget is only created once)
+                layout = self.plot_canvas_container.layout() or QVBoxLayout(
+                    self.plot_canvas_container
+                )
                 layout.setContentsMargins(0, 0, 0, 0)
-                self.plot_canvas_container.setLayout(layout)
+                layout.addWidget(self.plot_widget)
 
                 # Make sure the plot widget is visible
                 self.plot_widget.setVisible(True)
@@ -412,7 +599,7 @@ class MainWindow(QMainWindow):
         # Use axis UI service for control initialization
         # Get time range if controller is available
         time_range = None
-        if hasattr(self, "controller") and self.controller:
+        if self.controller:
             time_range = self.controller.get_time_range()
         self.axis_ui_service.setup_axis_controls(self, time_range)
 
@@ -421,30 +608,22 @@ class MainWindow(QMainWindow):
         Set up the menu bar and connect actions.
         """
         # File menu actions
-        self.open_action = self.findChild(QAction, "open_action")
-        self.info_action = self.findChild(QAction, "info_action")
-        self.exit_action = self.findChild(QAction, "exit_action")
+        self.open_action = self._widgets_by_name.get("open_action")
+        self.info_action = self._widgets_by_name.get("info_action")
+        self.exit_action = self._widgets_by_name.get("exit_action")
 
         # Project menu actions
-        self.actionCreate_Project_File = self.findChild(
-            QAction, "actionCreate_Project_File"
-        )
-        self.actionOpen_Project_File = self.findChild(
-            QAction, "actionOpen_Project_File"
-        )
-        self.actionEdit_Project_Settings = self.findChild(
-            QAction, "actionEdit_Project_Settings"
-        )
-        self.actionShow_Processing_List = self.findChild(
-            QAction, "actionShow_Processing_List"
-        )
+        self.actionCreate_Project_File = self._widgets_by_name.get("actionCreate_Project_File")
+        self.actionOpen_Project_File = self._widgets_by_name.get("actionOpen_Project_File")
+        self.actionEdit_Project_Settings = self._widgets_by_name.get("actionEdit_Project_Settings")
+        self.actionShow_Processing_List = self._widgets_by_name.get("actionShow_Processing_List")
 
         # Tools menu actions
-        self.actionEnglish = self.findChild(QAction, "actionEnglish")
-        self.actionGerman = self.findChild(QAction, "actionGerman")
-        self.actionToggle_Sidebar = self.findChild(QAction, "actionToggle_Sidebar")
-        self.actionSelect_all = self.findChild(QAction, "actionSelect_all")
-        self.actionDeseselct_all = self.findChild(QAction, "actionDeseselct_all")
+        self.actionEnglish = self._widgets_by_name.get("actionEnglish")
+        self.actionGerman = self._widgets_by_name.get("actionGerman")
+        self.actionToggle_Sidebar = self._widgets_by_name.get("actionToggle_Sidebar")
+        self.actionSelect_all = self._widgets_by_name.get("actionSelect_all")
+        self.actionDeseselct_all = self._widgets_by_name.get("actionDeseselct_all")
 
         self.logger.debug("Menu bar setup completed")
 
@@ -452,12 +631,11 @@ class MainWindow(QMainWindow):
         """
         Set up the status bar.
         """
-        self.statusbar = self.findChild(QWidget, "statusbar")
+        self.statusbar = self._widgets_by_name.get("statusbar")
         if self.statusbar:
             self.statusbar.showMessage("Ready")
 
             # Add permanent TOB file info label to status bar
-            from PyQt6.QtWidgets import QLabel
             self.tob_file_status_label = QLabel("No TOB file loaded")
             self.tob_file_status_label.setStyleSheet("font-weight: bold; color: #3AAA35;")
             self.statusbar.addPermanentWidget(self.tob_file_status_label)
@@ -473,7 +651,7 @@ class MainWindow(QMainWindow):
         """
         try:
             # Update status bar
-            if hasattr(self, 'tob_file_status_label') and self.tob_file_status_label:
+            if self.tob_file_status_label:
                 if file_name:
                     status_text = f"TOB: {file_name}"
                 else:
@@ -507,15 +685,15 @@ class MainWindow(QMainWindow):
             # Get TOB header data from the currently loaded TOB file
             cruise_value = "-"
             station_value = "-"
+            tob_data_model = None
 
             if file_name:
                 # Try to get header data from plot widget first (currently displayed)
-                tob_data_model = None
+                plot_widget = getattr(self, "plot_widget", None)
+                if plot_widget:
+                    tob_data_model = getattr(plot_widget, "tob_data_model", None)
 
-                if (hasattr(self, 'plot_widget') and self.plot_widget and
-                    hasattr(self.plot_widget, 'tob_data_model') and
-                    self.plot_widget.tob_data_model):
-                    tob_data_model = self.plot_widget.tob_data_model
+                if tob_data_model:
                     self.logger.debug("Using header data from plot widget")
 
                 # Fallback to controller data
@@ -523,16 +701,22 @@ class MainWindow(QMainWindow):
                     tob_data_model = self.controller.tob_data_model
                     self.logger.debug("Using header data from controller")
 
-                # Extract header values
-                if tob_data_model and tob_data_model.headers:
-                    cruise_value = tob_data_model.headers.get('Cruise', '-')
-                    station_value = tob_data_model.headers.get('Station', '-')
+            # Labels already show the headers of this file
+            header_key = (file_name, id(tob_data_model))
+            if header_key == self._last_header_update:
+                return
+
+            # Extract header values
+            if tob_data_model and tob_data_model.headers:
+                cruise_value = tob_data_model.headers.get('Cruise', '-')
+                station_value = tob_data_model.headers.get('Station', '-')
 
-                    # Handle different data types (some headers might be lists)
-                    if isinstance(cruise_value, list):
-                        cruise_value = cruise_value[0] if cruise_value else '-'
-                    if isinstance(station_value, list):
-                        station_value = station_value[0] if station_value else '-'
+                # Some headers are parsed as lists; plain strings are the common
+                # case and skip straight through the exact type check
+                if type(cruise_value) is list:
+                    cruise_value = cruise_value[0] if cruise_value else '-'
+                if type(station_value) is list:
+                    station_value = station_value[0] if station_value else '-'
 
             # Update the labels
             if self.cruise_info_label:
@@ -541,6 +725,8 @@ class MainWindow(QMainWindow):
             if self.location_info_label:
                 self.location_info_label.setText(f"Station: {station_value}")
 
+            self._last_header_update = header_key
+
             self.logger.debug("Plot info labels updated - Cruise: %s, Station: %s",
                             cruise_value, station_value)
 
@@ -551,89 +737,137 @@ class MainWindow(QMainWindow):
         """
         Connect UI signals to their respective handlers.
         """
-        # Welcome screen buttons
-        if self.welcome_open_tob_button:
-            self.welcome_open_tob_button.clicked.connect(self._on_open_tob_file)
-
-        if self.welcome_open_project_button:
-            self.welcome_open_project_button.clicked.connect(self._on_open_project)
-
-        # Menu actions
-        if self.open_action:
-            self.open_action.triggered.connect(self._on_open_tob_file)
-
-        if self.info_action:
-            self.info_action.triggered.connect(self._on_show_header_info)
-
-        if self.exit_action:
-            self.exit_action.triggered.connect(self.close)
-
-        if self.actionCreate_Project_File:
-            self.actionCreate_Project_File.triggered.connect(self._on_create_project)
+        if "main" in self._signals_wired:
+            return
+        self._signals_wired.add("main")
+
+        # Welcome screen buttons and menu actions
+        for attr, signal_name, slot_name in self._SIGNAL_BINDINGS:
+            source = getattr(self, attr, None)
+            if source:
+                getattr(source, signal_name).connect(getattr(self, slot_name))
+
+        # Plot panel controls are hidden behind the welcome screen, so their
+        # connections are made once the window has been shown
+        with self._defer_connects():
+            # NTC checkbox changes (toggled delivers the checked state as a bool),
+            # all dispatched through one slot that maps the sender to its sensor
+            self._checkbox_to_sensor = {
+                checkbox: sensor_name
+                for sensor_name, checkbox in self.ntc_checkboxes.items()
+            }
+            for checkbox in self.ntc_checkboxes.values():
+                self._connect(
+                    checkbox.toggled,
+                    self._on_sensor_checkbox_toggled,
+                    checkbox.isChecked,
+                )
 
-        if self.actionOpen_Project_File:
-            self.actionOpen_Project_File.triggered.connect(self._on_open_project)
+            # Axis auto mode changes, dispatched by sender like the sensors
+            self._auto_checkbox_to_axis = {
+                auto_checkbox: axis
+                for axis, auto_checkbox in (
+                    ("y1", self.y1_auto_checkbox),
+                    ("y2", self.y2_auto_checkbox),
+                    ("x", self.x_auto_checkbox),
+                )
+                if auto_checkbox
+            }
+            for auto_checkbox in self._auto_checkbox_to_axis:
+                self._connect(
+                    auto_checkbox.toggled,
+                    self._on_axis_auto_toggled,
+                    auto_checkbox.isChecked,
+                )
 
-        if self.actionEdit_Project_Settings:
-            self.actionEdit_Project_Settings.triggered.connect(
-                self._on_edit_project_settings
-            )
+        # Axis combo box changes - only connect if controller is available
+        if self.controller:
+            self._connect_axis_signals()
 
-        if self.actionShow_Processing_List:
-            self.actionShow_Processing_List.triggered.connect(
-                self._on_show_processing_list
-            )
+    @contextmanager
+    def _defer_connects(self):
+        """
+        Queue connections made through _connect instead of making them immediately.
+        """
+        self._deferring_connects = True
+        try:
+            yield
+        finally:
+            self._deferring_connects = False
 
-        # NTC checkbox changes
-        for sensor_name, checkbox in self.ntc_checkboxes.items():
-            checkbox.stateChanged.connect(
-                lambda state, name=sensor_name: self._on_sensor_selection_changed(
-                    name, state
-                )
-            )
+    def _connect(self, signal, slot, state=None) -> None:
+        """
+        Connect a signal to a slot, or queue the pair while deferring.
 
-        # Axis control changes
-        if self.y1_auto_checkbox:
-            self.y1_auto_checkbox.stateChanged.connect(self._on_y1_auto_changed)
+        Args:
+            signal: Bound signal to connect
+            slot: Callable to invoke when the signal is emitted
+            state: Optional getter for the value the signal carries; a value
+                changed while the connection was queued is emitted on flush
+        """
+        if self._deferring_connects:
+            baseline = state() if state is not None else None
+            self._pending_connects.append((signal, slot, state, baseline))
+        else:
+            signal.connect(slot)
 
-        if self.y2_auto_checkbox:
-            self.y2_auto_checkbox.stateChanged.connect(self._on_y2_auto_changed)
+    def _flush_connects(self) -> None:
+        """
+        Make all queued connections and replay state changed in the meantime.
+        """
+        pending = self._pending_connects
+        while pending:
+            signal, slot, state, baseline = pending.popleft()
+            signal.connect(slot)
+            if state is not None:
+                value = state()
+                if value != baseline:
+                    # Set programmatically (setChecked) before the slot existed
+                    signal.emit(value)
 
-        if self.x_auto_checkbox:
-            self.x_auto_checkbox.stateChanged.connect(self._on_x_auto_changed)
+    def showEvent(self, event):
+        """
+        Make queued connections on the first event loop pass after showing.
 
-        # Axis combo box changes - only connect if controller is available
-        if self.controller:
-            self._connect_axis_signals()
+        Args:
+            event: The show event
+        """
+        super().showEvent(event)
+        self._ensure_style_indicators()
+        if self._pending_connects:
+            QTimer.singleShot(0, self._flush_connects)
 
     def _connect_axis_signals(self):
         """
         Connect axis control signals that require controller.
         """
-        if hasattr(self, "y1_axis_combo") and self.y1_axis_combo:
+        # Nothing to connect until the UI is loaded; set_controller may run before
+        if "axis" in self._signals_wired or not self._axis_limit_edits:
+            return
+        self._signals_wired.add("axis")
+
+        # Combos are compared against None: an empty QComboBox is falsy
+        if getattr(self, "y1_axis_combo", None) is not None:
             self.y1_axis_combo.currentTextChanged.connect(self._on_y1_axis_changed)
 
-        if hasattr(self, "y2_axis_combo") and self.y2_axis_combo:
+        if getattr(self, "y2_axis_combo", None) is not None:
             self.y2_axis_combo.currentTextChanged.connect(self._on_y2_axis_changed)
 
-        if hasattr(self, "x_axis_combo") and self.x_axis_combo:
+        if getattr(self, "x_axis_combo", None) is not None:
             self.x_axis_combo.currentTextChanged.connect(self._on_x_axis_changed)
 
-        # Connect manual axis value changes
-        if hasattr(self, "x_min_value") and self.x_min_value:
-            self.x_min_value.textChanged.connect(self._on_x_axis_limits_changed)
-        if hasattr(self, "x_max_value") and self.x_max_value:
-            self.x_max_value.textChanged.connect(self._on_x_axis_limits_changed)
-
-        if hasattr(self, "y1_min_value") and self.y1_min_value:
-            self.y1_min_value.textChanged.connect(self._on_y1_axis_limits_changed)
-        if hasattr(self, "y1_max_value") and self.y1_max_value:
-            self.y1_max_value.textChanged.connect(self._on_y1_axis_limits_changed)
-
-        if hasattr(self, "y2_min_value") and self.y2_min_value:
-            self.y2_min_value.textChanged.connect(self._on_y2_axis_limits_changed)
-        if hasattr(self, "y2_max_value") and self.y2_max_value:
-            self.y2_max_value.textChanged.connect(self._on_y2_axis_limits_changed)
+        # Connect manual axis value changes once editing is finished (Enter or
+        # focus loss) rather than on every keystroke, which would re-plot per
+        # character
+        limit_slots = {
+            "x": self._on_x_axis_limits_changed,
+            "y1": self._on_y1_axis_limits_changed,
+            "y2": self._on_y2_axis_limits_changed,
+        }
+        for axis, limit_edits in self._axis_limit_edits.items():
+            for limit_edit in limit_edits:
+                if limit_edit:
+                    limit_edit.editingFinished.connect(limit_slots[axis])
 
         self.logger.debug("Axis control signals connected")
 
@@ -653,18 +887,44 @@ class MainWindow(QMainWindow):
 
         self.logger.debug("Controller set and axis signals connected")
 
-        # Connect GUI operation signals (thread-safe)
-        self.controller.show_upload_success.connect(self._on_show_upload_success)
-        self.controller.show_server_status.connect(self._on_show_server_status)
-
-        # Connect error handler signals (thread-safe)
-        self.error_handler.error_occurred.connect(self._on_error_occurred)
-        self.error_handler.warning_occurred.connect(self._on_warning_occurred)
-        self.error_handler.info_message.connect(self._on_info_message)
+        # GUI operation and error handler signals may be emitted from worker
+        # threads; queue them explicitly so the dialogs always open on the
+        # GUI thread
+        queued = Qt.ConnectionType.QueuedConnection
+        if controller is not self._wired_controller:
+            controller_slots = (
+                ("show_upload_success", self._on_show_upload_success),
+                ("show_server_status", self._on_show_server_status),
+            )
+            if self._wired_controller is not None:
+                for signal_name, slot in controller_slots:
+                    try:
+                        getattr(self._wired_controller, signal_name).disconnect(slot)
+                    except TypeError:
+                        # Already disconnected, e.g. the old controller was deleted
+                        pass
+            if controller is not None:
+                for signal_name, slot in controller_slots:
+                    getattr(controller, signal_name).connect(slot, queued)
+            self._wired_controller = controller
+
+        # The window's own connections are only made on the first call
+        first_call = "controller" not in self._signals_wired
+        self._signals_wired.add("controller")
+
+        if first_call:
+            self.error_handler.error_occurred.connect(self._on_error_occurred, queued)
+            self.error_handler.warning_occurred.connect(
+                self._on_warning_occurred, queued
+            )
+            self.error_handler.info_message.connect(self._on_info_message, queued)
 
         # Initialize UI state now that services are available
         self._initialize_ui_state()
 
+        if not first_call:
+            return
+
         # Action buttons
         if self.quality_control_button:
             self.quality_control_button.clicked.connect(self._on_quality_control)
@@ -679,9 +939,6 @@ class MainWindow(QMainWindow):
         if self.location_comment_value:
             self.location_comment_value.editingFinished.connect(self._on_location_comment_changed)
 
-        if self.location_sensorstring_value:
-            self.location_sensorstring_value.editingFinished.connect(self._on_location_sensorstring_changed)
-
         if self.location_subcon_spin:
             self.location_subcon_spin.valueChanged.connect(self._on_location_subcon_changed)
 
@@ -698,6 +955,9 @@ class MainWindow(QMainWindow):
         """
         Show the plot area and hide welcome screen.
         """
+        # The plot panel controls must be live once they are visible
+        self._flush_connects()
+        self._ensure_style_indicators()
         if self.ui_state_manager:
             self.ui_state_manager.show_plot_mode()
         self.logger.debug("Plot area displayed")
@@ -709,34 +969,23 @@ class MainWindow(QMainWindow):
         Returns:
             Dictionary mapping metric names to widget references
         """
-        return {
-            "mean_hp_power_value": self.mean_hp_power_value,
-            "max_v_accu_value": self.max_v_accu_value,
-            "tilt_status_value": self.tilt_status_value,
-            "mean_press_value": self.mean_press_value,
-        }
+        return self._metrics_widgets
 
     def _reset_data_metrics(self):
         """
         Reset data metrics to default values.
         """
         # Use data service for metrics reset
-        metrics_widgets = self.get_metrics_widgets()
-        self.data_service.reset_data_metrics(metrics_widgets)
+        self.data_service.reset_data_metrics(self._metrics_widgets)
 
     def _reset_project_info(self):
         """
         Reset project information to default values.
         """
         # Use UI service for project info reset
-        project_widgets = {
-            "cruise_info_label": self.cruise_info_label,
-            "location_info_label": self.location_info_label,
-            "location_comment_value": self.location_comment_value,
-            "location_sensorstring_value": self.location_sensorstring_value,
-            "location_subcon_spin": self.location_subcon_spin,
-        }
-        self.ui_service.reset_ui_widgets(project_widgets)
+        self.ui_service.reset_ui_widgets(self._project_widgets)
+        # The reset cleared the plot info labels
+        self._last_header_update = None
 
         # Also reset project container widgets
         self.update_project_container(None)
@@ -748,8 +997,8 @@ class MainWindow(QMainWindow):
         Handle opening a TOB file.
         """
         try:
-            file_path, _ = QFileDialog.getOpenFileName(
-                self, "Open TOB File", "", "TOB Files (*.tob *.TOB);;All Files (*)"
+            file_path = self._prompt_file_path(
+                "Open TOB File", "TOB Files (*.tob *.TOB);;All Files (*)"
             )
 
             if file_path:
@@ -764,6 +1013,45 @@ class MainWindow(QMainWindow):
             self.logger.error("Unexpected error opening TOB file: %s", e)
             self.error_handler.handle_error(e, self, "File Open Error")
 
+    def _prompt_file_path(
+        self, caption: str, name_filter: str, save: bool = False, default_name: str = ""
+    ) -> str:
+        """
+        Ask the user for a file path using the shared file dialog.
+
+        Args:
+            caption: Dialog window title
+            name_filter: File type filters, separated by ";;"
+            save: Whether to ask for a file to save instead of an existing file
+            default_name: File name preselected in the dialog
+
+        Returns:
+            The selected file path, or an empty string if the dialog was cancelled
+        """
+        if self._file_dialog is None:
+            self._file_dialog = QFileDialog(self)
+            # Skip per-entry icon lookups and symlink resolution, which stall
+            # the dialog on large or network-mounted directories
+            self._file_dialog.setOptions(
+                QFileDialog.Option.DontUseCustomDirectoryIcons
+                | QFileDialog.Option.DontResolveSymlinks
+            )
+
+        dialog = self._file_dialog
+        dialog.setWindowTitle(caption)
+        dialog.setNameFilter(name_filter)
+        if save:
+            dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+            dialog.setFileMode(QFileDialog.FileMode.AnyFile)
+        else:
+            dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptOpen)
+            dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+        dialog.selectFile(default_name)
+
+        if dialog.exec() and dialog.selectedFiles():
+            return dialog.selectedFiles()[0]
+        return ""
+
     def _on_show_header_info(self):
         """
         Handle showing TOB file header information.
@@ -774,9 +1062,7 @@ class MainWindow(QMainWindow):
             tob_data_model = None
 
             # Check plot widget first (currently displayed TOB file)
-            if (hasattr(self, 'plot_widget') and self.plot_widget and
-                hasattr(self.plot_widget, 'tob_data_model') and
-                self.plot_widget.tob_data_model):
+            if self.plot_widget and self.plot_widget.tob_data_model is not None:
                 tob_data_model = self.plot_widget.tob_data_model
                 self.logger.debug("Using TOB data from plot widget (currently displayed)")
 
@@ -816,11 +1102,8 @@ class MainWindow(QMainWindow):
         Handle opening a project file.
         """
         try:
-            file_path, _ = QFileDialog.getOpenFileName(
-                self,
-                "Open Project File",
-                "",
-                "WIZARD Project Files (*.wzp);;All Files (*)",
+            file_path = self._prompt_file_path(
+                "Open Project File", "WIZARD Project Files (*.wzp);;All Files (*)"
             )
 
             if file_path:
@@ -852,12 +1135,12 @@ class MainWindow(QMainWindow):
                     project_dialog.get_project_data()
                 )
 
-                # Now get file path for saving
-                file_path, _ = QFileDialog.getSaveFileName(
-                    self,
+                # Now get file path for saving, suggesting one based on the name
+                file_path = self._prompt_file_path(
                     "Create Project File",
-                    f"{name}.wzp",  # Suggest filename based on project name
                     "WIZARD Project Files (*.wzp);;All Files (*)",
+                    save=True,
+                    default_name=f"{name}.wzp",
                 )
 
                 if file_path:
@@ -892,7 +1175,6 @@ class MainWindow(QMainWindow):
             # Check if a project is currently loaded
             if (
                 not self.current_project_path
-                or not hasattr(self.controller, "project_model")
                 or not self.controller.project_model
             ):
                 self.error_handler.handle_error(
@@ -978,8 +1260,12 @@ class MainWindow(QMainWindow):
             dialog.file_removed.connect(self._on_tob_file_removed)
             dialog.status_updated.connect(self._on_tob_file_status_updated)
 
-            # Show dialog
-            dialog.exec()
+            # Show dialog, registered for refreshes while it is open
+            self._open_processing_dialogs.add(dialog)
+            try:
+                dialog.exec()
+            finally:
+                self._open_processing_dialogs.discard(dialog)
 
         except Exception as e:
             self.logger.error("Unexpected error showing processing list: %s", e)
@@ -993,7 +1279,7 @@ class MainWindow(QMainWindow):
             file_name: Name of the selected TOB file
         """
         try:
-            self.logger.info(f"Attempting to plot TOB file: {file_name}")
+            self.logger.info("Attempting to plot TOB file: %s", file_name)
 
             if not self.controller or not self.controller.project_model:
                 self.logger.error("No project controller available")
@@ -1005,7 +1291,7 @@ class MainWindow(QMainWindow):
             # Get TOB file data
             tob_file = self.controller.project_model.get_tob_file(file_name)
             if not tob_file:
-                self.logger.error(f"TOB file '{file_name}' not found in project")
+                self.logger.error("TOB file '%s' not found in project", file_name)
                 self.error_handler.handle_error(
                     ValueError(f"TOB file '{file_name}' not found in project"),
                     "File Not Found",
@@ -1013,23 +1299,15 @@ class MainWindow(QMainWindow):
                 )
                 return
 
-            self.logger.info(f"Found TOB file: {tob_file.file_name}")
-            self.logger.info(f"TOB data exists: {tob_file.tob_data is not None}")
+            self.logger.info("Found TOB file: %s", tob_file.file_name)
+            self.logger.info("TOB data exists: %s", tob_file.tob_data is not None)
 
-            if tob_file.tob_data:
-                self.logger.info(
-                    f"DataFrame exists: {tob_file.tob_data.data is not None}"
-                )
-                if tob_file.tob_data.data is not None:
-                    self.logger.info(f"DataFrame shape: {tob_file.tob_data.data.shape}")
-                    self.logger.info(f"DataFrame empty: {tob_file.tob_data.data.empty}")
+            df = tob_file.tob_data.data if tob_file.tob_data else None
+            if df is not None:
+                self.logger.info("DataFrame shape: %s", df.shape)
 
-            if (
-                not tob_file.tob_data
-                or tob_file.tob_data.data is None
-                or tob_file.tob_data.data.empty
-            ):
-                self.logger.error(f"TOB file '{file_name}' has no data to plot")
+            if df is None or df.empty:
+                self.logger.error("TOB file '%s' has no data to plot", file_name)
                 self.error_handler.handle_error(
                     ValueError(f"TOB file '{file_name}' has no data to plot"),
                     "No Plot Data",
@@ -1046,90 +1324,128 @@ class MainWindow(QMainWindow):
                 )
                 return
 
-            # Create TOBDataModel from project data
-            from ..models.tob_data_model import TOBDataModel
-
-            tob_data_model = TOBDataModel(
-                headers=tob_file.tob_data.headers or {},
-                data=tob_file.tob_data.data,
-                file_path=tob_file.file_path,
-                file_name=tob_file.file_name,
-            )
+            # Data summary recorded when the file was loaded into the project
+            data_points = tob_file.data_points
+            if data_points is None:
+                data_points = len(df)
+            sensors = tob_file.sensors or []
+            sensor_count = len(sensors)
+
+            # Reuse the TOBDataModel of a re-selected file while it still wraps
+            # the same DataFrame, otherwise create it from project data
+            tob_data_model = self._tob_model_cache.get(file_name)
+            if tob_data_model is None or tob_data_model.data is not df:
+                from ..models.tob_data_model import TOBDataModel
+
+                tob_data_model = TOBDataModel(
+                    headers=tob_file.tob_data.headers or {},
+                    data=df,
+                    file_path=tob_file.file_path,
+                    file_name=tob_file.file_name,
+                    data_points=data_points,
+                    sensors=sensors,
+                )
+                self._tob_model_cache[file_name] = tob_data_model
 
             # Check memory usage before loading
-            memory_mb = tob_file.tob_data.data.memory_usage(deep=True).sum() / (
-                1024 * 1024
-            )
+            memory_mb = tob_file.tob_data.get_memory_mb()
             if memory_mb > 500:  # Warn if over 500MB
                 # For now, just show a warning but continue loading
                 # TODO: Implement proper user confirmation dialog via signals
-                self.logger.warning(f"Loading large dataset: {memory_mb:.1f}MB")
+                self.logger.warning("Loading large dataset: %.1fMB", memory_mb)
                 # Continue with loading for now
 
             # Update plot widget with TOB data
             self.plot_widget.update_data(tob_data_model)
 
             # Inform controller about the newly active TOB data
-            if hasattr(self.controller, "set_current_tob_data"):
-                self.controller.set_current_tob_data(tob_data_model)
+            self.controller.set_current_tob_data(tob_data_model)
 
             # Set as active TOB file
             self.controller.project_model.set_active_tob_file(file_name)
 
             # Update project container status after changing active file
-            if hasattr(self, "update_project_container_status"):
-                self.update_project_container_status()
-
-            # Calculate and update data metrics
-            if self.controller and hasattr(self.controller, "data_service"):
-                try:
-                    metrics = self.controller.data_service._calculate_metrics(
-                        tob_data_model
-                    )
-                    self.logger.info("TOB metrics calculated for manual plotting")
+            self.update_project_container_status()
 
-                            # Update data metrics in view
-                    self.controller.data_service.update_data_metrics(
-                        self.get_metrics_widgets(), metrics
-                    )
-                except Exception as e:
-                    self.logger.error(
-                        "Failed to calculate data metrics for manual plotting: %s", e
-                    )
+            # Calculate data metrics off the GUI thread; _apply_metrics fills
+            # the metric fields once they are ready
+            self._start_metrics_worker(tob_data_model)
 
             # Update status bar with TOB file information
-            if hasattr(self, 'update_tob_file_status_bar'):
-                file_name = tob_data_model.file_name or "Unknown"
-                data_points = tob_data_model.data_points or 0
-                sensors_count = len(tob_data_model.sensors) if tob_data_model.sensors else 0
-                self.update_tob_file_status_bar(file_name, data_points, sensors_count)
+            file_name = tob_data_model.file_name or "Unknown"
+            self.update_tob_file_status_bar(file_name, data_points, sensor_count)
 
             # Update UI elements
             self._update_ui_for_tob_plot(tob_file)
 
             # Update project container with TOB header data
-            if hasattr(self, "update_project_container"):
-                self.update_project_container(tob_data_model)
+            self.update_project_container(tob_data_model)
 
             # Show status message
-            sensor_count = len(tob_file.sensors) if tob_file.sensors else 0
-            data_points = (
-                len(tob_file.tob_data.data) if tob_file.tob_data.data is not None else 0
-            )
-
             self.show_status_message(
                 f"Loaded '{file_name}' for plotting: {data_points} data points, {sensor_count} sensors"
             )
 
             self.logger.info(
-                f"Successfully loaded TOB file '{file_name}' for plotting: "
-                f"{data_points} points, {sensor_count} sensors"
+                "Successfully loaded TOB file '%s' for plotting: %d points, %d sensors",
+                file_name,
+                data_points,
+                sensor_count,
             )
 
         except Exception as e:
-            self.logger.error(f"Error selecting TOB file for plot: {e}")
+            self.logger.error("Error selecting TOB file for plot: %s", e)
             self.error_handler.handle_error(e, self, "TOB File Selection Error")
 
+    def _start_metrics_worker(self, tob_data_model):
+        """
+        Calculate data metrics for the plotted TOB file on the thread pool.
+
+        Args:
+            tob_data_model: TOBDataModel that was just plotted
+        """
+        self._metrics_request_id += 1
+        worker = _MetricsWorker(
+            self._metrics_request_id, self.controller.data_service, tob_data_model
+        )
+        worker.signals.metrics_ready.connect(
+            self._apply_metrics, Qt.ConnectionType.QueuedConnection
+        )
+        # Keep the signals object alive until its result has been delivered
+        self._metrics_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _apply_metrics(self, request_id: int, file_name: str, metrics: Dict[str, Any]):
+        """
+        Show metrics calculated by a _MetricsWorker.
+
+        Args:
+            request_id: Request the metrics belong to
+            file_name: TOB file the metrics were calculated for
+            metrics: Calculated metrics
+        """
+        if request_id != self._metrics_request_id:
+            # Another file was plotted while these metrics were calculated
+            return
+        self._metrics_worker = None
+        if self.controller is None or self.plot_widget is None:
+            return
+
+        # The plot may have been cleared or replaced without a new request
+        current = self.plot_widget.tob_data_model
+        if current is None or (current.file_name or "") != file_name:
+            self.logger.debug("Dropping metrics for no longer shown %s", file_name)
+            return
+        try:
+            self.controller.data_service.update_data_metrics(
+                self.get_metrics_widgets(), metrics
+            )
+            self.logger.info("TOB metrics calculated for manual plotting")
+        except Exception as e:
+            self.logger.error(
+                "Failed to update data metrics for manual plotting: %s", e
+            )
+
     def _update_ui_for_tob_plot(self, tob_file):
         """
         Update UI elements when a TOB file is loaded for plotting.
@@ -1138,47 +1454,49 @@ class MainWindow(QMainWindow):
             tob_file: TOBFileInfo object
         """
         try:
-            # Update sensor checkboxes - select only available NTC sensors
-            # Clear current selections
-            for checkbox in self.ntc_checkboxes.values():
-                checkbox.setChecked(False)
-
-            # Select only sensors that are actually available in the TOB file
+            # Update sensor checkboxes in one pass - select only the NTC sensors
+            # available in the TOB file. Signals are blocked so the controller
+            # does not refresh the plot once per checkbox; the plot widget gets
+            # the final selection below
             selected_ntc_sensors = []
-            available_sensors = tob_file.sensors or []
+            to_check = self._ntc_selectable.intersection(tob_file.sensors or ())
 
             for sensor_name, checkbox in self.ntc_checkboxes.items():
-                if sensor_name in available_sensors and (
-                    sensor_name.startswith("NTC") or sensor_name == "Temp"
-                ):
-                    checkbox.setChecked(True)
+                is_selected = sensor_name in to_check
+                if is_selected:
                     selected_ntc_sensors.append(sensor_name)
+                if checkbox.isChecked() == is_selected:
+                    continue
+                was_blocked = checkbox.blockSignals(True)
+                checkbox.setChecked(is_selected)
+                checkbox.blockSignals(was_blocked)
 
             # Update plot widget with active NTC sensors
-            if hasattr(self, "plot_widget") and self.plot_widget:
+            if self.plot_widget:
                 self.plot_widget.set_active_ntc_sensors(selected_ntc_sensors)
 
                 # If we have multiple NTC sensors selected, switch to NTCs mode for plotting
                 if len(selected_ntc_sensors) > 1:
                     # Set y1 sensor to "NTCs" to plot all selected NTC sensors
-                    if hasattr(self.plot_widget, "y1_sensor"):
-                        self.plot_widget.y1_sensor = "NTCs"
-                        self.logger.debug(
-                            "Switched to NTCs mode for multi-sensor plotting"
-                        )
+                    self.plot_widget.y1_sensor = "NTCs"
+                    self.logger.debug(
+                        "Switched to NTCs mode for multi-sensor plotting"
+                    )
 
                     # Also update the y1 axis combo box if it exists
-                    if hasattr(self, "y1_axis_combo") and self.y1_axis_combo:
+                    if self.y1_axis_combo:
                         self.y1_axis_combo.setCurrentText("NTCs")
                         self.logger.debug("Updated y1 axis combo to NTCs")
 
             self.logger.debug(
-                f"Selected all NTC sensors for '{tob_file.file_name}': {selected_ntc_sensors}"
+                "Selected all NTC sensors for '%s': %s",
+                tob_file.file_name,
+                selected_ntc_sensors,
             )
 
             # Update X axis limits based on current time unit
             current_time_unit = "Seconds"  # Default
-            if hasattr(self, "x_axis_combo") and self.x_axis_combo:
+            if self.x_axis_combo:
                 current_time_unit = self.x_axis_combo.currentText() or "Seconds"
             self._update_x_axis_limits_for_unit(current_time_unit)
 
@@ -1196,33 +1514,29 @@ class MainWindow(QMainWindow):
                 )
 
         except Exception as e:
-            self.logger.error(f"Error updating UI for TOB plot: {e}")
+            self.logger.error("Error updating UI for TOB plot: %s", e)
 
     def clear_plot_data(self):
         """
         Clear all data from the plot widget.
         """
         try:
-            if hasattr(self, "plot_widget") and self.plot_widget:
+            if self.plot_widget:
                 # Clear sensor selections
                 for checkbox in self.ntc_checkboxes.values():
                     checkbox.setChecked(False)
 
-                # Clear plot data (if the plot widget supports it)
-                if hasattr(self.plot_widget, "clear_plot"):
-                    self.plot_widget.clear_plot()
-                elif hasattr(self.plot_widget, "_clear_plot"):
-                    self.plot_widget._clear_plot()
+                # Clear plot data
+                self.plot_widget.clear_plot()
 
                 # Reset TOB file status in status bar
-                if hasattr(self, 'update_tob_file_status_bar'):
-                    self.update_tob_file_status_bar()
+                self.update_tob_file_status_bar()
 
                 self.show_status_message("Plot data cleared")
                 self.logger.info("Plot data cleared")
 
         except Exception as e:
-            self.logger.error(f"Error clearing plot data: {e}")
+            self.logger.error("Error clearing plot data: %s", e)
             self.error_handler.handle_error(e, self, "Clear Plot Error")
 
     def _on_tob_file_added(self, file_path: str):
@@ -1233,7 +1547,7 @@ class MainWindow(QMainWindow):
             file_path: Path of the added file
         """
         file_name = Path(file_path).name
-        self.logger.info(f"TOB file added: {file_name}")
+        self.logger.info("TOB file added: %s", file_name)
 
     def _on_tob_file_removed(self, file_name: str):
         """
@@ -1242,7 +1556,8 @@ class MainWindow(QMainWindow):
         Args:
             file_name: Name of the removed file
         """
-        self.logger.info(f"TOB file removed: {file_name}")
+        self.logger.info("TOB file removed: %s", file_name)
+        self._tob_model_cache.pop(file_name, None)
 
     def _on_tob_file_status_updated(self, file_name: str, status: str):
         """
@@ -1252,21 +1567,14 @@ class MainWindow(QMainWindow):
             file_name: Name of the file
             status: New status
         """
-        self.logger.info(f"TOB file status updated: {file_name} -> {status}")
+        self.logger.info("TOB file status updated: %s -> %s", file_name, status)
 
         # Update status bar message
-        status_messages = {
-            "loaded": f"'{file_name}' loaded successfully",
-            "uploading": f"Uploading '{file_name}'...",
-            "uploaded": f"'{file_name}' uploaded to server",
-            "processing": f"Processing '{file_name}' on server...",
-            "processed": f"'{file_name}' processing completed",
-            "error": f"Error with '{file_name}'",
-        }
-
-        message = status_messages.get(
-            status, f"Status of '{file_name}' changed to {status}"
-        )
+        template = self._STATUS_TEMPLATES.get(status)
+        if template is not None:
+            message = template.format(file_name)
+        else:
+            message = f"Status of '{file_name}' changed to {status}"
         self.show_status_message(message)
 
     def update_tob_file_status(self, file_name: str, status: str) -> None:
@@ -1283,7 +1591,7 @@ class MainWindow(QMainWindow):
         if self.controller and self.controller.project_model:
             self.controller.project_model.update_tob_file_status(file_name, status)
             self.logger.info(
-                f"TOB file status updated externally: {file_name} -> {status}"
+                "TOB file status updated externally: %s -> %s", file_name, status
             )
 
             # Trigger auto-save
@@ -1292,7 +1600,18 @@ class MainWindow(QMainWindow):
             # Emit signal for any open dialogs
             self.tob_file_status_updated.emit(file_name, status)
 
-    def _on_sensor_selection_changed(self, sensor_name: str, state: int):
+    def _on_sensor_checkbox_toggled(self, is_selected: bool):
+        """
+        Handle a toggle of any sensor checkbox.
+
+        Args:
+            is_selected: Whether the sending checkbox is checked
+        """
+        sensor_name = self._checkbox_to_sensor.get(self.sender())
+        if sensor_name:
+            self._on_sensor_selection_changed(sensor_name, is_selected)
+
+    def _on_sensor_selection_changed(self, sensor_name: str, is_selected: bool):
         """
         Handle sensor selection changes.
 
@@ -1301,10 +1620,9 @@ class MainWindow(QMainWindow):
 
         Args:
             sensor_name: Name of the sensor (e.g., "NTC01", "Temp")
-            state: Checkbox state (0 = unchecked, 2 = checked)
+            is_selected: Whether the sensor checkbox is checked
         """
-        is_selected = state == 2
-        self.logger.debug(
+        self._dbg(
             "View: sensor %s selection changed: %s", sensor_name, is_selected
         )
 
@@ -1313,41 +1631,58 @@ class MainWindow(QMainWindow):
         if self.controller:
             self.controller.handle_sensor_selection_changed(sensor_name, is_selected)
 
-    def _on_y1_auto_changed(self, state: int):
-        """Handle Y1 axis auto mode change."""
-        is_auto = state == 2
-        self.logger.debug("Y1 axis auto mode: %s", is_auto)
+    def _on_axis_auto_toggled(self, is_auto: bool):
+        """
+        Handle a toggle of any axis auto checkbox.
 
-        # Delegate to axis UI service for consistent handling
-        if hasattr(self, "axis_ui_service") and self.axis_ui_service:
-            self.axis_ui_service.handle_axis_auto_mode_changed(self, "y1", is_auto)
-        else:
-            # Fallback: Enable/disable manual controls directly
-            if self.y1_min_value and self.y1_max_value:
-                self.y1_min_value.setEnabled(not is_auto)
-                self.y1_max_value.setEnabled(not is_auto)
+        Args:
+            is_auto: Whether the sending checkbox is checked
+        """
+        axis = self._auto_checkbox_to_axis.get(self.sender())
+        if axis:
+            self._on_axis_auto_changed(axis, is_auto)
+
+    def _on_axis_auto_changed(self, axis: str, is_auto: bool):
+        """
+        Handle an axis auto mode change.
 
-    def _on_y2_auto_changed(self, state: int):
-        """Handle Y2 axis auto mode change."""
-        is_auto = state == 2
-        self.logger.debug("Y2 axis auto mode: %s", is_auto)
+        Args:
+            axis: "x", "y1" or "y2"
+            is_auto: Whether the axis auto checkbox is checked
+        """
+        self._dbg("%s axis auto mode: %s", axis.upper(), is_auto)
 
         # Delegate to axis UI service for consistent handling
-        if hasattr(self, "axis_ui_service") and self.axis_ui_service:
-            self.axis_ui_service.handle_axis_auto_mode_changed(self, "y2", is_auto)
+        if self.axis_ui_service:
+            self.axis_ui_service.handle_axis_auto_mode_changed(self, axis, is_auto)
         else:
-            # Fallback: Enable/disable manual controls directly
-            if self.y2_min_value and self.y2_max_value:
-                self.y2_min_value.setEnabled(not is_auto)
-                self.y2_max_value.setEnabled(not is_auto)
+            self._set_axis_auto(axis, is_auto)
+
+    def _set_axis_auto(self, axis: str, is_auto: bool):
+        """
+        Enable the manual limit edits of an axis unless it is in auto mode.
+
+        Args:
+            axis: "x", "y1" or "y2"
+            is_auto: Whether the axis is in auto mode
+        """
+        min_edit, max_edit = self._axis_limit_edits[axis]
+        if min_edit and max_edit:
+            min_edit.setEnabled(not is_auto)
+            max_edit.setEnabled(not is_auto)
 
-    def _on_x_auto_changed(self, state: int):
-        """Handle X axis auto mode change."""
-        is_auto = state == 2
-        self.logger.debug("X axis auto mode: %s", is_auto)
+    def _show_axis_limits(self, axis: str, min_val: float, max_val: float):
+        """
+        Show axis limits in the manual limit edits without emitting their signals.
 
-        # Use axis UI service to handle the mode change
-        self.axis_ui_service.handle_axis_auto_mode_changed(self, "x", is_auto)
+        Args:
+            axis: "x", "y1" or "y2"
+            min_val: Lower limit to show
+            max_val: Upper limit to show
+        """
+        min_edit, max_edit = self._axis_limit_edits[axis]
+        set_limit_text(min_edit, min_val)
+        set_limit_text(max_edit, max_val)
 
     def _update_axis_limits_for_sensor(self, sensor_name: str, axis: str):
         """
@@ -1357,79 +1692,97 @@ class MainWindow(QMainWindow):
             sensor_name: Name of the selected sensor
             axis: "y1" or "y2"
         """
-        try:
-            data = None
+        data = self._get_plot_data()
+        if data is None:
+            self.logger.debug("No TOB data available for limit calculation")
+            return
+        if sensor_name not in data.columns:
+            self.logger.warning("Sensor %s not found in data", sensor_name)
+            return
 
-            # Try to get TOB data from current project first
-            if (
-                self.controller
-                and self.controller.project_model
-                and self.controller.project_model.active_tob_file
-            ):
+        limits = self._get_column_limits(data, sensor_name)
+        if limits is None:
+            self.logger.warning("No data available for sensor %s", sensor_name)
+            return
 
-                active_tob = self.controller.project_model.get_active_tob_file()
-                if (
-                    active_tob
-                    and active_tob.tob_data
-                    and active_tob.tob_data.data is not None
-                ):
-                    data = active_tob.tob_data.data
-
-            # If no project data, try to get data from plot widget (direct TOB loading)
-            elif (
-                hasattr(self, "plot_widget")
-                and self.plot_widget
-                and hasattr(self.plot_widget, "tob_data_model")
-                and self.plot_widget.tob_data_model
-                and self.plot_widget.tob_data_model.data is not None
-            ):
-                data = self.plot_widget.tob_data_model.data
-
-            # If we have data, calculate min/max values
-            if data is not None:
-                # Check if sensor exists in data
-                if sensor_name in data.columns:
-                    sensor_data = data[sensor_name].dropna()
-                    if not sensor_data.empty:
-                        min_val = float(sensor_data.min())
-                        max_val = float(sensor_data.max())
-
-                        # Set values in UI fields
-                        if axis == "y1":
-                            if self.y1_min_value:
-                                self.y1_min_value.blockSignals(True)
-                                self.y1_min_value.setText(f"{min_val:.2f}")
-                                self.y1_min_value.blockSignals(False)
-                            if self.y1_max_value:
-                                self.y1_max_value.blockSignals(True)
-                                self.y1_max_value.setText(f"{max_val:.2f}")
-                                self.y1_max_value.blockSignals(False)
-                        elif axis == "y2":
-                            if self.y2_min_value:
-                                self.y2_min_value.blockSignals(True)
-                                self.y2_min_value.setText(f"{min_val:.2f}")
-                                self.y2_min_value.blockSignals(False)
-                            if self.y2_max_value:
-                                self.y2_max_value.blockSignals(True)
-                                self.y2_max_value.setText(f"{max_val:.2f}")
-                                self.y2_max_value.blockSignals(False)
+        min_val, max_val = limits
+        self._show_axis_limits(axis, min_val, max_val)
+        self.logger.debug(
+            "Updated %s limits for %s: %.2f - %.2f", axis, sensor_name, min_val, max_val
+        )
 
-                        self.logger.debug(
-                            f"Updated {axis} limits for {sensor_name}: {min_val:.2f} - {max_val:.2f}"
-                        )
-                    else:
-                        self.logger.warning(
-                            f"No data available for sensor {sensor_name}"
-                        )
-                else:
-                    self.logger.warning(f"Sensor {sensor_name} not found in data")
-            else:
-                self.logger.debug("No TOB data available for limit calculation")
+    def _get_plot_data(self) -> Optional["pd.DataFrame"]:
+        """
+        Get the DataFrame currently shown in the plot.
 
-        except Exception as e:
-            self.logger.error(
-                f"Error updating {axis} limits for sensor {sensor_name}: {e}"
-            )
+        Returns:
+            Data of the active project TOB file, or of the plot widget's TOB
+            data when no project file is active; None if there is no data
+        """
+        if (
+            self.controller
+            and self.controller.project_model
+            and self.controller.project_model.active_tob_file
+        ):
+            active_tob = self.controller.project_model.get_active_tob_file()
+            if active_tob and active_tob.tob_data:
+                return active_tob.tob_data.data
+            return None
+
+        # No project data - use the plot widget's data (direct TOB loading)
+        tob_data_model = getattr(self.plot_widget, "tob_data_model", None)
+        if tob_data_model is not None:
+            return tob_data_model.data
+        return None
+
+    def _get_column_limits(
+        self, data: "pd.DataFrame", column: str
+    ) -> Optional[Tuple[float, float]]:
+        """
+        Get the (min, max) of a data column, ignoring missing values.
+
+        Limits are computed once per column and reused until limits are asked
+        for on a different DataFrame, so switching sensors or time units does
+        not rescan the data.
+
+        Args:
+            data: DataFrame holding the column
+            column: Name of the column
+
+        Returns:
+            (min, max) tuple, or None if the column has no values
+        """
+        cached_data = self._column_limits_data() if self._column_limits_data else None
+        if cached_data is not data:
+            self._column_limits = {}
+            self._column_limits_data = weakref.ref(data)
+
+        if column not in self._column_limits:
+            import numpy as np
+
+            values = data[column].to_numpy()
+            if values.dtype.kind not in "biuf":
+                # Non-numeric columns go through pandas and may not convert
+                values = data[column].dropna()
+                try:
+                    limits = (
+                        None
+                        if values.empty
+                        else (float(values.min()), float(values.max()))
+                    )
+                except (TypeError, ValueError) as e:
+                    self.logger.warning("Cannot get limits of %s: %s", column, e)
+                    limits = None
+            elif values.size == 0:
+                limits = None
+            else:
+                # fmin/fmax skip NaNs in one pass without copying the column,
+                # and only return NaN if every value is missing
+                min_val = float(np.fmin.reduce(values))
+                max_val = float(np.fmax.reduce(values))
+                limits = None if np.isnan(min_val) else (min_val, max_val)
+            self._column_limits[column] = limits
+        return self._column_limits[column]
 
     def _update_x_axis_limits_for_unit(self, time_unit: str):
         """
@@ -1438,80 +1791,39 @@ class MainWindow(QMainWindow):
         Args:
             time_unit: Time unit ("Seconds", "Minutes", "Hours")
         """
-        try:
-            data = None
+        data = self._get_plot_data()
+        if data is None:
+            self.logger.debug("No TOB data available for X axis limit calculation")
+            return
 
-            # Get TOB data from current project or plot widget
-            if (
-                self.controller
-                and self.controller.project_model
-                and self.controller.project_model.active_tob_file
-            ):
+        # Get time column (use same logic as TOBDataModel)
+        time_limits = None
+        time_columns = ["Time", "time", "TIMESTAMP", "timestamp", "Datasets"]
+        for col in time_columns:
+            if col in data.columns:
+                time_limits = self._get_column_limits(data, col)
+                break
 
-                active_tob = self.controller.project_model.get_active_tob_file()
-                if (
-                    active_tob
-                    and active_tob.tob_data
-                    and active_tob.tob_data.data is not None
-                ):
-                    data = active_tob.tob_data.data
-
-            elif (
-                hasattr(self, "plot_widget")
-                and self.plot_widget
-                and hasattr(self.plot_widget, "tob_data_model")
-                and self.plot_widget.tob_data_model
-                and self.plot_widget.tob_data_model.data is not None
-            ):
-                data = self.plot_widget.tob_data_model.data
-
-            if data is not None:
-                # Get time column (use same logic as TOBDataModel)
-                time_col = None
-                time_columns = ["Time", "time", "TIMESTAMP", "timestamp", "Datasets"]
-                for col in time_columns:
-                    if col in data.columns:
-                        time_col = data[col]
-                        break
-
-                if time_col is not None and not time_col.empty:
-                    time_min = float(time_col.min())
-                    time_max = float(time_col.max())
-
-                    # Convert to selected time unit
-                    if time_unit == "Minutes":
-                        time_min = time_min / 60.0
-                        time_max = time_max / 60.0
-                    elif time_unit == "Hours":
-                        time_min = time_min / 3600.0
-                        time_max = time_max / 3600.0
-                    # For "Seconds", keep as is
-
-                    # Set values in UI fields
-                    if self.x_min_value:
-                        self.x_min_value.blockSignals(True)
-                        self.x_min_value.setText(f"{time_min:.2f}")
-                        self.x_min_value.blockSignals(False)
-                    if self.x_max_value:
-                        self.x_max_value.blockSignals(True)
-                        self.x_max_value.setText(f"{time_max:.2f}")
-                        self.x_max_value.blockSignals(False)
+        if time_limits is None:
+            self.logger.warning("No time column found in TOB data")
+            return
 
-                    self.logger.debug(
-                        f"Updated X axis limits for {time_unit}: {time_min:.2f} - {time_max:.2f}"
-                    )
-                else:
-                    self.logger.warning("No time column found in TOB data")
-            else:
-                self.logger.debug("No TOB data available for X axis limit calculation")
+        # Convert to selected time unit
+        factor = TIME_UNIT_SECONDS.get(time_unit, 1.0)
+        time_min = time_limits[0] / factor
+        time_max = time_limits[1] / factor
 
-        except Exception as e:
-            self.logger.error(f"Error updating X axis limits for unit {time_unit}: {e}")
+        # Set values in UI fields
+        self._show_axis_limits("x", time_min, time_max)
+
+        self.logger.debug(
+            "Updated X axis limits for %s: %.2f - %.2f", time_unit, time_min, time_max
+        )
 
     def _on_y1_axis_changed(self, sensor_name: str):
         """Handle Y1 axis sensor selection - sets primary sensor for main plot."""
         if sensor_name:
-            self.logger.debug("Y1 axis changed to: %s", sensor_name)
+            self._dbg("Y1 axis changed to: %s", sensor_name)
             # Update primary sensor through controller
             if self.controller:
                 self.controller.set_primary_sensor(sensor_name)
@@ -1523,12 +1835,12 @@ class MainWindow(QMainWindow):
         """Handle Y2 axis selection - controls plot layout mode."""
         if sensor_name == "None":
             # Single mode: Only main plot
-            self.logger.debug("Switching to single plot mode")
+            self._dbg("Switching to single plot mode")
             if self.controller:
                 self.controller.set_plot_mode("single")
         else:
             # Dual mode: Main plot + secondary plot with selected sensor
-            self.logger.debug(
+            self._dbg(
                 "Switching to dual plot mode with sensor: %s", sensor_name
             )
             if self.controller:
@@ -1539,83 +1851,36 @@ class MainWindow(QMainWindow):
 
     def _on_x_axis_changed(self, axis_type: str):
         """Handle X axis type selection change."""
-        if axis_type:
-            self.logger.debug("X axis changed to: %s", axis_type)
+        if not axis_type:
+            return
+
+        self._dbg("X axis changed to: %s", axis_type)
+
+        # Apply only the latest unit once the current event-loop pass is done
+        self._pending_x_axis_type = axis_type
+        if not self._x_axis_change_scheduled:
+            self._x_axis_change_scheduled = True
+            QTimer.singleShot(0, self._apply_pending_x_axis)
 
-            # Update X axis limits based on TOB data
+    def _apply_pending_x_axis(self):
+        """Apply the X axis unit last selected in _on_x_axis_changed."""
+        axis_type = self._pending_x_axis_type
+        self._pending_x_axis_type = None
+        self._x_axis_change_scheduled = False
+        if not axis_type:
+            return
+
+        if not self.controller:
+            # No plot to refresh - just show the data range in the new unit
             self._update_x_axis_limits_for_unit(axis_type)
+            return
 
-            # If in manual mode, convert existing manual limits to new time unit
-            if (
-                hasattr(self, "x_auto_checkbox")
-                and self.x_auto_checkbox
-                and not self.x_auto_checkbox.isChecked()
-                and hasattr(self, "x_min_value")
-                and self.x_min_value
-                and hasattr(self, "x_max_value")
-                and self.x_max_value
-            ):
+        is_auto = not self.x_auto_checkbox or self.x_auto_checkbox.isChecked()
 
-                # Get current values and convert them to the new unit
-                try:
-                    current_min = float(self.x_min_value.text() or "0")
-                    current_max = float(self.x_max_value.text() or "0")
-
-                    # Get old time unit for conversion
-                    old_unit = "Seconds"  # Default
-                    if hasattr(self, "x_axis_combo") and self.x_axis_combo:
-                        current_text = self.x_axis_combo.currentText()
-                        if current_text and current_text != axis_type:
-                            old_unit = current_text
-
-                    # Convert from old unit to seconds, then to new unit
-                    if old_unit == "Minutes":
-                        current_min *= 60.0
-                        current_max *= 60.0
-                    elif old_unit == "Hours":
-                        current_min *= 3600.0
-                        current_max *= 3600.0
-
-                    # Convert to new unit
-                    if axis_type == "Minutes":
-                        current_min /= 60.0
-                        current_max /= 60.0
-                    elif axis_type == "Hours":
-                        current_min /= 3600.0
-                        current_max /= 3600.0
-
-                    # Update the values in LineEdits
-                    self.x_min_value.blockSignals(True)
-                    self.x_max_value.blockSignals(True)
-                    self.x_min_value.setText(f"{current_min:.2f}")
-                    self.x_max_value.setText(f"{current_max:.2f}")
-                    self.x_min_value.blockSignals(False)
-                    self.x_max_value.blockSignals(False)
-
-                except ValueError:
-                    pass  # Keep existing values if conversion fails
-
-            # Update axis settings through controller
-            axis_settings = {"x_axis_type": axis_type}
-            if self.controller:
-                self.controller.update_axis_settings(axis_settings)
-
-                # If in auto mode, update values to show current range in new unit
-                if (
-                    hasattr(self, "x_auto_checkbox")
-                    and self.x_auto_checkbox
-                    and self.x_auto_checkbox.isChecked()
-                ):
-                    time_range = self.controller.get_time_range()
-                    if time_range:
-                        self.axis_ui_service.update_axis_values(self, time_range)
-                elif (
-                    hasattr(self, "x_auto_checkbox")
-                    and self.x_auto_checkbox
-                    and not self.x_auto_checkbox.isChecked()
-                ):
-                    # In manual mode, update the displayed values from current plot limits
-                    self.axis_ui_service._update_manual_values_from_plot(self)
+        # Controller refreshes the plot once; the axis fields follow the new plot
+        self.controller.apply_x_axis_change(axis_type)
+        if self.axis_ui_service:
+            self.axis_ui_service.handle_x_axis_unit_changed(self, is_auto)
 
     def _on_quality_control(self):
         """Handle quality control button click."""
@@ -1626,7 +1891,7 @@ class MainWindow(QMainWindow):
         """Handle send data button click."""
         self.logger.info("Send data requested")
         # Get the current active TOB file name from controller
-        if self.controller and hasattr(self.controller, 'get_current_tob_data'):
+        if self.controller is not None:
             tob_data = self.controller.get_current_tob_data()
             if tob_data and tob_data.file_name:
                 self.send_data_requested.emit(tob_data.file_name)
@@ -1639,7 +1904,7 @@ class MainWindow(QMainWindow):
         """Handle request status button click."""
         self.logger.info("Status request requested")
         # Get the current active TOB file name from controller
-        if self.controller and hasattr(self.controller, 'get_current_tob_data'):
+        if self.controller is not None:
             tob_data = self.controller.get_current_tob_data()
             if tob_data and tob_data.file_name:
                 self.status_request_requested.emit(tob_data.file_name)
@@ -1680,16 +1945,25 @@ class MainWindow(QMainWindow):
         try:
             if not tob_data_model or not tob_data_model.headers:
                 # Reset to default values
-                if self.location_subcon_spin:
+                if self.location_subcon_spin and self.location_subcon_spin.value() != 0.0:
                     self.location_subcon_spin.setValue(0.0)
-                if self.location_comment_value:
-                    self.location_comment_value.setText("-")
-                if self.location_sensorstring_value:
-                    self.location_sensorstring_value.setText("-")
+                set_text_if_changed(self.location_comment_value, "-")
+                set_text_if_changed(self.location_sensorstring_value, "-")
+                self._last_container_key = None
                 return
 
             headers = tob_data_model.headers
 
+            # The widgets already show these headers - only refresh the status
+            container_key = (
+                id(headers),
+                headers.get("Comments"),
+                headers.get("Subconn_Length"),
+            )
+            if container_key == self._last_container_key:
+                self.update_project_container_status()
+                return
+
             # Update Subcon Extension (Subconn_Length from project settings or header)
             subcon_value = 0.0
             if "Subconn_Length" in headers:
@@ -1698,29 +1972,33 @@ class MainWindow(QMainWindow):
                 except (ValueError, TypeError):
                     subcon_value = 0.0
 
-            if self.location_subcon_spin:
+            if (
+                self.location_subcon_spin
+                and self.location_subcon_spin.value() != subcon_value
+            ):
                 self.location_subcon_spin.setValue(subcon_value)
 
             # Update Comment (filter out brackets and quotes)
             comment = headers.get("Comments", "-")
             if comment != "-":
                 # Remove brackets and quotes
-                comment = re.sub(r'[\[\]\'""]', '', str(comment))
+                comment = _BRACKET_QUOTE_RE.sub("", str(comment))
             if self.location_comment_value:
-                self.location_comment_value.setText(comment)
+                set_text_if_changed(self.location_comment_value, comment)
 
             # Update Sensor String (FLX- + string from comment starting with T, ending with SD)
             sensor_string = "-"
             if headers.get("Comments"):
                 comment = str(headers["Comments"])
                 # Find pattern: T followed by numbers, ending with SD
-                match = re.search(r'T(\d+)SD', comment)
+                match = _SENSOR_RE.search(comment)
                 if match:
                     sensor_number = match.group(1)
                     sensor_string = f"FLX-T{sensor_number}SD"
 
-            if self.location_sensorstring_value:
-                self.location_sensorstring_value.setText(sensor_string)
+            set_text_if_changed(self.location_sensorstring_value, sensor_string)
+
+            self._last_container_key = container_key
 
             # Update Status
             self.update_project_container_status()
@@ -1760,9 +2038,6 @@ class MainWindow(QMainWindow):
             if self.location_comment_value is not None:
                 self.location_comment_value.setReadOnly(not has_real_project)
 
-            if self.location_sensorstring_value is not None:
-                self.location_sensorstring_value.setReadOnly(not has_real_project)
-
             # Enable/disable project container buttons
             if self.send_data_button is not None:
                 self.send_data_button.setEnabled(has_real_project)
@@ -1782,85 +2057,85 @@ class MainWindow(QMainWindow):
     def _update_processing_list_dialogs(self):
         """Try to update any open processing list dialogs."""
         try:
-            # Find all ProcessingListDialog instances
-            # This is a simple approach - we look for widgets of the correct type
-            from PyQt6.QtWidgets import QApplication
-            app = QApplication.instance()
-            if app:
-                for widget in app.allWidgets():
-                    if hasattr(widget, '_populate_table') and hasattr(widget, 'project_model'):
-                        # This looks like a ProcessingListDialog
-                        if widget.project_model == self.controller.project_model:
-                            # Same project model, update it
-                            widget._populate_table()
-                            self.logger.debug("Updated processing list dialog")
+            for dialog in list(self._open_processing_dialogs):
+                if dialog.project_model is self.controller.project_model:
+                    dialog._populate_table()
+                    self.logger.debug("Updated processing list dialog")
         except Exception as e:
             self.logger.error("Error updating processing list dialogs: %s", e)
 
     def _on_location_comment_changed(self):
         """Handle comment value changes in project container."""
-        if not self.controller or not self.controller.project_model:
-            return
-
         new_comment = self.location_comment_value.text()
-        self.logger.info(f"Comment changed to: {new_comment}")
-
-        # Update comment in active TOB file headers
-        active_tob = self.controller.project_model.get_active_tob_file()
-        if active_tob and active_tob.tob_data and active_tob.tob_data.headers:
-            active_tob.tob_data.headers["Comments"] = new_comment
-            # Store in modified headers for persistence
-            active_tob.modified_headers["Comments"] = new_comment
-            self.logger.info(f"Updated comment in active TOB file: {active_tob.file_name}")
-
-            # Also update the TOBDataModel in the controller if it exists
-            current_tob_data = self.controller.get_current_tob_data()
-            if current_tob_data and current_tob_data.headers:
-                current_tob_data.headers["Comments"] = new_comment
-                self.logger.debug("Updated comment in controller TOBDataModel")
-
-            # Mark project as modified for auto-save
-            if hasattr(self.controller, '_mark_project_modified'):
-                self.controller._mark_project_modified()
-
-            # Try to update any open processing list dialogs
-            self._update_processing_list_dialogs()
-
-    def _on_location_sensorstring_changed(self):
-        """Handle sensor string changes in project container."""
-        # Sensor string is derived from comment, so this shouldn't be directly editable
-        # Reset to derived value
-        if hasattr(self, 'update_project_container'):
-            self.update_project_container(self.controller.get_current_tob_data() if self.controller else None)
-        self.logger.debug("Sensor string change ignored - value is derived from comment")
+        self.logger.info("Comment changed to: %s", new_comment)
+        self._propagate_header_change("Comments", new_comment)
 
     def _on_location_subcon_changed(self, value: float):
         """Handle subcon extension changes in project container."""
+        self.logger.info("Subcon extension changed to: %s", value)
+        self._propagate_header_change("Subconn_Length", str(value))
+
+    def _header_value_unchanged(self, key: str, current: Any, value: str) -> bool:
+        """
+        Check whether a header already holds a value.
+
+        Numeric headers are compared as numbers, so "2" and "2.0" match.
+
+        Args:
+            key: Header name
+            current: Value currently stored in the header
+            value: New header value
+
+        Returns:
+            True if writing the value would not change the header
+        """
+        if current == value:
+            return True
+        if key not in self._NUMERIC_HEADERS or current is None:
+            return False
+        try:
+            return float(current) == float(value)
+        except (TypeError, ValueError):
+            return False
+
+    def _propagate_header_change(self, key: str, value: str):
+        """
+        Write an edited header value to the active TOB file.
+
+        The value is stored in the file's headers and modified headers, the
+        controller's TOBDataModel, and shown in open processing list dialogs.
+        Nothing happens if the header already holds the value.
+
+        Args:
+            key: Header name
+            value: New header value
+        """
         if not self.controller or not self.controller.project_model:
             return
 
-        self.logger.info(f"Subcon extension changed to: {value}")
-
-        # Update Subconn_Length in active TOB file headers
         active_tob = self.controller.project_model.get_active_tob_file()
-        if active_tob and active_tob.tob_data and active_tob.tob_data.headers:
-            active_tob.tob_data.headers["Subconn_Length"] = str(value)
-            # Store in modified headers for persistence
-            active_tob.modified_headers["Subconn_Length"] = str(value)
-            self.logger.info(f"Updated Subconn_Length in active TOB file: {active_tob.file_name}")
+        if not (active_tob and active_tob.tob_data and active_tob.tob_data.headers):
+            return
+        current = active_tob.tob_data.headers.get(key)
+        if self._header_value_unchanged(key, current, value):
+            return
+
+        active_tob.tob_data.headers[key] = value
+        # Store in modified headers for persistence
+        active_tob.modified_headers[key] = value
+        self.logger.info("Updated %s in active TOB file: %s", key, active_tob.file_name)
 
-            # Also update the TOBDataModel in the controller if it exists
-            current_tob_data = self.controller.get_current_tob_data()
-            if current_tob_data and current_tob_data.headers:
-                current_tob_data.headers["Subconn_Length"] = str(value)
-                self.logger.debug("Updated Subconn_Length in controller TOBDataModel")
+        # Also update the TOBDataModel in the controller if it exists
+        current_tob_data = self.controller.get_current_tob_data()
+        if current_tob_data and current_tob_data.headers:
+            current_tob_data.headers[key] = value
+            self.logger.debug("Updated %s in controller TOBDataModel", key)
 
-            # Mark project as modified for auto-save
-            if hasattr(self.controller, '_mark_project_modified'):
-                self.controller._mark_project_modified()
+        # Mark project as modified for auto-save
+        self.controller._mark_project_modified()
 
-            # Try to update any open processing list dialogs
-            self._update_processing_list_dialogs()
+        # Try to update any open processing list dialogs
+        self._update_processing_list_dialogs()
 
     def _get_status_text(self, status: str) -> str:
         """
@@ -1872,15 +2147,7 @@ class MainWindow(QMainWindow):
         Returns:
             Human-readable status text
         """
-        status_texts = {
-            "loaded": "Loaded",
-            "uploading": "Uploading...",
-            "uploaded": "Uploaded",
-            "processing": "Processing...",
-            "processed": "Processed",
-            "error": "Error",
-        }
-        return status_texts.get(status, status)
+        return TOB_STATUS_TEXTS.get(status, status)
 
     def update_project_container_status(self):
         """
@@ -1888,13 +2155,13 @@ class MainWindow(QMainWindow):
         """
         try:
             status_text = "-"
-            if self.controller and hasattr(self.controller, 'project_model') and self.controller.project_model:
+            if self.controller is not None and self.controller.project_model:
                 active_tob = self.controller.project_model.get_active_tob_file()
                 if active_tob:
                     status_text = self._get_status_text(active_tob.status)
 
             if self.status_lineEdit:
-                self.status_lineEdit.setText(status_text)
+                set_text_if_changed(self.status_lineEdit, status_text)
 
             self.logger.debug("Project container status updated: %s", status_text)
 
@@ -1908,17 +2175,9 @@ class MainWindow(QMainWindow):
         Args:
             metrics: Dictionary containing metric values
         """
-        if self.mean_hp_power_value and "mean_hp_power" in metrics:
-            self.mean_hp_power_value.setText(str(metrics["mean_hp_power"]))
-
-        if self.max_v_accu_value and "max_v_accu" in metrics:
-            self.max_v_accu_value.setText(str(metrics["max_v_accu"]))
-
-        if self.tilt_status_value and "tilt_status" in metrics:
-            self.tilt_status_value.setText(str(metrics["tilt_status"]))
-
-        if self.mean_press_value and "mean_press" in metrics:
-            self.mean_press_value.setText(str(metrics["mean_press"]))
+        for metric_widget, key in self._metric_targets:
+            if key in metrics:
+                set_text_if_changed(metric_widget, str(metrics[key]))
 
         self.logger.debug("Data metrics updated")
 
@@ -1986,7 +2245,7 @@ class MainWindow(QMainWindow):
             if time_range:
                 self.axis_ui_service.update_axis_values(self, time_range)
 
-        self.statusbar.showMessage("Data loaded successfully")
+        self.show_status_message("Data loaded successfully", 0)
         self.logger.info("Data loaded, switched to plot view")
 
     def show_status_message(self, message: str, timeout: int = 5000):
@@ -1997,9 +2256,19 @@ class MainWindow(QMainWindow):
             message: Message to display
             timeout: Timeout in milliseconds (0 = permanent)
         """
+        # Only the latest message per event-loop pass reaches the status bar
+        self._pending_status = (message, timeout)
+        self._status_timer.start()
+        self.logger.debug("Status message: %s", message)
+
+    def _flush_status(self):
+        """Show the most recent message passed to show_status_message."""
+        if self._pending_status is None:
+            return
+        message, timeout = self._pending_status
+        self._pending_status = None
         if self.statusbar:
             self.statusbar.showMessage(message, timeout)
-        self.logger.debug("Status message: %s", message)
 
     def update_plot_data(self, tob_data_model):
         """
@@ -2011,7 +2280,6 @@ class MainWindow(QMainWindow):
         try:
             if self._ensure_plot_widget():
                 self.plot_widget.update_data(tob_data_model)
-                self.update_style_indicators()  # Update visual indicators
                 self.logger.debug("Plot data updated successfully")
             else:
                 self.logger.warning("Plot widget not available for data update")
@@ -2027,9 +2295,8 @@ class MainWindow(QMainWindow):
             selected_sensors: List of selected sensor names
         """
         try:
-            if hasattr(self, "plot_widget") and self.plot_widget:
+            if self.plot_widget:
                 self.plot_widget.update_sensor_selection(selected_sensors)
-                self.update_style_indicators()  # Update visual indicators
                 self.logger.debug("Plot sensors updated: %s", selected_sensors)
             else:
                 self.logger.warning("Plot widget not available for sensor update")
@@ -2045,7 +2312,7 @@ class MainWindow(QMainWindow):
             axis_settings: Dictionary containing axis configuration
         """
         try:
-            if hasattr(self, "plot_widget") and self.plot_widget:
+            if self.plot_widget:
                 self.plot_widget.update_axis_settings(axis_settings)
                 self.logger.debug("Plot axis settings updated: %s", axis_settings)
             else:
@@ -2063,7 +2330,7 @@ class MainWindow(QMainWindow):
             max_value: Maximum X-axis value in seconds
         """
         try:
-            if hasattr(self, "plot_widget") and self.plot_widget:
+            if self.plot_widget:
                 self.plot_widget.update_x_limits(min_value, max_value)
                 self.logger.debug(
                     "Plot X-axis limits updated: min=%.2f, max=%.2f",
@@ -2087,7 +2354,7 @@ class MainWindow(QMainWindow):
             max_value: Maximum Y1-axis value
         """
         try:
-            if hasattr(self, "plot_widget") and self.plot_widget:
+            if self.plot_widget:
                 self.plot_widget.update_y1_limits(min_value, max_value)
                 self.logger.debug(
                     "Plot Y1-axis limits updated: min=%.2f, max=%.2f",
@@ -2111,7 +2378,7 @@ class MainWindow(QMainWindow):
             max_value: Maximum Y2-axis value
         """
         try:
-            if hasattr(self, "plot_widget") and self.plot_widget:
+            if self.plot_widget:
                 self.plot_widget.update_y2_limits(min_value, max_value)
                 self.logger.debug(
                     "Plot Y2-axis limits updated: min=%.2f, max=%.2f",
@@ -2157,7 +2424,7 @@ class MainWindow(QMainWindow):
             Dictionary containing plot information
         """
         try:
-            if hasattr(self, "plot_widget") and self.plot_widget:
+            if self.plot_widget:
                 return self.plot_widget.get_plot_info()
             else:
                 return {"has_plot_widget": False}
@@ -2169,42 +2436,56 @@ class MainWindow(QMainWindow):
         """
         Replace UI placeholder labels with visual style indicators for legend functionality.
         """
-        from PyQt6.QtCore import Qt
-        from PyQt6.QtGui import QColor, QPainter, QPen
-        from PyQt6.QtWidgets import QLabel
-
         self.style_indicators = {}
+        # Indicators backed by a .ui placeholder; hidden fallbacks are never redrawn
+        self._active_indicators = []
 
         try:
+            # Placeholder labels come from the widget index built at UI setup
+            label_by_name = self._widgets_by_name
+
+            debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+
             for sensor_name, checkbox in self.ntc_checkboxes.items():
                 # Get style info from plot style service
                 style_info = self.plot_style_service.get_sensor_style(sensor_name)
 
                 # Find the corresponding UI placeholder label
                 label_name = self._get_style_label_name(sensor_name)
-                placeholder_label = self.findChild(QLabel, label_name)
-
-                self.logger.debug(
-                    f"Setting up indicator for {sensor_name}: looking for label '{label_name}'"
-                )
+                placeholder_label = label_by_name.get(label_name)
 
-                if placeholder_label:
+                if debug_enabled:
                     self.logger.debug(
-                        f"Found placeholder label {label_name} with text '{placeholder_label.text()}' at {placeholder_label.geometry()}"
+                        "Setting up indicator for %s: looking for label '%s'",
+                        sensor_name,
+                        label_name,
                     )
 
+                if placeholder_label:
+                    if debug_enabled:
+                        self.logger.debug(
+                            "Found placeholder label %s with text '%s' at %s",
+                            label_name,
+                            placeholder_label.text(),
+                            placeholder_label.geometry(),
+                        )
+
                     # Set up the label as a style indicator using UI service
                     indicator = self.ui_service.setup_label_indicator(
                         placeholder_label, style_info
                     )
+                    self._active_indicators.append((sensor_name, indicator))
 
-                    self.logger.debug(
-                        f"Successfully set up {label_name} as style indicator"
-                    )
+                    if debug_enabled:
+                        self.logger.debug(
+                            "Successfully set up %s as style indicator", label_name
+                        )
 
                 else:
                     self.logger.warning(
-                        f"UI placeholder label {label_name} not found for sensor {sensor_name}"
+                        "UI placeholder label %s not found for sensor %s",
+                        label_name,
+                        sensor_name,
                     )
                     # Create hidden fallback
                     indicator = QLabel()
@@ -2214,16 +2495,27 @@ class MainWindow(QMainWindow):
                 self.style_indicators[sensor_name] = indicator
 
             self.logger.debug(
-                f"Set up style indicators for {len(self.style_indicators)} sensors"
+                "Set up style indicators for %d sensors", len(self.style_indicators)
             )
 
         except Exception as e:
-            self.logger.error(f"Error setting up style indicators: {e}")
-            import traceback
-
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
+            self.logger.error("Error setting up style indicators: %s", e)
+            self.logger.error("Traceback: %s", traceback.format_exc())
             ErrorHandler.handle_error(e, "Style Indicator Setup")
 
+    def _ensure_style_indicators(self) -> None:
+        """
+        Set up the style indicators once the widget tree and services are ready.
+        """
+        if (
+            self._style_indicators_pending
+            and not self._post_paint_pending
+            and self.plot_style_service
+            and self.ui_service
+        ):
+            self._style_indicators_pending = False
+            self._setup_style_indicators()
+
     def _get_style_label_name(self, sensor_name: str) -> str:
         """
         Get the UI label name for a sensor.
@@ -2234,36 +2526,32 @@ class MainWindow(QMainWindow):
         Returns:
             UI label name (e.g., 'ntc01_style_label', 'pt100_style_label')
         """
-        if sensor_name == "Temp":
-            return "pt100_style_label"
-        elif sensor_name.startswith("NTC"):
-            # Extract number and format as two digits
-            number = sensor_name[3:]  # Remove "NTC"
-            return f"ntc{number}_style_label"
-        else:
-            self.logger.warning(f"Unknown sensor name format: {sensor_name}")
-            return f"{sensor_name.lower()}_style_label"
+        label_name = self._STYLE_LABEL_NAMES.get(sensor_name)
+        if label_name is None:
+            self.logger.warning("Unknown sensor name format: %s", sensor_name)
+            label_name = f"{sensor_name.lower()}_style_label"
+        return label_name
 
     def update_style_indicators(self):
         """
         Update all style indicators when plot styles change.
-        """
-        if not hasattr(self, "style_indicators"):
-            return
 
+        Plot styles are fixed once PlotStyleService is set up, so the
+        indicators drawn by _setup_style_indicators stay current; plotting
+        new data or sensors does not redraw them.
+        """
         try:
-            for sensor_name, indicator in self.style_indicators.items():
+            for sensor_name, indicator in self._active_indicators:
                 style_info = self.plot_style_service.get_sensor_style(sensor_name)
 
                 # Update style info and pixmap using UI service
-                if hasattr(indicator, "_style_info"):
-                    indicator._style_info = style_info
-                    self.ui_service.update_label_pixmap(indicator, style_info)
+                indicator._style_info = style_info
+                self.ui_service.update_label_pixmap(indicator, style_info)
 
             self.logger.debug("Style indicators updated")
 
         except Exception as e:
-            self.logger.error(f"Error updating style indicators: {e}")
+            self.logger.error("Error updating style indicators: %s", e)
             ErrorHandler.handle_error(e, "Style Indicator Update")
 
     def display_status_message(self, message: str, timeout: int = 5000):
@@ -2285,8 +2573,6 @@ class MainWindow(QMainWindow):
             title: Dialog title
             message: Dialog message
         """
-        from PyQt6.QtWidgets import QMessageBox
-
         QMessageBox.information(self, title, message)
 
     def _on_show_server_status(self, title: str, message: str):
@@ -2297,8 +2583,6 @@ class MainWindow(QMainWindow):
             title: Dialog title
             message: Dialog message
         """
-        from PyQt6.QtWidgets import QMessageBox
-
         QMessageBox.information(self, title, message)
 
     def _on_error_occurred(self, error_type: str, error_message: str, parent):
@@ -2310,8 +2594,6 @@ class MainWindow(QMainWindow):
             error_message: Error message
             parent: Parent widget
         """
-        from PyQt6.QtWidgets import QMessageBox
-
         msg_box = QMessageBox(parent or self)
         msg_box.setIcon(QMessageBox.Icon.Critical)
         msg_box.setWindowTitle(f"Error - {error_type}")
@@ -2327,8 +2609,6 @@ class MainWindow(QMainWindow):
             message: Warning message
             parent: Parent widget
         """
-        from PyQt6.QtWidgets import QMessageBox
-
         msg_box = QMessageBox(parent or self)
         msg_box.setIcon(QMessageBox.Icon.Warning)
         msg_box.setWindowTitle("Warning")
@@ -2344,8 +2624,6 @@ class MainWindow(QMainWindow):
             message: Info message
             parent: Parent widget
         """
-        from PyQt6.QtWidgets import QMessageBox
-
         msg_box = QMessageBox(parent or self)
         msg_box.setIcon(QMessageBox.Icon.Information)
         msg_box.setWindowTitle("Information")
@@ -0,0 +1,1285 @@
+# Form implementation generated from reading ui file 'ui/main_window.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(1374, 776)
+        MainWindow.setMinimumSize(QtCore.QSize(1110, 600))
+        self.centralwidget = QtWidgets.QWidget(parent=MainWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.gridLayout_2 = QtWidgets.QGridLayout(self.centralwidget)
+        self.gridLayout_2.setContentsMargins(12, 0, 12, 8)
+        self.gridLayout_2.setSpacing(8)
+        self.gridLayout_2.setObjectName("gridLayout_2")
+        self.welcome_container = QtWidgets.QWidget(parent=self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(1)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.welcome_container.sizePolicy().hasHeightForWidth())
+        self.welcome_container.setSizePolicy(sizePolicy)
+        self.welcome_container.setVisible(True)
+        self.welcome_container.setObjectName("welcome_container")
+        self.welcome_container_layout = QtWidgets.QVBoxLayout(self.welcome_container)
+        self.welcome_container_layout.setContentsMargins(20, 0, 20, 0)
+        self.welcome_container_layout.setSpacing(15)
+        self.welcome_container_layout.setObjectName("welcome_container_layout")
+        spacerItem = QtWidgets.QSpacerItem(20, 0, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.welcome_container_layout.addItem(spacerItem)
+        self.welcome_title_layout = QtWidgets.QHBoxLayout()
+        self.welcome_title_layout.setContentsMargins(0, 0, 0, 0)
+        self.welcome_title_layout.setSpacing(0)
+        self.welcome_title_layout.setObjectName("welcome_title_layout")
+        spacerItem1 = QtWidgets.QSpacerItem(80, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.welcome_title_layout.addItem(spacerItem1)
+        self.welcome_title_label = QtWidgets.QLabel(parent=self.welcome_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.welcome_title_label.sizePolicy().hasHeightForWidth())
+        self.welcome_title_label.setSizePolicy(sizePolicy)
+        self.welcome_title_label.setTextFormat(QtCore.Qt.TextFormat.RichText)
+        self.welcome_title_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignHCenter|QtCore.Qt.AlignmentFlag.AlignTop)
+        self.welcome_title_label.setWordWrap(True)
+        self.welcome_title_label.setObjectName("welcome_title_label")
+        self.welcome_title_layout.addWidget(self.welcome_title_label)
+        spacerItem2 = QtWidgets.QSpacerItem(80, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.welcome_title_layout.addItem(spacerItem2)
+        self.welcome_container_layout.addLayout(self.welcome_title_layout)
+        self.welcome_subtitle_layout = QtWidgets.QHBoxLayout()
+        self.welcome_subtitle_layout.setContentsMargins(0, 0, 0, 0)
+        self.welcome_subtitle_layout.setSpacing(0)
+        self.welcome_subtitle_layout.setObjectName("welcome_subtitle_layout")
+        spacerItem3 = QtWidgets.QSpacerItem(80, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.welcome_subtitle_layout.addItem(spacerItem3)
+        self.welcome_subtitle_label = QtWidgets.QLabel(parent=self.welcome_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.welcome_subtitle_label.sizePolicy().hasHeightForWidth())
+        self.welcome_subtitle_label.setSizePolicy(sizePolicy)
+        self.welcome_subtitle_label.setTextFormat(QtCore.Qt.TextFormat.RichText)
+        self.welcome_subtitle_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignHCenter|QtCore.Qt.AlignmentFlag.AlignTop)
+        self.welcome_subtitle_label.setWordWrap(True)
+        self.welcome_subtitle_label.setObjectName("welcome_subtitle_label")
+        self.welcome_subtitle_layout.addWidget(self.welcome_subtitle_label)
+        spacerItem4 = QtWidgets.QSpacerItem(80, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.welcome_subtitle_layout.addItem(spacerItem4)
+        self.welcome_container_layout.addLayout(self.welcome_subtitle_layout)
+        spacerItem5 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.welcome_container_layout.addItem(spacerItem5)
+        self.welcome_instructions_layout = QtWidgets.QHBoxLayout()
+        self.welcome_instructions_layout.setContentsMargins(0, 0, 0, 0)
+        self.welcome_instructions_layout.setSpacing(0)
+        self.welcome_instructions_layout.setObjectName("welcome_instructions_layout")
+        spacerItem6 = QtWidgets.QSpacerItem(80, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.welcome_instructions_layout.addItem(spacerItem6)
+        self.welcome_instructions_label = QtWidgets.QLabel(parent=self.welcome_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.welcome_instructions_label.sizePolicy().hasHeightForWidth())
+        self.welcome_instructions_label.setSizePolicy(sizePolicy)
+        self.welcome_instructions_label.setTextFormat(QtCore.Qt.TextFormat.RichText)
+        self.welcome_instructions_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignHCenter|QtCore.Qt.AlignmentFlag.AlignTop)
+        self.welcome_instructions_label.setWordWrap(True)
+        self.welcome_instructions_label.setObjectName("welcome_instructions_label")
+        self.welcome_instructions_layout.addWidget(self.welcome_instructions_label)
+        spacerItem7 = QtWidgets.QSpacerItem(80, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.welcome_instructions_layout.addItem(spacerItem7)
+        self.welcome_container_layout.addLayout(self.welcome_instructions_layout)
+        spacerItem8 = QtWidgets.QSpacerItem(20, 20, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.welcome_container_layout.addItem(spacerItem8)
+        self.welcome_buttons_layout = QtWidgets.QHBoxLayout()
+        self.welcome_buttons_layout.setSpacing(20)
+        self.welcome_buttons_layout.setObjectName("welcome_buttons_layout")
+        spacerItem9 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.welcome_buttons_layout.addItem(spacerItem9)
+        self.welcome_open_tob_button = QtWidgets.QPushButton(parent=self.welcome_container)
+        self.welcome_open_tob_button.setMinimumSize(QtCore.QSize(120, 35))
+        self.welcome_open_tob_button.setObjectName("welcome_open_tob_button")
+        self.welcome_buttons_layout.addWidget(self.welcome_open_tob_button)
+        self.welcome_open_project_button = QtWidgets.QPushButton(parent=self.welcome_container)
+        self.welcome_open_project_button.setMinimumSize(QtCore.QSize(120, 35))
+        self.welcome_open_project_button.setObjectName("welcome_open_project_button")
+        self.welcome_buttons_layout.addWidget(self.welcome_open_project_button)
+        spacerItem10 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.welcome_buttons_layout.addItem(spacerItem10)
+        self.welcome_container_layout.addLayout(self.welcome_buttons_layout)
+        spacerItem11 = QtWidgets.QSpacerItem(20, 0, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.welcome_container_layout.addItem(spacerItem11)
+        self.gridLayout_2.addWidget(self.welcome_container, 0, 0, 1, 1)
+        self.plot_container = QtWidgets.QFrame(parent=self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(1)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.plot_container.sizePolicy().hasHeightForWidth())
+        self.plot_container.setSizePolicy(sizePolicy)
+        self.plot_container.setVisible(False)
+        self.plot_container.setMaximumHeight(0)
+        self.plot_container.setObjectName("plot_container")
+        self.plot_container_layout = QtWidgets.QVBoxLayout(self.plot_container)
+        self.plot_container_layout.setContentsMargins(0, 0, 0, 0)
+        self.plot_container_layout.setObjectName("plot_container_layout")
+        self.plot_info_container = QtWidgets.QFrame(parent=self.plot_container)
+        self.plot_info_container.setObjectName("plot_info_container")
+        self.plot_info_container_layout = QtWidgets.QHBoxLayout(self.plot_info_container)
+        self.plot_info_container_layout.setContentsMargins(12, 0, 12, 8)
+        self.plot_info_container_layout.setSpacing(16)
+        self.plot_info_container_layout.setObjectName("plot_info_container_layout")
+        self.cruise_info_label = QtWidgets.QLabel(parent=self.plot_info_container)
+        self.cruise_info_label.setObjectName("cruise_info_label")
+        self.plot_info_container_layout.addWidget(self.cruise_info_label)
+        self.location_info_label = QtWidgets.QLabel(parent=self.plot_info_container)
+        self.location_info_label.setObjectName("location_info_label")
+        self.plot_info_container_layout.addWidget(self.location_info_label)
+        spacerItem12 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.plot_info_container_layout.addItem(spacerItem12)
+        self.plot_logo_label = QtWidgets.QLabel(parent=self.plot_info_container)
+        self.plot_logo_label.setText("")
+        self.plot_logo_label.setObjectName("plot_logo_label")
+        self.plot_info_container_layout.addWidget(self.plot_logo_label)
+        spacerItem13 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.plot_info_container_layout.addItem(spacerItem13)
+        self.navigation_toolbar_container = QtWidgets.QWidget(parent=self.plot_info_container)
+        self.navigation_toolbar_container.setObjectName("navigation_toolbar_container")
+        self.plot_info_container_layout.addWidget(self.navigation_toolbar_container)
+        self.plot_container_layout.addWidget(self.plot_info_container)
+        self.plot_canvas_container = QtWidgets.QWidget(parent=self.plot_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.plot_canvas_container.sizePolicy().hasHeightForWidth())
+        self.plot_canvas_container.setSizePolicy(sizePolicy)
+        self.plot_canvas_container.setObjectName("plot_canvas_container")
+        self.plot_container_layout.addWidget(self.plot_canvas_container)
+        self.gridLayout_2.addWidget(self.plot_container, 0, 0, 1, 1)
+        self.sidebar_container = QtWidgets.QWidget(parent=self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(1)
+        sizePolicy.setHeightForWidth(self.sidebar_container.sizePolicy().hasHeightForWidth())
+        self.sidebar_container.setSizePolicy(sizePolicy)
+        self.sidebar_container.setMinimumSize(QtCore.QSize(200, 0))
+        self.sidebar_container.setMaximumSize(QtCore.QSize(300, 16777215))
+        self.sidebar_container.setStyleSheet("")
+        self.sidebar_container.setObjectName("sidebar_container")
+        self.sidebar_container_layout = QtWidgets.QHBoxLayout(self.sidebar_container)
+        self.sidebar_container_layout.setContentsMargins(0, 0, 0, 0)
+        self.sidebar_container_layout.setSpacing(8)
+        self.sidebar_container_layout.setObjectName("sidebar_container_layout")
+        self.ntc_checkbox_container = QtWidgets.QWidget(parent=self.sidebar_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        sizePolicy.setHorizontalStretch(1)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc_checkbox_container.sizePolicy().hasHeightForWidth())
+        self.ntc_checkbox_container.setSizePolicy(sizePolicy)
+        self.ntc_checkbox_container.setMinimumSize(QtCore.QSize(120, 0))
+        self.ntc_checkbox_container.setObjectName("ntc_checkbox_container")
+        self.ntc_checkbox_container_layout = QtWidgets.QVBoxLayout(self.ntc_checkbox_container)
+        self.ntc_checkbox_container_layout.setContentsMargins(4, 4, 4, 4)
+        self.ntc_checkbox_container_layout.setSpacing(0)
+        self.ntc_checkbox_container_layout.setObjectName("ntc_checkbox_container_layout")
+        self.pt100_layout = QtWidgets.QHBoxLayout()
+        self.pt100_layout.setSpacing(8)
+        self.pt100_layout.setObjectName("pt100_layout")
+        self.ntc_pt100_checkbox = QtWidgets.QCheckBox(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(1)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc_pt100_checkbox.sizePolicy().hasHeightForWidth())
+        self.ntc_pt100_checkbox.setSizePolicy(sizePolicy)
+        self.ntc_pt100_checkbox.setMinimumSize(QtCore.QSize(0, 20))
+        self.ntc_pt100_checkbox.setChecked(True)
+        self.ntc_pt100_checkbox.setObjectName("ntc_pt100_checkbox")
+        self.pt100_layout.addWidget(self.ntc_pt100_checkbox)
+        self.pt100_style_label = QtWidgets.QLabel(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.pt100_style_label.sizePolicy().hasHeightForWidth())
+        self.pt100_style_label.setSizePolicy(sizePolicy)
+        self.pt100_style_label.setMinimumSize(QtCore.QSize(30, 16))
+        self.pt100_style_label.setMaximumSize(QtCore.QSize(30, 16))
+        self.pt100_style_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.pt100_style_label.setObjectName("pt100_style_label")
+        self.pt100_layout.addWidget(self.pt100_style_label)
+        self.ntc_checkbox_container_layout.addLayout(self.pt100_layout)
+        self.ntc22_layout = QtWidgets.QHBoxLayout()
+        self.ntc22_layout.setSpacing(8)
+        self.ntc22_layout.setObjectName("ntc22_layout")
+        self.ntc_22_checkbox = QtWidgets.QCheckBox(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc_22_checkbox.sizePolicy().hasHeightForWidth())
+        self.ntc_22_checkbox.setSizePolicy(sizePolicy)
+        self.ntc_22_checkbox.setChecked(True)
+        self.ntc_22_checkbox.setObjectName("ntc_22_checkbox")
+        self.ntc22_layout.addWidget(self.ntc_22_checkbox)
+        self.ntc22_style_label = QtWidgets.QLabel(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc22_style_label.sizePolicy().hasHeightForWidth())
+        self.ntc22_style_label.setSizePolicy(sizePolicy)
+        self.ntc22_style_label.setMinimumSize(QtCore.QSize(30, 16))
+        self.ntc22_style_label.setMaximumSize(QtCore.QSize(30, 16))
+        self.ntc22_style_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.ntc22_style_label.setObjectName("ntc22_style_label")
+        self.ntc22_layout.addWidget(self.ntc22_style_label)
+        self.ntc_checkbox_container_layout.addLayout(self.ntc22_layout)
+        self.ntc21_layout = QtWidgets.QHBoxLayout()
+        self.ntc21_layout.setSpacing(8)
+        self.ntc21_layout.setObjectName("ntc21_layout")
+        self.ntc_21_checkbox = QtWidgets.QCheckBox(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc_21_checkbox.sizePolicy().hasHeightForWidth())
+        self.ntc_21_checkbox.setSizePolicy(sizePolicy)
+        self.ntc_21_checkbox.setChecked(True)
+        self.ntc_21_checkbox.setObjectName("ntc_21_checkbox")
+        self.ntc21_layout.addWidget(self.ntc_21_checkbox)
+        self.ntc21_style_label = QtWidgets.QLabel(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc21_style_label.sizePolicy().hasHeightForWidth())
+        self.ntc21_style_label.setSizePolicy(sizePolicy)
+        self.ntc21_style_label.setMinimumSize(QtCore.QSize(30, 16))
+        self.ntc21_style_label.setMaximumSize(QtCore.QSize(30, 16))
+        self.ntc21_style_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.ntc21_style_label.setObjectName("ntc21_style_label")
+        self.ntc21_layout.addWidget(self.ntc21_style_label)
+        self.ntc_checkbox_container_layout.addLayout(self.ntc21_layout)
+        self.ntc20_layout = QtWidgets.QHBoxLayout()
+        self.ntc20_layout.setSpacing(8)
+        self.ntc20_layout.setObjectName("ntc20_layout")
+        self.ntc_20_checkbox = QtWidgets.QCheckBox(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc_20_checkbox.sizePolicy().hasHeightForWidth())
+        self.ntc_20_checkbox.setSizePolicy(sizePolicy)
+        self.ntc_20_checkbox.setChecked(True)
+        self.ntc_20_checkbox.setObjectName("ntc_20_checkbox")
+        self.ntc20_layout.addWidget(self.ntc_20_checkbox)
+        self.ntc20_style_label = QtWidgets.QLabel(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc20_style_label.sizePolicy().hasHeightForWidth())
+        self.ntc20_style_label.setSizePolicy(sizePolicy)
+        self.ntc20_style_label.setMinimumSize(QtCore.QSize(30, 16))
+        self.ntc20_style_label.setMaximumSize(QtCore.QSize(30, 16))
+        self.ntc20_style_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.ntc20_style_label.setObjectName("ntc20_style_label")
+        self.ntc20_layout.addWidget(self.ntc20_style_label)
+        self.ntc_checkbox_container_layout.addLayout(self.ntc20_layout)
+        self.ntc19_layout = QtWidgets.QHBoxLayout()
+        self.ntc19_layout.setSpacing(8)
+        self.ntc19_layout.setObjectName("ntc19_layout")
+        self.ntc_19_checkbox = QtWidgets.QCheckBox(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc_19_checkbox.sizePolicy().hasHeightForWidth())
+        self.ntc_19_checkbox.setSizePolicy(sizePolicy)
+        self.ntc_19_checkbox.setChecked(True)
+        self.ntc_19_checkbox.setObjectName("ntc_19_checkbox")
+        self.ntc19_layout.addWidget(self.ntc_19_checkbox)
+        self.ntc19_style_label = QtWidgets.QLabel(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc19_style_label.sizePolicy().hasHeightForWidth())
+        self.ntc19_style_label.setSizePolicy(sizePolicy)
+        self.ntc19_style_label.setMinimumSize(QtCore.QSize(30, 16))
+        self.ntc19_style_label.setMaximumSize(QtCore.QSize(30, 16))
+        self.ntc19_style_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.ntc19_style_label.setObjectName("ntc19_style_label")
+        self.ntc19_layout.addWidget(self.ntc19_style_label)
+        self.ntc_checkbox_container_layout.addLayout(self.ntc19_layout)
+        self.ntc18_layout = QtWidgets.QHBoxLayout()
+        self.ntc18_layout.setSpacing(8)
+        self.ntc18_layout.setObjectName("ntc18_layout")
+        self.ntc_18_checkbox = QtWidgets.QCheckBox(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc_18_checkbox.sizePolicy().hasHeightForWidth())
+        self.ntc_18_checkbox.setSizePolicy(sizePolicy)
+        self.ntc_18_checkbox.setChecked(True)
+        self.ntc_18_checkbox.setObjectName("ntc_18_checkbox")
+        self.ntc18_layout.addWidget(self.ntc_18_checkbox)
+        self.ntc18_style_label = QtWidgets.QLabel(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc18_style_label.sizePolicy().hasHeightForWidth())
+        self.ntc18_style_label.setSizePolicy(sizePolicy)
+        self.ntc18_style_label.setMinimumSize(QtCore.QSize(30, 16))
+        self.ntc18_style_label.setMaximumSize(QtCore.QSize(30, 16))
+        self.ntc18_style_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.ntc18_style_label.setObjectName("ntc18_style_label")
+        self.ntc18_layout.addWidget(self.ntc18_style_label)
+        self.ntc_checkbox_container_layout.addLayout(self.ntc18_layout)
+        self.ntc17_layout = QtWidgets.QHBoxLayout()
+        self.ntc17_layout.setSpacing(8)
+        self.ntc17_layout.setObjectName("ntc17_layout")
+        self.ntc_17_checkbox = QtWidgets.QCheckBox(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc_17_checkbox.sizePolicy().hasHeightForWidth())
+        self.ntc_17_checkbox.setSizePolicy(sizePolicy)
+        self.ntc_17_checkbox.setChecked(True)
+        self.ntc_17_checkbox.setObjectName("ntc_17_checkbox")
+        self.ntc17_layout.addWidget(self.ntc_17_checkbox)
+        self.ntc17_style_label = QtWidgets.QLabel(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc17_style_label.sizePolicy().hasHeightForWidth())
+        self.ntc17_style_label.setSizePolicy(sizePolicy)
+        self.ntc17_style_label.setMinimumSize(QtCore.QSize(30, 16))
+        self.ntc17_style_label.setMaximumSize(QtCore.QSize(30, 16))
+        self.ntc17_style_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.ntc17_style_label.setObjectName("ntc17_style_label")
+        self.ntc17_layout.addWidget(self.ntc17_style_label)
+        self.ntc_checkbox_container_layout.addLayout(self.ntc17_layout)
+        self.ntc16_layout = QtWidgets.QHBoxLayout()
+        self.ntc16_layout.setSpacing(8)
+        self.ntc16_layout.setObjectName("ntc16_layout")
+        self.ntc_16_checkbox = QtWidgets.QCheckBox(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc_16_checkbox.sizePolicy().hasHeightForWidth())
+        self.ntc_16_checkbox.setSizePolicy(sizePolicy)
+        self.ntc_16_checkbox.setChecked(True)
+        self.ntc_16_checkbox.setObjectName("ntc_16_checkbox")
+        self.ntc16_layout.addWidget(self.ntc_16_checkbox)
+        self.ntc16_style_label = QtWidgets.QLabel(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc16_style_label.sizePolicy().hasHeightForWidth())
+        self.ntc16_style_label.setSizePolicy(sizePolicy)
+        self.ntc16_style_label.setMinimumSize(QtCore.QSize(30, 16))
+        self.ntc16_style_label.setMaximumSize(QtCore.QSize(30, 16))
+        self.ntc16_style_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.ntc16_style_label.setObjectName("ntc16_style_label")
+        self.ntc16_layout.addWidget(self.ntc16_style_label)
+        self.ntc_checkbox_container_layout.addLayout(self.ntc16_layout)
+        self.ntc15_layout = QtWidgets.QHBoxLayout()
+        self.ntc15_layout.setSpacing(8)
+        self.ntc15_layout.setObjectName("ntc15_layout")
+        self.ntc_15_checkbox = QtWidgets.QCheckBox(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc_15_checkbox.sizePolicy().hasHeightForWidth())
+        self.ntc_15_checkbox.setSizePolicy(sizePolicy)
+        self.ntc_15_checkbox.setChecked(True)
+        self.ntc_15_checkbox.setObjectName("ntc_15_checkbox")
+        self.ntc15_layout.addWidget(self.ntc_15_checkbox)
+        self.ntc15_style_label = QtWidgets.QLabel(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc15_style_label.sizePolicy().hasHeightForWidth())
+        self.ntc15_style_label.setSizePolicy(sizePolicy)
+        self.ntc15_style_label.setMinimumSize(QtCore.QSize(30, 16))
+        self.ntc15_style_label.setMaximumSize(QtCore.QSize(30, 16))
+        self.ntc15_style_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.ntc15_style_label.setObjectName("ntc15_style_label")
+        self.ntc15_layout.addWidget(self.ntc15_style_label)
+        self.ntc_checkbox_container_layout.addLayout(self.ntc15_layout)
+        self.ntc14_layout = QtWidgets.QHBoxLayout()
+        self.ntc14_layout.setSpacing(8)
+        self.ntc14_layout.setObjectName("ntc14_layout")
+        self.ntc_14_checkbox = QtWidgets.QCheckBox(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc_14_checkbox.sizePolicy().hasHeightForWidth())
+        self.ntc_14_checkbox.setSizePolicy(sizePolicy)
+        self.ntc_14_checkbox.setChecked(True)
+        self.ntc_14_checkbox.setObjectName("ntc_14_checkbox")
+        self.ntc14_layout.addWidget(self.ntc_14_checkbox)
+        self.ntc14_style_label = QtWidgets.QLabel(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc14_style_label.sizePolicy().hasHeightForWidth())
+        self.ntc14_style_label.setSizePolicy(sizePolicy)
+        self.ntc14_style_label.setMinimumSize(QtCore.QSize(30, 16))
+        self.ntc14_style_label.setMaximumSize(QtCore.QSize(30, 16))
+        self.ntc14_style_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.ntc14_style_label.setObjectName("ntc14_style_label")
+        self.ntc14_layout.addWidget(self.ntc14_style_label)
+        self.ntc_checkbox_container_layout.addLayout(self.ntc14_layout)
+        self.ntc13_layout = QtWidgets.QHBoxLayout()
+        self.ntc13_layout.setSpacing(8)
+        self.ntc13_layout.setObjectName("ntc13_layout")
+        self.ntc_13_checkbox = QtWidgets.QCheckBox(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc_13_checkbox.sizePolicy().hasHeightForWidth())
+        self.ntc_13_checkbox.setSizePolicy(sizePolicy)
+        self.ntc_13_checkbox.setChecked(True)
+        self.ntc_13_checkbox.setObjectName("ntc_13_checkbox")
+        self.ntc13_layout.addWidget(self.ntc_13_checkbox)
+        self.ntc13_style_label = QtWidgets.QLabel(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc13_style_label.sizePolicy().hasHeightForWidth())
+        self.ntc13_style_label.setSizePolicy(sizePolicy)
+        self.ntc13_style_label.setMinimumSize(QtCore.QSize(30, 16))
+        self.ntc13_style_label.setMaximumSize(QtCore.QSize(30, 16))
+        self.ntc13_style_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.ntc13_style_label.setObjectName("ntc13_style_label")
+        self.ntc13_layout.addWidget(self.ntc13_style_label)
+        self.ntc_checkbox_container_layout.addLayout(self.ntc13_layout)
+        self.ntc12_layout = QtWidgets.QHBoxLayout()
+        self.ntc12_layout.setSpacing(8)
+        self.ntc12_layout.setObjectName("ntc12_layout")
+        self.ntc_12_checkbox = QtWidgets.QCheckBox(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc_12_checkbox.sizePolicy().hasHeightForWidth())
+        self.ntc_12_checkbox.setSizePolicy(sizePolicy)
+        self.ntc_12_checkbox.setChecked(True)
+        self.ntc_12_checkbox.setObjectName("ntc_12_checkbox")
+        self.ntc12_layout.addWidget(self.ntc_12_checkbox)
+        self.ntc12_style_label = QtWidgets.QLabel(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc12_style_label.sizePolicy().hasHeightForWidth())
+        self.ntc12_style_label.setSizePolicy(sizePolicy)
+        self.ntc12_style_label.setMinimumSize(QtCore.QSize(30, 16))
+        self.ntc12_style_label.setMaximumSize(QtCore.QSize(30, 16))
+        self.ntc12_style_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.ntc12_style_label.setObjectName("ntc12_style_label")
+        self.ntc12_layout.addWidget(self.ntc12_style_label)
+        self.ntc_checkbox_container_layout.addLayout(self.ntc12_layout)
+        self.ntc11_layout = QtWidgets.QHBoxLayout()
+        self.ntc11_layout.setSpacing(8)
+        self.ntc11_layout.setObjectName("ntc11_layout")
+        self.ntc_11_checkbox = QtWidgets.QCheckBox(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc_11_checkbox.sizePolicy().hasHeightForWidth())
+        self.ntc_11_checkbox.setSizePolicy(sizePolicy)
+        self.ntc_11_checkbox.setChecked(True)
+        self.ntc_11_checkbox.setObjectName("ntc_11_checkbox")
+        self.ntc11_layout.addWidget(self.ntc_11_checkbox)
+        self.ntc11_style_label = QtWidgets.QLabel(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc11_style_label.sizePolicy().hasHeightForWidth())
+        self.ntc11_style_label.setSizePolicy(sizePolicy)
+        self.ntc11_style_label.setMinimumSize(QtCore.QSize(30, 16))
+        self.ntc11_style_label.setMaximumSize(QtCore.QSize(30, 16))
+        self.ntc11_style_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.ntc11_style_label.setObjectName("ntc11_style_label")
+        self.ntc11_layout.addWidget(self.ntc11_style_label)
+        self.ntc_checkbox_container_layout.addLayout(self.ntc11_layout)
+        self.ntc10_layout = QtWidgets.QHBoxLayout()
+        self.ntc10_layout.setSpacing(8)
+        self.ntc10_layout.setObjectName("ntc10_layout")
+        self.ntc_10_checkbox = QtWidgets.QCheckBox(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc_10_checkbox.sizePolicy().hasHeightForWidth())
+        self.ntc_10_checkbox.setSizePolicy(sizePolicy)
+        self.ntc_10_checkbox.setChecked(True)
+        self.ntc_10_checkbox.setObjectName("ntc_10_checkbox")
+        self.ntc10_layout.addWidget(self.ntc_10_checkbox)
+        self.ntc10_style_label = QtWidgets.QLabel(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc10_style_label.sizePolicy().hasHeightForWidth())
+        self.ntc10_style_label.setSizePolicy(sizePolicy)
+        self.ntc10_style_label.setMinimumSize(QtCore.QSize(30, 16))
+        self.ntc10_style_label.setMaximumSize(QtCore.QSize(30, 16))
+        self.ntc10_style_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.ntc10_style_label.setObjectName("ntc10_style_label")
+        self.ntc10_layout.addWidget(self.ntc10_style_label)
+        self.ntc_checkbox_container_layout.addLayout(self.ntc10_layout)
+        self.ntc09_layout = QtWidgets.QHBoxLayout()
+        self.ntc09_layout.setSpacing(8)
+        self.ntc09_layout.setObjectName("ntc09_layout")
+        self.ntc_09_checkbox = QtWidgets.QCheckBox(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc_09_checkbox.sizePolicy().hasHeightForWidth())
+        self.ntc_09_checkbox.setSizePolicy(sizePolicy)
+        self.ntc_09_checkbox.setChecked(True)
+        self.ntc_09_checkbox.setObjectName("ntc_09_checkbox")
+        self.ntc09_layout.addWidget(self.ntc_09_checkbox)
+        self.ntc09_style_label = QtWidgets.QLabel(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc09_style_label.sizePolicy().hasHeightForWidth())
+        self.ntc09_style_label.setSizePolicy(sizePolicy)
+        self.ntc09_style_label.setMinimumSize(QtCore.QSize(30, 16))
+        self.ntc09_style_label.setMaximumSize(QtCore.QSize(30, 16))
+        self.ntc09_style_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.ntc09_style_label.setObjectName("ntc09_style_label")
+        self.ntc09_layout.addWidget(self.ntc09_style_label)
+        self.ntc_checkbox_container_layout.addLayout(self.ntc09_layout)
+        self.ntc08_layout = QtWidgets.QHBoxLayout()
+        self.ntc08_layout.setSpacing(8)
+        self.ntc08_layout.setObjectName("ntc08_layout")
+        self.ntc_08_checkbox = QtWidgets.QCheckBox(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc_08_checkbox.sizePolicy().hasHeightForWidth())
+        self.ntc_08_checkbox.setSizePolicy(sizePolicy)
+        self.ntc_08_checkbox.setChecked(True)
+        self.ntc_08_checkbox.setObjectName("ntc_08_checkbox")
+        self.ntc08_layout.addWidget(self.ntc_08_checkbox)
+        self.ntc08_style_label = QtWidgets.QLabel(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc08_style_label.sizePolicy().hasHeightForWidth())
+        self.ntc08_style_label.setSizePolicy(sizePolicy)
+        self.ntc08_style_label.setMinimumSize(QtCore.QSize(30, 16))
+        self.ntc08_style_label.setMaximumSize(QtCore.QSize(30, 16))
+        self.ntc08_style_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.ntc08_style_label.setObjectName("ntc08_style_label")
+        self.ntc08_layout.addWidget(self.ntc08_style_label)
+        self.ntc_checkbox_container_layout.addLayout(self.ntc08_layout)
+        self.ntc07_layout = QtWidgets.QHBoxLayout()
+        self.ntc07_layout.setSpacing(8)
+        self.ntc07_layout.setObjectName("ntc07_layout")
+        self.ntc_07_checkbox = QtWidgets.QCheckBox(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc_07_checkbox.sizePolicy().hasHeightForWidth())
+        self.ntc_07_checkbox.setSizePolicy(sizePolicy)
+        self.ntc_07_checkbox.setChecked(True)
+        self.ntc_07_checkbox.setObjectName("ntc_07_checkbox")
+        self.ntc07_layout.addWidget(self.ntc_07_checkbox)
+        self.ntc07_style_label = QtWidgets.QLabel(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc07_style_label.sizePolicy().hasHeightForWidth())
+        self.ntc07_style_label.setSizePolicy(sizePolicy)
+        self.ntc07_style_label.setMinimumSize(QtCore.QSize(30, 16))
+        self.ntc07_style_label.setMaximumSize(QtCore.QSize(30, 16))
+        self.ntc07_style_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.ntc07_style_label.setObjectName("ntc07_style_label")
+        self.ntc07_layout.addWidget(self.ntc07_style_label)
+        self.ntc_checkbox_container_layout.addLayout(self.ntc07_layout)
+        self.ntc06_layout = QtWidgets.QHBoxLayout()
+        self.ntc06_layout.setSpacing(8)
+        self.ntc06_layout.setObjectName("ntc06_layout")
+        self.ntc_06_checkbox = QtWidgets.QCheckBox(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc_06_checkbox.sizePolicy().hasHeightForWidth())
+        self.ntc_06_checkbox.setSizePolicy(sizePolicy)
+        self.ntc_06_checkbox.setChecked(True)
+        self.ntc_06_checkbox.setObjectName("ntc_06_checkbox")
+        self.ntc06_layout.addWidget(self.ntc_06_checkbox)
+        self.ntc06_style_label = QtWidgets.QLabel(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc06_style_label.sizePolicy().hasHeightForWidth())
+        self.ntc06_style_label.setSizePolicy(sizePolicy)
+        self.ntc06_style_label.setMinimumSize(QtCore.QSize(30, 16))
+        self.ntc06_style_label.setMaximumSize(QtCore.QSize(30, 16))
+        self.ntc06_style_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.ntc06_style_label.setObjectName("ntc06_style_label")
+        self.ntc06_layout.addWidget(self.ntc06_style_label)
+        self.ntc_checkbox_container_layout.addLayout(self.ntc06_layout)
+        self.ntc05_layout = QtWidgets.QHBoxLayout()
+        self.ntc05_layout.setSpacing(8)
+        self.ntc05_layout.setObjectName("ntc05_layout")
+        self.ntc_05_checkbox = QtWidgets.QCheckBox(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc_05_checkbox.sizePolicy().hasHeightForWidth())
+        self.ntc_05_checkbox.setSizePolicy(sizePolicy)
+        self.ntc_05_checkbox.setChecked(True)
+        self.ntc_05_checkbox.setObjectName("ntc_05_checkbox")
+        self.ntc05_layout.addWidget(self.ntc_05_checkbox)
+        self.ntc05_style_label = QtWidgets.QLabel(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc05_style_label.sizePolicy().hasHeightForWidth())
+        self.ntc05_style_label.setSizePolicy(sizePolicy)
+        self.ntc05_style_label.setMinimumSize(QtCore.QSize(30, 16))
+        self.ntc05_style_label.setMaximumSize(QtCore.QSize(30, 16))
+        self.ntc05_style_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.ntc05_style_label.setObjectName("ntc05_style_label")
+        self.ntc05_layout.addWidget(self.ntc05_style_label)
+        self.ntc_checkbox_container_layout.addLayout(self.ntc05_layout)
+        self.ntc04_layout = QtWidgets.QHBoxLayout()
+        self.ntc04_layout.setSpacing(8)
+        self.ntc04_layout.setObjectName("ntc04_layout")
+        self.ntc_04_checkbox = QtWidgets.QCheckBox(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc_04_checkbox.sizePolicy().hasHeightForWidth())
+        self.ntc_04_checkbox.setSizePolicy(sizePolicy)
+        self.ntc_04_checkbox.setChecked(True)
+        self.ntc_04_checkbox.setObjectName("ntc_04_checkbox")
+        self.ntc04_layout.addWidget(self.ntc_04_checkbox)
+        self.ntc04_style_label = QtWidgets.QLabel(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc04_style_label.sizePolicy().hasHeightForWidth())
+        self.ntc04_style_label.setSizePolicy(sizePolicy)
+        self.ntc04_style_label.setMinimumSize(QtCore.QSize(30, 16))
+        self.ntc04_style_label.setMaximumSize(QtCore.QSize(30, 16))
+        self.ntc04_style_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.ntc04_style_label.setObjectName("ntc04_style_label")
+        self.ntc04_layout.addWidget(self.ntc04_style_label)
+        self.ntc_checkbox_container_layout.addLayout(self.ntc04_layout)
+        self.ntc03_layout = QtWidgets.QHBoxLayout()
+        self.ntc03_layout.setSpacing(8)
+        self.ntc03_layout.setObjectName("ntc03_layout")
+        self.ntc_03_checkbox = QtWidgets.QCheckBox(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc_03_checkbox.sizePolicy().hasHeightForWidth())
+        self.ntc_03_checkbox.setSizePolicy(sizePolicy)
+        self.ntc_03_checkbox.setChecked(True)
+        self.ntc_03_checkbox.setObjectName("ntc_03_checkbox")
+        self.ntc03_layout.addWidget(self.ntc_03_checkbox)
+        self.ntc03_style_label = QtWidgets.QLabel(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc03_style_label.sizePolicy().hasHeightForWidth())
+        self.ntc03_style_label.setSizePolicy(sizePolicy)
+        self.ntc03_style_label.setMinimumSize(QtCore.QSize(30, 16))
+        self.ntc03_style_label.setMaximumSize(QtCore.QSize(30, 16))
+        self.ntc03_style_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.ntc03_style_label.setObjectName("ntc03_style_label")
+        self.ntc03_layout.addWidget(self.ntc03_style_label)
+        self.ntc_checkbox_container_layout.addLayout(self.ntc03_layout)
+        self.ntc02_layout = QtWidgets.QHBoxLayout()
+        self.ntc02_layout.setSpacing(8)
+        self.ntc02_layout.setObjectName("ntc02_layout")
+        self.ntc_02_checkbox = QtWidgets.QCheckBox(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc_02_checkbox.sizePolicy().hasHeightForWidth())
+        self.ntc_02_checkbox.setSizePolicy(sizePolicy)
+        self.ntc_02_checkbox.setChecked(True)
+        self.ntc_02_checkbox.setObjectName("ntc_02_checkbox")
+        self.ntc02_layout.addWidget(self.ntc_02_checkbox)
+        self.ntc02_style_label = QtWidgets.QLabel(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc02_style_label.sizePolicy().hasHeightForWidth())
+        self.ntc02_style_label.setSizePolicy(sizePolicy)
+        self.ntc02_style_label.setMinimumSize(QtCore.QSize(30, 16))
+        self.ntc02_style_label.setMaximumSize(QtCore.QSize(30, 16))
+        self.ntc02_style_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.ntc02_style_label.setObjectName("ntc02_style_label")
+        self.ntc02_layout.addWidget(self.ntc02_style_label)
+        self.ntc_checkbox_container_layout.addLayout(self.ntc02_layout)
+        self.ntc01_layout = QtWidgets.QHBoxLayout()
+        self.ntc01_layout.setSpacing(8)
+        self.ntc01_layout.setObjectName("ntc01_layout")
+        self.ntc_01_checkbox = QtWidgets.QCheckBox(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc_01_checkbox.sizePolicy().hasHeightForWidth())
+        self.ntc_01_checkbox.setSizePolicy(sizePolicy)
+        self.ntc_01_checkbox.setChecked(True)
+        self.ntc_01_checkbox.setObjectName("ntc_01_checkbox")
+        self.ntc01_layout.addWidget(self.ntc_01_checkbox)
+        self.ntc01_style_label = QtWidgets.QLabel(parent=self.ntc_checkbox_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ntc01_style_label.sizePolicy().hasHeightForWidth())
+        self.ntc01_style_label.setSizePolicy(sizePolicy)
+        self.ntc01_style_label.setMinimumSize(QtCore.QSize(30, 16))
+        self.ntc01_style_label.setMaximumSize(QtCore.QSize(30, 16))
+        self.ntc01_style_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.ntc01_style_label.setObjectName("ntc01_style_label")
+        self.ntc01_layout.addWidget(self.ntc01_style_label)
+        self.ntc_checkbox_container_layout.addLayout(self.ntc01_layout)
+        self.sidebar_container_layout.addWidget(self.ntc_checkbox_container)
+        self.status_display_container = QtWidgets.QWidget(parent=self.sidebar_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Minimum)
+        sizePolicy.setHorizontalStretch(1)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.status_display_container.sizePolicy().hasHeightForWidth())
+        self.status_display_container.setSizePolicy(sizePolicy)
+        self.status_display_container.setMinimumSize(QtCore.QSize(50, 0))
+        self.status_display_container.setStyleSheet("background-color: white;")
+        self.status_display_container.setObjectName("status_display_container")
+        self.status_display_container_layout = QtWidgets.QVBoxLayout(self.status_display_container)
+        self.status_display_container_layout.setContentsMargins(8, 8, 8, 8)
+        self.status_display_container_layout.setSpacing(2)
+        self.status_display_container_layout.setObjectName("status_display_container_layout")
+        self.sensor_string_image_label = QtWidgets.QLabel(parent=self.status_display_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.sensor_string_image_label.sizePolicy().hasHeightForWidth())
+        self.sensor_string_image_label.setSizePolicy(sizePolicy)
+        self.sensor_string_image_label.setMinimumSize(QtCore.QSize(120, 0))
+        self.sensor_string_image_label.setMaximumSize(QtCore.QSize(180, 16777215))
+        self.sensor_string_image_label.setStyleSheet("")
+        self.sensor_string_image_label.setScaledContents(True)
+        self.sensor_string_image_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.sensor_string_image_label.setObjectName("sensor_string_image_label")
+        self.status_display_container_layout.addWidget(self.sensor_string_image_label)
+        self.sidebar_container_layout.addWidget(self.status_display_container)
+        self.gridLayout_2.addWidget(self.sidebar_container, 0, 1, 1, 1)
+        self.bottom_container = QtWidgets.QFrame(parent=self.centralwidget)
+        self.bottom_container.setMinimumSize(QtCore.QSize(0, 160))
+        self.bottom_container.setMaximumSize(QtCore.QSize(16777215, 160))
+        self.bottom_container.setObjectName("bottom_container")
+        self.bottom_container_layout = QtWidgets.QHBoxLayout(self.bottom_container)
+        self.bottom_container_layout.setContentsMargins(0, 0, 0, 0)
+        self.bottom_container_layout.setObjectName("bottom_container_layout")
+        self.data_metrics_frame = QtWidgets.QFrame(parent=self.bottom_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.data_metrics_frame.sizePolicy().hasHeightForWidth())
+        self.data_metrics_frame.setSizePolicy(sizePolicy)
+        self.data_metrics_frame.setMinimumSize(QtCore.QSize(220, 120))
+        self.data_metrics_frame.setMaximumSize(QtCore.QSize(280, 16777215))
+        self.data_metrics_frame.setObjectName("data_metrics_frame")
+        self.gridLayout_stats = QtWidgets.QGridLayout(self.data_metrics_frame)
+        self.gridLayout_stats.setContentsMargins(12, 8, 12, 8)
+        self.gridLayout_stats.setSpacing(8)
+        self.gridLayout_stats.setObjectName("gridLayout_stats")
+        self.mean_hp_power_label = QtWidgets.QLabel(parent=self.data_metrics_frame)
+        self.mean_hp_power_label.setObjectName("mean_hp_power_label")
+        self.gridLayout_stats.addWidget(self.mean_hp_power_label, 0, 0, 1, 1)
+        self.mean_hp_power_value = QtWidgets.QLineEdit(parent=self.data_metrics_frame)
+        self.mean_hp_power_value.setMinimumSize(QtCore.QSize(60, 25))
+        self.mean_hp_power_value.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.mean_hp_power_value.setReadOnly(True)
+        self.mean_hp_power_value.setObjectName("mean_hp_power_value")
+        self.gridLayout_stats.addWidget(self.mean_hp_power_value, 0, 1, 1, 1)
+        self.max_v_accu_label = QtWidgets.QLabel(parent=self.data_metrics_frame)
+        self.max_v_accu_label.setObjectName("max_v_accu_label")
+        self.gridLayout_stats.addWidget(self.max_v_accu_label, 1, 0, 1, 1)
+        self.max_v_accu_value = QtWidgets.QLineEdit(parent=self.data_metrics_frame)
+        self.max_v_accu_value.setMinimumSize(QtCore.QSize(60, 25))
+        self.max_v_accu_value.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.max_v_accu_value.setReadOnly(True)
+        self.max_v_accu_value.setObjectName("max_v_accu_value")
+        self.gridLayout_stats.addWidget(self.max_v_accu_value, 1, 1, 1, 1)
+        self.tilt_status_label = QtWidgets.QLabel(parent=self.data_metrics_frame)
+        self.tilt_status_label.setObjectName("tilt_status_label")
+        self.gridLayout_stats.addWidget(self.tilt_status_label, 2, 0, 1, 1)
+        self.tilt_status_value = QtWidgets.QLineEdit(parent=self.data_metrics_frame)
+        self.tilt_status_value.setMinimumSize(QtCore.QSize(60, 25))
+        self.tilt_status_value.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.tilt_status_value.setReadOnly(True)
+        self.tilt_status_value.setObjectName("tilt_status_value")
+        self.gridLayout_stats.addWidget(self.tilt_status_value, 2, 1, 1, 1)
+        self.mean_press_label = QtWidgets.QLabel(parent=self.data_metrics_frame)
+        self.mean_press_label.setObjectName("mean_press_label")
+        self.gridLayout_stats.addWidget(self.mean_press_label, 3, 0, 1, 1)
+        self.mean_press_value = QtWidgets.QLineEdit(parent=self.data_metrics_frame)
+        self.mean_press_value.setMinimumSize(QtCore.QSize(60, 25))
+        self.mean_press_value.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.mean_press_value.setReadOnly(True)
+        self.mean_press_value.setObjectName("mean_press_value")
+        self.gridLayout_stats.addWidget(self.mean_press_value, 3, 1, 1, 1)
+        self.bottom_container_layout.addWidget(self.data_metrics_frame)
+        self.secondary_plot_control_frame = QtWidgets.QFrame(parent=self.bottom_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(1)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.secondary_plot_control_frame.sizePolicy().hasHeightForWidth())
+        self.secondary_plot_control_frame.setSizePolicy(sizePolicy)
+        self.secondary_plot_control_frame.setMinimumSize(QtCore.QSize(400, 160))
+        self.secondary_plot_control_frame.setMaximumSize(QtCore.QSize(500, 16777215))
+        self.secondary_plot_control_frame.setObjectName("secondary_plot_control_frame")
+        self.horizontalLayout_axis_controls = QtWidgets.QHBoxLayout(self.secondary_plot_control_frame)
+        self.horizontalLayout_axis_controls.setContentsMargins(8, 8, 8, 8)
+        self.horizontalLayout_axis_controls.setSpacing(8)
+        self.horizontalLayout_axis_controls.setObjectName("horizontalLayout_axis_controls")
+        self.y1_axis_frame = QtWidgets.QFrame(parent=self.secondary_plot_control_frame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.y1_axis_frame.sizePolicy().hasHeightForWidth())
+        self.y1_axis_frame.setSizePolicy(sizePolicy)
+        self.y1_axis_frame.setMinimumSize(QtCore.QSize(120, 0))
+        self.y1_axis_frame.setObjectName("y1_axis_frame")
+        self.verticalLayout_y1 = QtWidgets.QVBoxLayout(self.y1_axis_frame)
+        self.verticalLayout_y1.setContentsMargins(6, 6, 6, 6)
+        self.verticalLayout_y1.setSpacing(4)
+        self.verticalLayout_y1.setObjectName("verticalLayout_y1")
+        self.y1_axis_label = QtWidgets.QLabel(parent=self.y1_axis_frame)
+        self.y1_axis_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignHCenter|QtCore.Qt.AlignmentFlag.AlignTop)
+        self.y1_axis_label.setObjectName("y1_axis_label")
+        self.verticalLayout_y1.addWidget(self.y1_axis_label)
+        self.y1_axis_combo = QtWidgets.QComboBox(parent=self.y1_axis_frame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(1)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.y1_axis_combo.sizePolicy().hasHeightForWidth())
+        self.y1_axis_combo.setSizePolicy(sizePolicy)
+        self.y1_axis_combo.setMinimumSize(QtCore.QSize(56, 0))
+        self.y1_axis_combo.setObjectName("y1_axis_combo")
+        self.verticalLayout_y1.addWidget(self.y1_axis_combo)
+        self.horizontalLayout_y1_min = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_y1_min.setObjectName("horizontalLayout_y1_min")
+        self.y1_min_label = QtWidgets.QLabel(parent=self.y1_axis_frame)
+        self.y1_min_label.setObjectName("y1_min_label")
+        self.horizontalLayout_y1_min.addWidget(self.y1_min_label)
+        self.y1_min_value = QtWidgets.QLineEdit(parent=self.y1_axis_frame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(1)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.y1_min_value.sizePolicy().hasHeightForWidth())
+        self.y1_min_value.setSizePolicy(sizePolicy)
+        self.y1_min_value.setMinimumSize(QtCore.QSize(50, 0))
+        self.y1_min_value.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.y1_min_value.setObjectName("y1_min_value")
+        self.horizontalLayout_y1_min.addWidget(self.y1_min_value)
+        self.verticalLayout_y1.addLayout(self.horizontalLayout_y1_min)
+        self.horizontalLayout_y1_max = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_y1_max.setObjectName("horizontalLayout_y1_max")
+        self.y1_max_label = QtWidgets.QLabel(parent=self.y1_axis_frame)
+        self.y1_max_label.setObjectName("y1_max_label")
+        self.horizontalLayout_y1_max.addWidget(self.y1_max_label)
+        self.y1_max_value = QtWidgets.QLineEdit(parent=self.y1_axis_frame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(1)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.y1_max_value.sizePolicy().hasHeightForWidth())
+        self.y1_max_value.setSizePolicy(sizePolicy)
+        self.y1_max_value.setMinimumSize(QtCore.QSize(50, 0))
+        self.y1_max_value.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.y1_max_value.setObjectName("y1_max_value")
+        self.horizontalLayout_y1_max.addWidget(self.y1_max_value)
+        self.verticalLayout_y1.addLayout(self.horizontalLayout_y1_max)
+        self.horizontalLayout_y1_mode = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_y1_mode.setObjectName("horizontalLayout_y1_mode")
+        self.y1_auto_checkbox = QtWidgets.QCheckBox(parent=self.y1_axis_frame)
+        self.y1_auto_checkbox.setChecked(True)
+        self.y1_auto_checkbox.setObjectName("y1_auto_checkbox")
+        self.horizontalLayout_y1_mode.addWidget(self.y1_auto_checkbox)
+        self.verticalLayout_y1.addLayout(self.horizontalLayout_y1_mode)
+        self.horizontalLayout_axis_controls.addWidget(self.y1_axis_frame)
+        spacerItem14 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_axis_controls.addItem(spacerItem14)
+        self.y2_axis_frame = QtWidgets.QFrame(parent=self.secondary_plot_control_frame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.y2_axis_frame.sizePolicy().hasHeightForWidth())
+        self.y2_axis_frame.setSizePolicy(sizePolicy)
+        self.y2_axis_frame.setMinimumSize(QtCore.QSize(120, 0))
+        self.y2_axis_frame.setObjectName("y2_axis_frame")
+        self.verticalLayout_y2 = QtWidgets.QVBoxLayout(self.y2_axis_frame)
+        self.verticalLayout_y2.setContentsMargins(6, 6, 6, 6)
+        self.verticalLayout_y2.setSpacing(4)
+        self.verticalLayout_y2.setObjectName("verticalLayout_y2")
+        self.y2_axis_label = QtWidgets.QLabel(parent=self.y2_axis_frame)
+        self.y2_axis_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignHCenter|QtCore.Qt.AlignmentFlag.AlignTop)
+        self.y2_axis_label.setObjectName("y2_axis_label")
+        self.verticalLayout_y2.addWidget(self.y2_axis_label)
+        self.y2_axis_combo = QtWidgets.QComboBox(parent=self.y2_axis_frame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(1)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.y2_axis_combo.sizePolicy().hasHeightForWidth())
+        self.y2_axis_combo.setSizePolicy(sizePolicy)
+        self.y2_axis_combo.setMinimumSize(QtCore.QSize(56, 0))
+        self.y2_axis_combo.setObjectName("y2_axis_combo")
+        self.verticalLayout_y2.addWidget(self.y2_axis_combo)
+        self.horizontalLayout_y2_min = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_y2_min.setObjectName("horizontalLayout_y2_min")
+        self.y2_min_label = QtWidgets.QLabel(parent=self.y2_axis_frame)
+        self.y2_min_label.setObjectName("y2_min_label")
+        self.horizontalLayout_y2_min.addWidget(self.y2_min_label)
+        self.y2_min_value = QtWidgets.QLineEdit(parent=self.y2_axis_frame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(1)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.y2_min_value.sizePolicy().hasHeightForWidth())
+        self.y2_min_value.setSizePolicy(sizePolicy)
+        self.y2_min_value.setMinimumSize(QtCore.QSize(50, 0))
+        self.y2_min_value.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.y2_min_value.setObjectName("y2_min_value")
+        self.horizontalLayout_y2_min.addWidget(self.y2_min_value)
+        self.verticalLayout_y2.addLayout(self.horizontalLayout_y2_min)
+        self.horizontalLayout_y2_max = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_y2_max.setObjectName("horizontalLayout_y2_max")
+        self.y2_max_label = QtWidgets.QLabel(parent=self.y2_axis_frame)
+        self.y2_max_label.setObjectName("y2_max_label")
+        self.horizontalLayout_y2_max.addWidget(self.y2_max_label)
+        self.y2_max_value = QtWidgets.QLineEdit(parent=self.y2_axis_frame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(1)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.y2_max_value.sizePolicy().hasHeightForWidth())
+        self.y2_max_value.setSizePolicy(sizePolicy)
+        self.y2_max_value.setMinimumSize(QtCore.QSize(50, 0))
+        self.y2_max_value.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.y2_max_value.setObjectName("y2_max_value")
+        self.horizontalLayout_y2_max.addWidget(self.y2_max_value)
+        self.verticalLayout_y2.addLayout(self.horizontalLayout_y2_max)
+        self.horizontalLayout_y2_mode = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_y2_mode.setObjectName("horizontalLayout_y2_mode")
+        self.y2_auto_checkbox = QtWidgets.QCheckBox(parent=self.y2_axis_frame)
+        self.y2_auto_checkbox.setChecked(True)
+        self.y2_auto_checkbox.setObjectName("y2_auto_checkbox")
+        self.horizontalLayout_y2_mode.addWidget(self.y2_auto_checkbox)
+        self.verticalLayout_y2.addLayout(self.horizontalLayout_y2_mode)
+        self.horizontalLayout_axis_controls.addWidget(self.y2_axis_frame)
+        spacerItem15 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_axis_controls.addItem(spacerItem15)
+        self.x_axis_frame = QtWidgets.QFrame(parent=self.secondary_plot_control_frame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.x_axis_frame.sizePolicy().hasHeightForWidth())
+        self.x_axis_frame.setSizePolicy(sizePolicy)
+        self.x_axis_frame.setMinimumSize(QtCore.QSize(120, 0))
+        self.x_axis_frame.setObjectName("x_axis_frame")
+        self.verticalLayout_x = QtWidgets.QVBoxLayout(self.x_axis_frame)
+        self.verticalLayout_x.setContentsMargins(6, 6, 6, 6)
+        self.verticalLayout_x.setSpacing(4)
+        self.verticalLayout_x.setObjectName("verticalLayout_x")
+        self.x_axis_label = QtWidgets.QLabel(parent=self.x_axis_frame)
+        self.x_axis_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignHCenter|QtCore.Qt.AlignmentFlag.AlignTop)
+        self.x_axis_label.setObjectName("x_axis_label")
+        self.verticalLayout_x.addWidget(self.x_axis_label)
+        self.x_axis_combo = QtWidgets.QComboBox(parent=self.x_axis_frame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(1)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.x_axis_combo.sizePolicy().hasHeightForWidth())
+        self.x_axis_combo.setSizePolicy(sizePolicy)
+        self.x_axis_combo.setMinimumSize(QtCore.QSize(56, 0))
+        self.x_axis_combo.setObjectName("x_axis_combo")
+        self.verticalLayout_x.addWidget(self.x_axis_combo)
+        self.horizontalLayout_x_min = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_x_min.setObjectName("horizontalLayout_x_min")
+        self.x_min_label = QtWidgets.QLabel(parent=self.x_axis_frame)
+        self.x_min_label.setObjectName("x_min_label")
+        self.horizontalLayout_x_min.addWidget(self.x_min_label)
+        self.x_min_value = QtWidgets.QLineEdit(parent=self.x_axis_frame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(1)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.x_min_value.sizePolicy().hasHeightForWidth())
+        self.x_min_value.setSizePolicy(sizePolicy)
+        self.x_min_value.setMinimumSize(QtCore.QSize(50, 0))
+        self.x_min_value.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.x_min_value.setObjectName("x_min_value")
+        self.horizontalLayout_x_min.addWidget(self.x_min_value)
+        self.verticalLayout_x.addLayout(self.horizontalLayout_x_min)
+        self.horizontalLayout_x_max = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_x_max.setObjectName("horizontalLayout_x_max")
+        self.x_max_label = QtWidgets.QLabel(parent=self.x_axis_frame)
+        self.x_max_label.setObjectName("x_max_label")
+        self.horizontalLayout_x_max.addWidget(self.x_max_label)
+        self.x_max_value = QtWidgets.QLineEdit(parent=self.x_axis_frame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(1)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.x_max_value.sizePolicy().hasHeightForWidth())
+        self.x_max_value.setSizePolicy(sizePolicy)
+        self.x_max_value.setMinimumSize(QtCore.QSize(50, 0))
+        self.x_max_value.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.x_max_value.setObjectName("x_max_value")
+        self.horizontalLayout_x_max.addWidget(self.x_max_value)
+        self.verticalLayout_x.addLayout(self.horizontalLayout_x_max)
+        self.horizontalLayout_x_mode = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_x_mode.setObjectName("horizontalLayout_x_mode")
+        self.x_auto_checkbox = QtWidgets.QCheckBox(parent=self.x_axis_frame)
+        self.x_auto_checkbox.setChecked(True)
+        self.x_auto_checkbox.setObjectName("x_auto_checkbox")
+        self.horizontalLayout_x_mode.addWidget(self.x_auto_checkbox)
+        self.verticalLayout_x.addLayout(self.horizontalLayout_x_mode)
+        self.horizontalLayout_axis_controls.addWidget(self.x_axis_frame)
+        self.bottom_container_layout.addWidget(self.secondary_plot_control_frame)
+        self.project_control_frame = QtWidgets.QFrame(parent=self.bottom_container)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(1)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.project_control_frame.sizePolicy().hasHeightForWidth())
+        self.project_control_frame.setSizePolicy(sizePolicy)
+        self.project_control_frame.setObjectName("project_control_frame")
+        self.gridLayout_4 = QtWidgets.QGridLayout(self.project_control_frame)
+        self.gridLayout_4.setObjectName("gridLayout_4")
+        self.subcon_label = QtWidgets.QLabel(parent=self.project_control_frame)
+        self.subcon_label.setObjectName("subcon_label")
+        self.gridLayout_4.addWidget(self.subcon_label, 0, 1, 1, 1)
+        self.quality_control_button = QtWidgets.QPushButton(parent=self.project_control_frame)
+        self.quality_control_button.setObjectName("quality_control_button")
+        self.gridLayout_4.addWidget(self.quality_control_button, 3, 4, 1, 1)
+        self.location_comment_value = QtWidgets.QLineEdit(parent=self.project_control_frame)
+        self.location_comment_value.setReadOnly(False)
+        self.location_comment_value.setObjectName("location_comment_value")
+        self.gridLayout_4.addWidget(self.location_comment_value, 1, 2, 1, 3)
+        self.comment_label = QtWidgets.QLabel(parent=self.project_control_frame)
+        self.comment_label.setObjectName("comment_label")
+        self.gridLayout_4.addWidget(self.comment_label, 0, 3, 1, 1)
+        self.sensor_string_label = QtWidgets.QLabel(parent=self.project_control_frame)
+        self.sensor_string_label.setObjectName("sensor_string_label")
+        self.gridLayout_4.addWidget(self.sensor_string_label, 2, 1, 1, 1)
+        self.location_subcon_spin = QtWidgets.QDoubleSpinBox(parent=self.project_control_frame)
+        self.location_subcon_spin.setMaximumSize(QtCore.QSize(200, 16777215))
+        self.location_subcon_spin.setReadOnly(False)
+        self.location_subcon_spin.setDecimals(1)
+        self.location_subcon_spin.setMinimum(0.0)
+        self.location_subcon_spin.setMaximum(1000000.0)
+        self.location_subcon_spin.setSingleStep(0.1)
+        self.location_subcon_spin.setObjectName("location_subcon_spin")
+        self.gridLayout_4.addWidget(self.location_subcon_spin, 1, 1, 1, 1)
+        self.location_sensorstring_value = QtWidgets.QLineEdit(parent=self.project_control_frame)
+        self.location_sensorstring_value.setMaximumSize(QtCore.QSize(200, 16777215))
+        self.location_sensorstring_value.setReadOnly(True)
+        self.location_sensorstring_value.setObjectName("location_sensorstring_value")
+        self.gridLayout_4.addWidget(self.location_sensorstring_value, 3, 1, 1, 1)
+        self.send_data_button = QtWidgets.QPushButton(parent=self.project_control_frame)
+        self.send_data_button.setObjectName("send_data_button")
+        self.gridLayout_4.addWidget(self.send_data_button, 3, 2, 1, 1)
+        self.request_status_button = QtWidgets.QPushButton(parent=self.project_control_frame)
+        self.request_status_button.setObjectName("request_status_button")
+        self.gridLayout_4.addWidget(self.request_status_button, 3, 3, 1, 1)
+        self.status_lineEdit = QtWidgets.QLineEdit(parent=self.project_control_frame)
+        self.status_lineEdit.setReadOnly(True)
+        self.status_lineEdit.setObjectName("status_lineEdit")
+        self.gridLayout_4.addWidget(self.status_lineEdit, 4, 1, 1, 4)
+        self.bottom_container_layout.addWidget(self.project_control_frame)
+        self.gridLayout_2.addWidget(self.bottom_container, 1, 0, 1, 2)
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QtWidgets.QMenuBar(parent=MainWindow)
+        self.menubar.setGeometry(QtCore.QRect(0, 0, 1374, 22))
+        self.menubar.setObjectName("menubar")
+        self.menu_File = QtWidgets.QMenu(parent=self.menubar)
+        self.menu_File.setObjectName("menu_File")
+        self.menu_Tools = QtWidgets.QMenu(parent=self.menubar)
+        self.menu_Tools.setObjectName("menu_Tools")
+        self.menuLanguage = QtWidgets.QMenu(parent=self.menu_Tools)
+        self.menuLanguage.setObjectName("menuLanguage")
+        self.menuSidebar = QtWidgets.QMenu(parent=self.menu_Tools)
+        self.menuSidebar.setObjectName("menuSidebar")
+        self.menuNTCs = QtWidgets.QMenu(parent=self.menu_Tools)
+        self.menuNTCs.setObjectName("menuNTCs")
+        self.menuProject = QtWidgets.QMenu(parent=self.menubar)
+        self.menuProject.setObjectName("menuProject")
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QtWidgets.QStatusBar(parent=MainWindow)
+        self.statusbar.setObjectName("statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+        self.open_action = QtGui.QAction(parent=MainWindow)
+        self.open_action.setObjectName("open_action")
+        self.info_action = QtGui.QAction(parent=MainWindow)
+        self.info_action.setObjectName("info_action")
+        self.exit_action = QtGui.QAction(parent=MainWindow)
+        self.exit_action.setObjectName("exit_action")
+        self.actionCreate_Project_File = QtGui.QAction(parent=MainWindow)
+        self.actionCreate_Project_File.setObjectName("actionCreate_Project_File")
+        self.actionOpen_Project_File = QtGui.QAction(parent=MainWindow)
+        self.actionOpen_Project_File.setObjectName("actionOpen_Project_File")
+        self.actionEdit_Project_Settings = QtGui.QAction(parent=MainWindow)
+        self.actionEdit_Project_Settings.setObjectName("actionEdit_Project_Settings")
+        self.actionShow_Processing_List = QtGui.QAction(parent=MainWindow)
+        self.actionShow_Processing_List.setObjectName("actionShow_Processing_List")
+        self.actionEnglish = QtGui.QAction(parent=MainWindow)
+        self.actionEnglish.setObjectName("actionEnglish")
+        self.actionGerman = QtGui.QAction(parent=MainWindow)
+        self.actionGerman.setObjectName("actionGerman")
+        self.actionToggle_Sidebar = QtGui.QAction(parent=MainWindow)
+        self.actionToggle_Sidebar.setObjectName("actionToggle_Sidebar")
+        self.actionSelect_all = QtGui.QAction(parent=MainWindow)
+        self.actionSelect_all.setObjectName("actionSelect_all")
+        self.actionDeselect_all = QtGui.QAction(parent=MainWindow)
+        self.actionDeselect_all.setObjectName("actionDeselect_all")
+        self.menu_File.addAction(self.open_action)
+        self.menu_File.addSeparator()
+        self.menu_File.addAction(self.info_action)
+        self.menu_File.addSeparator()
+        self.menu_File.addAction(self.exit_action)
+        self.menuLanguage.addSeparator()
+        self.menuLanguage.addAction(self.actionEnglish)
+        self.menuLanguage.addAction(self.actionGerman)
+        self.menuSidebar.addSeparator()
+        self.menuSidebar.addAction(self.actionToggle_Sidebar)
+        self.menuNTCs.addAction(self.actionSelect_all)
+        self.menuNTCs.addAction(self.actionDeselect_all)
+        self.menu_Tools.addAction(self.menuLanguage.menuAction())
+        self.menu_Tools.addSeparator()
+        self.menu_Tools.addAction(self.menuSidebar.menuAction())
+        self.menu_Tools.addSeparator()
+        self.menu_Tools.addAction(self.menuNTCs.menuAction())
+        self.menuProject.addAction(self.actionCreate_Project_File)
+        self.menuProject.addAction(self.actionOpen_Project_File)
+        self.menuProject.addAction(self.actionEdit_Project_Settings)
+        self.menuProject.addAction(self.actionShow_Processing_List)
+        self.menubar.addAction(self.menu_File.menuAction())
+        self.menubar.addAction(self.menuProject.menuAction())
+        self.menubar.addAction(self.menu_Tools.menuAction())
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "Temperature Analysis"))
+        self.centralwidget.setStyleSheet(_translate("MainWindow", "background-color: #3AAA35;"))
+        self.welcome_container.setStyleSheet(_translate("MainWindow", "background-color: white;"))
+        self.welcome_title_label.setText(_translate("MainWindow", "<h1 style=\"color: #495057; text-align: center;\">Welcome to FIELAX Wizard-2</h1>"))
+        self.welcome_subtitle_label.setText(_translate("MainWindow", "<p style=\"color: #6c757d; text-align: center; font-size: 14px;\">Temperature Data Analysis and Visualization</p>"))
+        self.welcome_instructions_label.setText(_translate("MainWindow", "<p style=\"color: #495057; text-align: center; font-size: 12px;\">Open a .TOB file via the <b>File</b> menu or load a project to get started.</p>"))
+        self.welcome_open_tob_button.setText(_translate("MainWindow", "Open TOB File"))
+        self.welcome_open_project_button.setText(_translate("MainWindow", "Open Project"))
+        self.plot_container.setStyleSheet(_translate("MainWindow", "background-color: white;"))
+        self.plot_info_container.setStyleSheet(_translate("MainWindow", "background-color: white;"))
+        self.cruise_info_label.setText(_translate("MainWindow", "Project: -"))
+        self.location_info_label.setText(_translate("MainWindow", "Location: -"))
+        self.ntc_checkbox_container.setStyleSheet(_translate("MainWindow", "background-color: white;"))
+        self.ntc_pt100_checkbox.setText(_translate("MainWindow", "PT100"))
+        self.pt100_style_label.setText(_translate("MainWindow", "●"))
+        self.ntc_22_checkbox.setText(_translate("MainWindow", "NTC22"))
+        self.ntc22_style_label.setText(_translate("MainWindow", "●"))
+        self.ntc_21_checkbox.setText(_translate("MainWindow", "NTC21"))
+        self.ntc21_style_label.setText(_translate("MainWindow", "●"))
+        self.ntc_20_checkbox.setText(_translate("MainWindow", "NTC20"))
+        self.ntc20_style_label.setText(_translate("MainWindow", "●"))
+        self.ntc_19_checkbox.setText(_translate("MainWindow", "NTC19"))
+        self.ntc19_style_label.setText(_translate("MainWindow", "●"))
+        self.ntc_18_checkbox.setText(_translate("MainWindow", "NTC18"))
+        self.ntc18_style_label.setText(_translate("MainWindow", "●"))
+        self.ntc_17_checkbox.setText(_translate("MainWindow", "NTC17"))
+        self.ntc17_style_label.setText(_translate("MainWindow", "●"))
+        self.ntc_16_checkbox.setText(_translate("MainWindow", "NTC16"))
+        self.ntc16_style_label.setText(_translate("MainWindow", "●"))
+        self.ntc_15_checkbox.setText(_translate("MainWindow", "NTC15"))
+        self.ntc15_style_label.setText(_translate("MainWindow", "●"))
+        self.ntc_14_checkbox.setText(_translate("MainWindow", "NTC14"))
+        self.ntc14_style_label.setText(_translate("MainWindow", "●"))
+        self.ntc_13_checkbox.setText(_translate("MainWindow", "NTC13"))
+        self.ntc13_style_label.setText(_translate("MainWindow", "●"))
+        self.ntc_12_checkbox.setText(_translate("MainWindow", "NTC12"))
+        self.ntc12_style_label.setText(_translate("MainWindow", "●"))
+        self.ntc_11_checkbox.setText(_translate("MainWindow", "NTC11"))
+        self.ntc11_style_label.setText(_translate("MainWindow", "●"))
+        self.ntc_10_checkbox.setText(_translate("MainWindow", "NTC10"))
+        self.ntc10_style_label.setText(_translate("MainWindow", "●"))
+        self.ntc_09_checkbox.setText(_translate("MainWindow", "NTC09"))
+        self.ntc09_style_label.setText(_translate("MainWindow", "●"))
+        self.ntc_08_checkbox.setText(_translate("MainWindow", "NTC08"))
+        self.ntc08_style_label.setText(_translate("MainWindow", "●"))
+        self.ntc_07_checkbox.setText(_translate("MainWindow", "NTC07"))
+        self.ntc07_style_label.setText(_translate("MainWindow", "●"))
+        self.ntc_06_checkbox.setText(_translate("MainWindow", "NTC06"))
+        self.ntc06_style_label.setText(_translate("MainWindow", "●"))
+        self.ntc_05_checkbox.setText(_translate("MainWindow", "NTC05"))
+        self.ntc05_style_label.setText(_translate("MainWindow", "●"))
+        self.ntc_04_checkbox.setText(_translate("MainWindow", "NTC04"))
+        self.ntc04_style_label.setText(_translate("MainWindow", "●"))
+        self.ntc_03_checkbox.setText(_translate("MainWindow", "NTC03"))
+        self.ntc03_style_label.setText(_translate("MainWindow", "●"))
+        self.ntc_02_checkbox.setText(_translate("MainWindow", "NTC02"))
+        self.ntc02_style_label.setText(_translate("MainWindow", "●"))
+        self.ntc_01_checkbox.setText(_translate("MainWindow", "NTC01"))
+        self.ntc01_style_label.setText(_translate("MainWindow", "●"))
+        self.sensor_string_image_label.setText(_translate("MainWindow", "Sensor String"))
+        self.bottom_container.setStyleSheet(_translate("MainWindow", "background-color: #3AAA35;"))
+        self.data_metrics_frame.setStyleSheet(_translate("MainWindow", "background-color: white;"))
+        self.mean_hp_power_label.setText(_translate("MainWindow", "Mean HP-Power [W]:"))
+        self.mean_hp_power_value.setText(_translate("MainWindow", "-"))
+        self.max_v_accu_label.setText(_translate("MainWindow", "Max Battery Voltage [V]:"))
+        self.max_v_accu_value.setText(_translate("MainWindow", "-"))
+        self.tilt_status_label.setText(_translate("MainWindow", "Tilt Stability [σ]:"))
+        self.tilt_status_value.setText(_translate("MainWindow", "-"))
+        self.mean_press_label.setText(_translate("MainWindow", "Mean Press [dbar]:"))
+        self.mean_press_value.setText(_translate("MainWindow", "-"))
+        self.secondary_plot_control_frame.setStyleSheet(_translate("MainWindow", "background-color: white;"))
+        self.y1_axis_label.setText(_translate("MainWindow", "Y1 Axis:"))
+        self.y1_min_label.setText(_translate("MainWindow", "Min:"))
+        self.y1_min_value.setText(_translate("MainWindow", "0"))
+        self.y1_max_label.setText(_translate("MainWindow", "Max:"))
+        self.y1_max_value.setText(_translate("MainWindow", "0"))
+        self.y1_auto_checkbox.setText(_translate("MainWindow", "Auto"))
+        self.y2_axis_label.setText(_translate("MainWindow", "Y2 Axis:"))
+        self.y2_min_label.setText(_translate("MainWindow", "Min:"))
+        self.y2_min_value.setText(_translate("MainWindow", "0"))
+        self.y2_max_label.setText(_translate("MainWindow", "Max:"))
+        self.y2_max_value.setText(_translate("MainWindow", "0"))
+        self.y2_auto_checkbox.setText(_translate("MainWindow", "Auto"))
+        self.x_axis_label.setText(_translate("MainWindow", "X Axis:"))
+        self.x_min_label.setText(_translate("MainWindow", "Min:"))
+        self.x_min_value.setText(_translate("MainWindow", "0"))
+        self.x_max_label.setText(_translate("MainWindow", "Max:"))
+        self.x_max_value.setText(_translate("MainWindow", "0"))
+        self.x_auto_checkbox.setText(_translate("MainWindow", "Auto"))
+        self.project_control_frame.setStyleSheet(_translate("MainWindow", "background-color: white;"))
+        self.subcon_label.setText(_translate("MainWindow", "Subcon Ext. (m)"))
+        self.quality_control_button.setText(_translate("MainWindow", "Quality Control"))
+        self.location_comment_value.setText(_translate("MainWindow", "-"))
+        self.comment_label.setText(_translate("MainWindow", "Comment"))
+        self.sensor_string_label.setText(_translate("MainWindow", "Sensor String"))
+        self.location_subcon_spin.setSuffix(_translate("MainWindow", " m"))
+        self.location_sensorstring_value.setText(_translate("MainWindow", "-"))
+        self.send_data_button.setText(_translate("MainWindow", "Send data"))
+        self.request_status_button.setText(_translate("MainWindow", "Request status"))
+        self.status_lineEdit.setPlaceholderText(_translate("MainWindow", "Status"))
+        self.menu_File.setTitle(_translate("MainWindow", "&File"))
+        self.menu_Tools.setTitle(_translate("MainWindow", "&Tools"))
+        self.menuLanguage.setTitle(_translate("MainWindow", "Language"))
+        self.menuSidebar.setTitle(_translate("MainWindow", "Sidebar"))
+        self.menuNTCs.setTitle(_translate("MainWindow", "NTCs"))
+        self.menuProject.setTitle(_translate("MainWindow", "Project"))
+        self.open_action.setText(_translate("MainWindow", "&Open..."))
+        self.info_action.setText(_translate("MainWindow", "Show Header &Info"))
+        self.exit_action.setText(_translate("MainWindow", "E&xit"))
+        self.actionCreate_Project_File.setText(_translate("MainWindow", "Create Project File"))
+        self.actionOpen_Project_File.setText(_translate("MainWindow", "Open Project File"))
+        self.actionEdit_Project_Settings.setText(_translate("MainWindow", "Edit Project Settings"))
+        self.actionShow_Processing_List.setText(_translate("MainWindow", "Show Processing List"))
+        self.actionEnglish.setText(_translate("MainWindow", "English"))
+        self.actionGerman.setText(_translate("MainWindow", "German"))
+        self.actionToggle_Sidebar.setText(_translate("MainWindow", "Toggle Sidebar"))
+        self.actionSelect_all.setText(_translate("MainWindow", "Select all"))
+        self.actionDeselect_all.setText(_translate("MainWindow", "Deselect all"))
@@ -197,6 +197,35 @@ class TestAxisUIService:
             {"x_auto": False}
         )
 
+    def test_handle_x_axis_unit_changed_manual(self):
+        """Test X unit change in manual mode refreshes all fields from the plot."""
+        service = AxisUIService()
+        main_window = MagicMock()
+
+        # Mock plot widget limits, already in the new display unit
+        main_window.plot_widget = MagicMock()
+        main_window.plot_widget.ax1.get_xlim.return_value = (2.0, 8.0)
+        main_window.plot_widget.ax1.get_ylim.return_value = (10.0, 50.0)
+        main_window.plot_widget.ax2 = None
+
+        # Mock UI elements
+        main_window.x_min_value = MagicMock(spec=QLineEdit)
+        main_window.x_max_value = MagicMock(spec=QLineEdit)
+        main_window.y1_min_value = MagicMock(spec=QLineEdit)
+        main_window.y1_max_value = MagicMock(spec=QLineEdit)
+        main_window.x_auto_checkbox = MagicMock(spec=QCheckBox)
+        main_window.x_auto_checkbox.isChecked.return_value = False
+
+        service.handle_x_axis_unit_changed(main_window, False)
+
+        # X and Y fields follow the plot and X controls stay editable
+        main_window.x_min_value.setText.assert_called_with("2.00")
+        main_window.x_max_value.setText.assert_called_with("8.00")
+        main_window.y1_min_value.setText.assert_called_with("10.00")
+        main_window.y1_max_value.setText.assert_called_with("50.00")
+        main_window.x_min_value.setEnabled.assert_called_with(True)
+        main_window.controller.get_time_range.assert_not_called()
+
     def test_handle_axis_limits_changed_auto_mode(self):
         """Test limits change when auto mode is enabled - should be ignored."""
         service = AxisUIService()
@@ -116,6 +116,21 @@ class TestDataService:
         assert "tilt_status" in result
         assert "mean_press" in result
 
+    def test_calculate_metrics_public(self, sample_tob_data):
+        """Test the public metrics entry point used by the metrics worker."""
+        service = DataService()
+
+        mock_model = MagicMock(spec=TOBDataModel)
+        mock_model.data = pd.DataFrame(sample_tob_data)
+
+        with patch.object(
+            service, "_calculate_metrics", return_value={"mean_press": 1.0}
+        ) as mock_calculate:
+            result = service.calculate_metrics(mock_model)
+
+        assert result == {"mean_press": 1.0}
+        mock_calculate.assert_called_once_with(mock_model)
+
     def test_filter_sensor_data(self, sample_tob_data):
         """Test sensor data filtering."""
         service = DataService()
@@ -174,6 +189,27 @@ class TestDataService:
         mock_widget1.setText.assert_called_with("100.0")
         mock_widget2.setText.assert_called_with("50.0")
 
+    def test_update_data_metrics_skips_unchanged_text(self):
+        """Test data metrics update leaves widgets already showing the value."""
+        service = DataService()
+
+        mock_widget1 = MagicMock()
+        mock_widget1.text.return_value = "100.0"
+        mock_widget2 = MagicMock()
+        mock_widget2.text.return_value = "-"
+
+        metrics_widgets = {
+            "mean_hp_power_value": mock_widget1,
+            "max_v_accu_value": mock_widget2,
+        }
+
+        service.update_data_metrics(
+            metrics_widgets, {"mean_hp_power": 100.0, "max_v_accu": 50.0}
+        )
+
+        mock_widget1.setText.assert_not_called()
+        mock_widget2.setText.assert_called_once_with("50.0")
+
     def test_update_data_metrics_missing_widgets(self):
         """Test data metrics update with missing widgets."""
         service = DataService()
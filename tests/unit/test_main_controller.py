@@ -344,3 +344,14 @@ def test_on_file_opened_handles_error(controller_setup):
         controller._on_file_opened("broken.tob")
     except RuntimeError:  # pragma: no cover
         pytest.fail("_on_file_opened should handle loader exceptions internally")
+
+
+def test_apply_x_axis_change_refreshes_plot_once(controller_setup):
+    controller, window, _, _ = controller_setup
+    window.plot_widget.update_axis_settings.reset_mock()
+
+    controller.apply_x_axis_change("Minutes")
+
+    window.plot_widget.update_axis_settings.assert_called_once_with(
+        {"x_axis_type": "Minutes"}
+    )
@@ -0,0 +1,20 @@
+"""
+Unit tests for PlotStyleService
+
+Tests the fixed sensor styles.
+"""
+
+import pytest
+
+from src.services.plot_style_service import PlotStyleService
+
+
+@pytest.mark.unit
+class TestPlotStyleService:
+    """Test cases for PlotStyleService class."""
+
+    def test_fixed_styles(self):
+        """Test that sensors get their predefined style."""
+        service = PlotStyleService()
+
+        assert service.get_sensor_style("Temp")["color"] == "#FFFF00"
@@ -1,9 +1,11 @@
 """Test cases for ProjectModel TOB file management features."""
 
+from unittest.mock import patch
+
 import pandas as pd
 import pytest
 
-from src.models.project_model import ProjectModel
+from src.models.project_model import ProjectModel, TOBFileData
 
 
 @pytest.mark.unit
@@ -317,6 +319,24 @@ class TestProjectModelTOB:
         assert "modified_date" in summary
         assert "memory_usage_mb" in summary
 
+    def test_tob_file_data_memory_is_measured_once(self):
+        """Test that TOB data memory usage is cached per DataFrame."""
+        data = pd.DataFrame({"time": [1, 2, 3], "NTC01": [20.1, 20.5, 21.0]})
+        tob_data = TOBFileData(data=data)
+
+        expected_mb = data.memory_usage(deep=True).sum() / (1024 * 1024)
+        assert tob_data.get_memory_mb() == pytest.approx(expected_mb)
+
+        with patch.object(pd.DataFrame, "memory_usage") as mock_memory_usage:
+            assert tob_data.get_memory_mb() == pytest.approx(expected_mb)
+        mock_memory_usage.assert_not_called()
+
+        # Replacing the DataFrame measures the new one
+        tob_data.data = pd.DataFrame({"time": range(100)})
+        assert tob_data.get_memory_mb() > expected_mb
+
+        assert TOBFileData().get_memory_mb() == 0.0
+
     def test_create_rollback_transaction(self):
         """Test creating rollback transaction."""
         project = ProjectModel(name="Test Project")
@@ -32,6 +32,19 @@ class TestUIService:
         assert font.family() == "Arial"
         assert font.pointSize() == 11
 
+    def test_get_platform_font_is_built_once(self):
+        """Test that the platform font is cached and handed out as copies."""
+        service = UIService()
+        first = service._get_platform_font()
+        first.setPointSize(20)
+
+        with patch("src.services.ui_service.QFont.setFamily") as mock_set_family:
+            second = service._get_platform_font()
+
+        mock_set_family.assert_not_called()
+        assert second.pointSize() == 11
+
+    @patch.dict("os.environ", {"WIZARD_DEBUG_UI": "1"})
     @patch("src.services.ui_service.QLabel")
     @patch("src.services.ui_service.QCheckBox")
     @patch("src.services.ui_service.QPushButton")
@@ -64,6 +77,16 @@ class TestUIService:
         mock_button.return_value.setVisible.assert_called_with(True)
         mock_line_edit.return_value.setVisible.assert_called_with(True)
 
+    @patch.dict("os.environ", clear=True)
+    def test_fix_ui_visibility_skipped_without_debug_flag(self):
+        """Test that the visibility pass only runs with WIZARD_DEBUG_UI set."""
+        mock_widget = MagicMock(spec=QWidget)
+
+        service = UIService()
+        service.fix_ui_visibility(mock_widget)
+
+        mock_widget.findChildren.assert_not_called()
+
     def test_setup_axis_controls(self):
         """Test axis controls setup."""
         import os